@@ -0,0 +1,30 @@
+"""add listing indexes
+
+Revision ID: 3f1c9a7d2b84
+Revises: 67ab67afaa3c
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a7d2b84'
+down_revision: Union[str, Sequence[str], None] = '67ab67afaa3c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_branches_repository_id_last_indexed_at', 'branches', ['repository_id', 'last_indexed_at'], unique=False)
+    op.create_index('ix_notifications_repository_id_status', 'notifications', ['repository_id', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_notifications_repository_id_status', table_name='notifications')
+    op.drop_index('ix_branches_repository_id_last_indexed_at', table_name='branches')
@@ -72,6 +72,40 @@ class Settings(BaseSettings):
         default="grepzilla",
         description="Prefix for Meilisearch index names",
     )
+    meilisearch_batch_size: int = Field(
+        default=5000,
+        ge=1,
+        le=100000,
+        description="Documents per Meilisearch add-documents request",
+    )
+    meilisearch_chunk_batch_docs: int = Field(
+        default=1000,
+        ge=1,
+        le=100000,
+        description="Most chunk documents per add-documents request",
+    )
+    meilisearch_chunk_batch_bytes: int = Field(
+        default=10 * 1024 * 1024,
+        ge=64 * 1024,
+        le=100 * 1024 * 1024,
+        description="Estimated payload bytes at which a chunk batch is sent early",
+    )
+    meilisearch_write_concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="Maximum concurrent Meilisearch write requests",
+    )
+    meilisearch_encode_processes: int = Field(
+        default=0,
+        ge=0,
+        le=64,
+        description="Worker processes that encode chunk batches for async index writes (0 to encode in the event loop)",
+    )
+    meilisearch_request_compression: Literal["none", "gzip"] = Field(
+        default="none",
+        description="Content-Encoding for add-documents request bodies ('gzip' pays off on slow links to a remote server)",
+    )
 
     # Redis (for Celery broker)
     redis_url: str = Field(
@@ -106,6 +140,30 @@ class Settings(BaseSettings):
         default=None,
         description="Shallow clone depth (None for full clone)",
     )
+    git_partial_clone: bool = Field(
+        default=True,
+        description="Use a blobless partial clone (--filter=blob:none) for full-history clones",
+    )
+    git_recurse_submodules: bool = Field(
+        default=False,
+        description="Clone and update git submodules along with the repository",
+    )
+    git_submodule_jobs: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Number of submodules to fetch in parallel",
+    )
+    git_parallel_jobs: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Maximum number of repositories cloned or updated concurrently",
+    )
+    git_object_cache_dir: str | None = Field(
+        default=None,
+        description="Directory for shared per-host object caches used as clone references (None to disable)",
+    )
 
     # JWT Authentication
     jwt_secret_key: SecretStr = Field(
@@ -120,6 +178,12 @@ class Settings(BaseSettings):
     api_port: int = 8000
     api_reload: bool = False
     api_workers: int = Field(default=1, ge=1)
+    listing_cache_ttl_seconds: float = Field(
+        default=10.0,
+        ge=0.0,
+        le=300.0,
+        description="Seconds a repository listing is served from the in-process cache (0 to disable)",
+    )
 
     # LLM Settings (OpenAI-compatible API)
     llm_api_base_url: str = Field(
@@ -152,6 +216,10 @@ class Settings(BaseSettings):
         le=300,
         description="Timeout in seconds for LLM API calls",
     )
+    llm_provider: Literal["openai", "litellm"] = Field(
+        default="openai",
+        description="Agent model backend: 'openai' for OpenAI-compatible APIs, 'litellm' for other providers",
+    )
 
     # Agent Mode Settings (OpenAI Agents SDK)
     agent_model: str = Field(
@@ -188,6 +256,16 @@ class Settings(BaseSettings):
         le=2048,
         description="Batch size for embedding requests",
     )
+    embedding_max_concurrency: int = Field(
+        default=5,
+        ge=1,
+        le=64,
+        description="Maximum embedding requests in flight during ingestion",
+    )
+    embedding_quantization: Literal["none", "int8"] = Field(
+        default="none",
+        description="Hold and send embeddings as float32 ('none') or int8 with a per-vector scale ('int8')",
+    )
     embedding_enabled: bool = Field(
         default=True,
         description="Enable embedding generation (disable for text-only search)",
@@ -214,6 +292,12 @@ class Settings(BaseSettings):
         default=True,
         description="Include split context information in code chunks",
     )
+    chunk_cache_size: int = Field(
+        default=1024,
+        ge=0,
+        le=100000,
+        description="Files whose chunker output is cached by content hash per ingestion process (0 to disable)",
+    )
 
     @property
     def effective_embedding_api_base_url(self) -> str:
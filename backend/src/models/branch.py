@@ -4,7 +4,16 @@ import uuid
 from datetime import datetime
 from enum import StrEnum
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Integer, String, func
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    func,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -24,6 +33,14 @@ class Branch(Base):
     """Branch model representing a Git branch within a repository."""
 
     __tablename__ = "branches"
+    __table_args__ = (
+        # Latest index time per repository in the listing query
+        Index(
+            "ix_branches_repository_id_last_indexed_at",
+            "repository_id",
+            "last_indexed_at",
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -5,7 +5,7 @@ from datetime import datetime
 from enum import StrEnum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String, func
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -37,6 +37,10 @@ class Notification(Base):
     """Notification model representing webhook or scheduled ingestion events."""
 
     __tablename__ = "notifications"
+    __table_args__ = (
+        # Pending-backlog counts per repository in the listing query
+        Index("ix_notifications_repository_id_status", "repository_id", "status"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -98,4 +102,6 @@ class Notification(Base):
     )
 
     def __repr__(self) -> str:
-        return f"<Notification(id={self.id}, source={self.source}, status={self.status})>"
+        return (
+            f"<Notification(id={self.id}, source={self.source}, status={self.status})>"
+        )
@@ -2,22 +2,57 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
 from typing import TYPE_CHECKING, Any
 
-from agents import Agent, ModelSettings, Runner, function_tool
-from agents.run import RunResult
-
 from backend.src.config.logging import get_logger
 from backend.src.config.settings import get_settings
 from backend.src.services.search.search_pipeline import SearchPipeline, SearchResult
 
 if TYPE_CHECKING:
-    from agents.extensions.models.litellm_model import LitellmModel
+    from agents import Agent
+    from agents.models.interface import Model
+    from agents.run import RunResult
+
+# The Agents SDK pulls in openai, LiteLLM and tiktoken. Its imports are kept
+# inside the functions that need them so importing this module (e.g. from
+# Celery workers that never run agents) stays cheap.
 
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=128)
+def _get_pipeline(
+    repository_ids: tuple[str, ...],
+    branch_overrides: tuple[tuple[str, str], ...],
+) -> SearchPipeline:
+    """Get a cached search pipeline for a repository scope.
+
+    Re-indexing never makes a cached pipeline stale. A pipeline holds only
+    its scope and the process-wide feature flags, and every search queries
+    Meilisearch live. Indexing runs in Celery workers, so a hook there
+    could not reach this API-process cache anyway.
+
+    Args:
+        repository_ids: Sorted tuple of repository IDs to search.
+        branch_overrides: Sorted tuple of (repo_id, branch_id) overrides.
+
+    Returns:
+        SearchPipeline instance shared by all tool calls with the same scope.
+    """
+    return SearchPipeline(
+        repository_ids=list(repository_ids),
+        branch_overrides=dict(branch_overrides),
+    )
+
+
+def reset_search_pipeline_cache() -> None:
+    """Clear cached search pipelines (for tests; indexing does not need it)."""
+    _get_pipeline.cache_clear()
+
+
 def create_search_tool(
     repository_ids: list[str],
     branch_overrides: dict[str, str],
@@ -31,9 +66,15 @@ def create_search_tool(
     Returns:
         A function_tool-decorated search function.
     """
+    from agents import function_tool
+
+    pipeline_key = (
+        tuple(sorted(repository_ids)),
+        tuple(sorted(branch_overrides.items())),
+    )
 
     @function_tool
-    def search_codebase(query: str) -> list[dict[str, Any]]:
+    async def search_codebase(query: str) -> str:
         """Search the codebase for relevant code snippets.
 
         Use this tool to find code, documentation, and configuration files
@@ -43,30 +84,35 @@ def create_search_tool(
             query: Natural language search query describing what to find.
 
         Returns:
-            List of code snippets with file paths, line numbers, and content.
+            JSON list of code snippets with file paths, line numbers, and content.
         """
-        pipeline = SearchPipeline(
-            repository_ids=repository_ids,
-            branch_overrides=branch_overrides,
+        pipeline = _get_pipeline(*pipeline_key)
+
+        # The pipeline uses the blocking Meilisearch client; run it on the
+        # default executor so concurrent agent turns keep the loop free.
+        results = await asyncio.to_thread(pipeline.search_with_context, query)
+
+        # Serialize here: the SDK passes string outputs through untouched,
+        # whereas other return values are str()-ed into a Python repr that
+        # extract_citations_from_result can't parse back.
+        return json.dumps(
+            [
+                {
+                    "path": r.path,
+                    "repository": r.repository_id,
+                    "branch": r.branch_id,
+                    "line_start": r.line_start,
+                    "line_end": r.line_end,
+                    "language": r.language,
+                    "content": r.content,
+                    "score": r.score,
+                }
+                for r in results
+            ],
+            ensure_ascii=False,
+            separators=(",", ":"),
         )
 
-        results = pipeline.search_with_context(query)
-
-        # Convert to serializable format for the agent
-        return [
-            {
-                "path": r.path,
-                "repository": r.repository_id,
-                "branch": r.branch_id,
-                "line_start": r.line_start,
-                "line_end": r.line_end,
-                "language": r.language,
-                "content": r.content,
-                "score": r.score,
-            }
-            for r in results
-        ]
-
     return search_codebase
 
 
@@ -102,27 +148,46 @@ class AgentClient:
         else:
             self.api_key = None
 
-        # Create LitellmModel for provider-agnostic LLM access
-        # Import lazily to avoid heavy initialization at module load time
-        # (which can cause issues with Celery worker fork pools)
-        from agents.extensions.models.litellm_model import LitellmModel
+        self.provider = settings.llm_provider
 
-        # For OpenAI-compatible APIs with custom base_url, we use openai/ prefix.
-        # LiteLLM requires an API key even for local APIs, so we provide a
-        # placeholder when none is configured (e.g., for Ollama).
+        # Models are imported lazily to avoid heavy initialization at module
+        # load time (which can cause issues with Celery worker fork pools).
+        # Local servers accept any key, but the clients require one, so we
+        # provide a placeholder when none is configured (e.g., for Ollama).
         effective_api_key = self.api_key if self.api_key else "not-needed"
 
-        self.model = LitellmModel(
-            model=f"openai/{self.model_name}",
-            api_key=effective_api_key,
-            base_url=self.base_url,
-        )
+        if self.provider == "litellm":
+            from agents.extensions.models.litellm_model import LitellmModel
+
+            # For OpenAI-compatible APIs with custom base_url, we use openai/ prefix.
+            self.model: Model = LitellmModel(
+                model=f"openai/{self.model_name}",
+                api_key=effective_api_key,
+                base_url=self.base_url,
+            )
+        else:
+            # Talk to the OpenAI-compatible endpoint directly. The AsyncOpenAI
+            # client keeps one pooled httpx connection set for the lifetime of
+            # this (singleton) client instead of LiteLLM's per-call stack.
+            from agents import OpenAIChatCompletionsModel
+            from openai import AsyncOpenAI
+
+            self._openai_client = AsyncOpenAI(
+                base_url=self.base_url,
+                api_key=effective_api_key,
+                timeout=settings.llm_timeout,
+            )
+            self.model = OpenAIChatCompletionsModel(
+                model=self.model_name,
+                openai_client=self._openai_client,
+            )
 
         logger.info(
             "Agent client initialized",
             model=self.model_name,
             max_turns=self.max_turns,
             base_url=self.base_url,
+            provider=self.provider,
         )
 
     def _build_system_instructions(self) -> str:
@@ -154,27 +219,27 @@ When answering:
 - Always answer with markdown formatting
 - Always include a 'Citations' section listing all referenced code snippets with paths and line numbers"""
 
-    async def run_agent(
+    def _build_agent(
         self,
-        query: str,
         repository_ids: list[str],
         branch_overrides: dict[str, str],
-    ) -> RunResult:
-        """Run the agent to answer a query.
+    ) -> Agent:
+        """Build the code analysis agent for a repository scope.
 
         Args:
-            query: User's question about the codebase.
             repository_ids: List of repository IDs to search.
             branch_overrides: Map of repo_id -> branch_id overrides.
 
         Returns:
-            RunResult containing the agent's response and execution details.
+            Agent with a search tool bound to the given scope.
         """
+        from agents import Agent, ModelSettings
+
         # Create search tool bound to this query's repository context
         search_tool = create_search_tool(repository_ids, branch_overrides)
 
-        # Create agent with search tool and LiteLLM model for provider-agnostic access
-        agent = Agent(
+        # Create agent with search tool and the configured model backend
+        return Agent(
             name="CodeAnalyst",
             instructions=self._build_system_instructions(),
             model=self.model,
@@ -182,6 +247,26 @@ When answering:
             tools=[search_tool],
         )
 
+    async def run_agent(
+        self,
+        query: str,
+        repository_ids: list[str],
+        branch_overrides: dict[str, str],
+    ) -> RunResult:
+        """Run the agent to answer a query.
+
+        Args:
+            query: User's question about the codebase.
+            repository_ids: List of repository IDs to search.
+            branch_overrides: Map of repo_id -> branch_id overrides.
+
+        Returns:
+            RunResult containing the agent's response and execution details.
+        """
+        from agents import Runner
+
+        agent = self._build_agent(repository_ids, branch_overrides)
+
         logger.debug(
             "Running agent",
             query=query[:100],
@@ -202,6 +287,57 @@ When answering:
 
         return result
 
+    async def run_agent_batch(
+        self,
+        queries: list[str],
+        repository_ids: list[str],
+        branch_overrides: dict[str, str],
+        *,
+        max_concurrency: int = 8,
+    ) -> list[RunResult]:
+        """Run the agent for several independent queries over one scope.
+
+        The agent is built once and shared by all runs; a semaphore bounds
+        how many runs talk to the model provider at the same time.
+
+        Args:
+            queries: User questions about the codebase.
+            repository_ids: List of repository IDs to search.
+            branch_overrides: Map of repo_id -> branch_id overrides.
+            max_concurrency: Maximum number of agent runs in flight.
+
+        Returns:
+            RunResults in the same order as the input queries.
+        """
+        if not queries:
+            return []
+
+        from agents import Runner
+
+        agent = self._build_agent(repository_ids, branch_overrides)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _run(query: str) -> RunResult:
+            async with semaphore:
+                return await Runner.run(
+                    agent,
+                    input=query,
+                    max_turns=self.max_turns,
+                )
+
+        logger.debug(
+            "Running agent batch",
+            query_count=len(queries),
+            repository_count=len(repository_ids),
+            max_concurrency=max_concurrency,
+        )
+
+        results = await asyncio.gather(*(_run(query) for query in queries))
+
+        logger.debug("Agent batch completed", query_count=len(results))
+
+        return list(results)
+
     def extract_citations_from_result(
         self,
         result: RunResult[str],
@@ -220,43 +356,55 @@ When answering:
         citations: list[SearchResult] = []
         seen_keys: set[tuple[str, str, str, int, int]] = set()
 
-        # Iterate through the run's raw responses to find tool outputs
+        # Iterate through the run's raw responses to find tool outputs.
+        # getattr with a default plus exact type checks is much cheaper than
+        # hasattr + isinstance on long traces.
+        list_t = list
+        str_t = str
         for item in result.raw_responses:
-            # Check if this response contains tool call results
-            if hasattr(item, "output") and isinstance(item.output, list):
-                for output_item in item.output:
-                    if hasattr(output_item, "output") and isinstance(
-                        output_item.output, str
-                    ):
-                        # Try to parse as search results
-                        try:
-                            search_data = json.loads(output_item.output)
-                            if isinstance(search_data, list):
-                                for hit in search_data:
-                                    key = (
-                                        hit.get("repository", ""),
-                                        hit.get("branch", ""),
-                                        hit.get("path", ""),
-                                        hit.get("line_start", 0),
-                                        hit.get("line_end", 0),
-                                    )
-                                    if key not in seen_keys:
-                                        seen_keys.add(key)
-                                        citations.append(
-                                            SearchResult(
-                                                chunk_id="",
-                                                content=hit.get("content", ""),
-                                                path=hit.get("path", ""),
-                                                repository_id=hit.get("repository", ""),
-                                                branch_id=hit.get("branch", ""),
-                                                line_start=hit.get("line_start", 1),
-                                                line_end=hit.get("line_end", 1),
-                                                language=hit.get("language"),
-                                                score=hit.get("score", 0.0),
-                                            )
-                                        )
-                        except (json.JSONDecodeError, TypeError):
-                            continue
+            outputs = getattr(item, "output", None)
+            if type(outputs) is not list_t:
+                continue
+            for output_item in outputs:
+                raw = getattr(output_item, "output", None)
+                if type(raw) is not str_t:
+                    continue
+
+                # Try to parse as search results
+                try:
+                    search_data = json.loads(raw)
+                except (json.JSONDecodeError, TypeError):
+                    continue
+                if type(search_data) is not list_t:
+                    continue
+
+                for hit in search_data:
+                    try:
+                        key = (
+                            hit.get("repository", ""),
+                            hit.get("branch", ""),
+                            hit.get("path", ""),
+                            hit.get("line_start", 0),
+                            hit.get("line_end", 0),
+                        )
+                    except AttributeError:
+                        break
+                    if key in seen_keys:
+                        continue
+                    seen_keys.add(key)
+                    citations.append(
+                        SearchResult(
+                            chunk_id="",
+                            content=hit.get("content", ""),
+                            path=key[2],
+                            repository_id=key[0],
+                            branch_id=key[1],
+                            line_start=hit.get("line_start", 1),
+                            line_end=hit.get("line_end", 1),
+                            language=hit.get("language"),
+                            score=hit.get("score", 0.0),
+                        )
+                    )
 
         return citations
 
@@ -65,6 +65,11 @@ class EmbeddingClient:
 
         self.enabled = settings.embedding_enabled
 
+        # Request headers are fixed for the client's lifetime; build them once
+        self._headers: dict[str, str] = {"Content-Type": "application/json"}
+        if self.api_key:
+            self._headers["Authorization"] = f"Bearer {self.api_key}"
+
         logger.info(
             "Embedding client initialized",
             base_url=self.base_url,
@@ -74,15 +79,6 @@ class EmbeddingClient:
             enabled=self.enabled,
         )
 
-    def _get_headers(self) -> dict[str, str]:
-        """Get request headers."""
-        headers = {
-            "Content-Type": "application/json",
-        }
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-        return headers
-
     async def embed(
         self,
         texts: list[str],
@@ -132,19 +128,19 @@ class EmbeddingClient:
             text_count=len(texts),
         )
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                url,
-                headers=self._get_headers(),
-                json=payload,
-            )
+        async with httpx.AsyncClient(
+            timeout=self.timeout, headers=self._headers
+        ) as client:
+            response = await client.post(url, json=payload)
             response.raise_for_status()
             data = response.json()
 
-        # Parse response - embeddings are returned in order
-        embeddings = [
-            item["embedding"] for item in sorted(data["data"], key=lambda x: x["index"])
-        ]
+        # Parse response - scatter by index rather than sorting, since
+        # providers usually (but not always) return items in input order
+        items = data["data"]
+        embeddings: list[list[float]] = [[] for _ in items]
+        for item in items:
+            embeddings[item["index"]] = item["embedding"]
         usage = data.get("usage", {})
 
         result = EmbeddingResult(
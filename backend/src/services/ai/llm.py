@@ -74,6 +74,11 @@ class LLMClient:
         else:
             self.api_key = None
 
+        # Request headers are fixed for the client's lifetime; build them once
+        self._headers: dict[str, str] = {"Content-Type": "application/json"}
+        if self.api_key:
+            self._headers["Authorization"] = f"Bearer {self.api_key}"
+
         logger.info(
             "LLM client initialized",
             base_url=self.base_url,
@@ -82,15 +87,6 @@ class LLMClient:
             temperature=self.temperature,
         )
 
-    def _get_headers(self) -> dict[str, str]:
-        """Get request headers."""
-        headers = {
-            "Content-Type": "application/json",
-        }
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-        return headers
-
     async def chat_completion(
         self,
         messages: list[ChatMessage],
@@ -127,12 +123,10 @@ class LLMClient:
             message_count=len(messages),
         )
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                url,
-                headers=self._get_headers(),
-                json=payload,
-            )
+        async with httpx.AsyncClient(
+            timeout=self.timeout, headers=self._headers
+        ) as client:
+            response = await client.post(url, json=payload)
             response.raise_for_status()
             data = response.json()
 
@@ -200,8 +194,8 @@ class LLMClient:
         try:
             # Try to list models (common endpoint)
             url = f"{self.base_url}/models"
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(url, headers=self._get_headers())
+            async with httpx.AsyncClient(timeout=10, headers=self._headers) as client:
+                response = await client.get(url)
                 return response.status_code == 200
         except Exception as e:
             logger.warning("LLM health check failed", error=str(e))
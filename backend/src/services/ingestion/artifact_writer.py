@@ -1,13 +1,20 @@
 """Artifact writer for persisting file metadata to DB and Meilisearch."""
 
+import asyncio
+import hashlib
 import uuid
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
-from sqlalchemy import select
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import Select, delete, select, update
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.orm import Session
 
 from backend.src.config.logging import get_logger
+from backend.src.config.settings import get_settings
 from backend.src.db.session import get_session_context, get_sync_session_context
 from backend.src.models.artifact import Artifact, FileType, ParseStatus
 from backend.src.services.ingestion.file_filters import (
@@ -18,11 +25,24 @@ from backend.src.services.ingestion.file_filters import (
 from backend.src.services.search.index_client import (
     ARTIFACTS_INDEX,
     MeilisearchClient,
+    branch_filter,
     get_meilisearch_client,
 )
 
 logger = get_logger(__name__)
 
+# PostgreSQL's wire protocol allows at most 65535 bind parameters per statement
+PG_MAX_BIND_PARAMS = 65535
+
+# Upper bound on rows per INSERT ... ON CONFLICT statement
+UPSERT_CHUNK_SIZE = 2000
+
+# Maximum number of paths bound into a single UPDATE ... WHERE path IN (...)
+MARK_PARSED_CHUNK_SIZE = 1000
+
+# Maximum number of paths bound into a single unchanged-artifact lookup
+UNCHANGED_LOOKUP_CHUNK_SIZE = 1000
+
 
 @dataclass
 class ArtifactDocument:
@@ -44,45 +64,224 @@ class ArtifactWriteResult:
 
     artifacts_written: int = 0
     artifacts_failed: int = 0
+    artifacts_unchanged: int = 0
     db_upserted: int = 0
     meilisearch_indexed: int = 0
     errors: list[str] = field(default_factory=list)
 
 
-def _file_category_to_file_type(category: FileCategory) -> FileType:
-    """Convert FileCategory to FileType enum.
+# uuid5 hashes the namespace bytes followed by the name; cache the prefix
+_NAMESPACE_DNS_BYTES = uuid.NAMESPACE_DNS.bytes
+
+# FileCategory -> FileType for DB storage
+_FILE_TYPE_BY_CATEGORY: dict[FileCategory, FileType] = {
+    FileCategory.CODE: FileType.CODE,
+    FileCategory.DOCUMENTATION: FileType.DOC,
+    FileCategory.CONFIGURATION: FileType.CONFIG,
+    FileCategory.BINARY: FileType.BINARY,
+    FileCategory.UNKNOWN: FileType.OTHER,
+}
+
+# IndexAction -> ParseStatus for DB storage
+_PARSE_STATUS_BY_ACTION: dict[IndexAction, ParseStatus] = {
+    IndexAction.FULL_INDEX: ParseStatus.PARSED,
+    IndexAction.CATALOG_ONLY: ParseStatus.SKIPPED,
+    IndexAction.SKIP: ParseStatus.SKIPPED,
+}
+
+
+def _build_records(
+    files: list[FileInfo],
+    repo_uuid: uuid.UUID,
+    branch_uuid: uuid.UUID,
+    repository_id: str,
+    branch_id: str,
+    commit_sha: str | None,
+    indexed_at: datetime,
+    mark_as_parsed: bool,
+) -> tuple[list[dict], list[dict]]:
+    """Build DB records and Meilisearch documents for discovered files.
 
     Args:
-        category: File category from filtering.
+        files: List of FileInfo from discovery.
+        repo_uuid: Parsed repository UUID.
+        branch_uuid: Parsed branch UUID.
+        repository_id: Repository UUID string.
+        branch_id: Branch UUID string.
+        commit_sha: Optional commit SHA for last_seen_commit.
+        indexed_at: Timestamp for this write.
+        mark_as_parsed: If True, mark FULL_INDEX files as parsed.
 
     Returns:
-        Corresponding FileType for DB storage.
+        Tuple of (db_records, meilisearch_docs), aligned by position.
     """
-    mapping = {
-        FileCategory.CODE: FileType.CODE,
-        FileCategory.DOCUMENTATION: FileType.DOC,
-        FileCategory.CONFIGURATION: FileType.CONFIG,
-        FileCategory.BINARY: FileType.BINARY,
-        FileCategory.UNKNOWN: FileType.OTHER,
-    }
-    return mapping.get(category, FileType.OTHER)
+    db_records: list[dict] = []
+    meilisearch_docs: list[dict] = []
+
+    # Local bindings for names used on every iteration
+    sha1 = hashlib.sha1
+    make_uuid = uuid.UUID
+    full_index = IndexAction.FULL_INDEX
+    parsed = ParseStatus.PARSED
+    file_types = _FILE_TYPE_BY_CATEGORY
+    parse_statuses = _PARSE_STATUS_BY_ACTION
+    add_record = db_records.append
+    add_doc = meilisearch_docs.append
+    id_prefix = _NAMESPACE_DNS_BYTES + f"{repository_id}:{branch_id}:".encode()
+    indexed_at_iso = indexed_at.isoformat()
+
+    for file_info in files:
+        path = file_info.relative_path
+        is_full_index = file_info.action == full_index
+        file_type = file_types.get(file_info.category, FileType.OTHER)
+        parse_status = parse_statuses.get(file_info.action, ParseStatus.SKIPPED)
+
+        # If mark_as_parsed is True and the file was fully indexed, mark as parsed
+        if mark_as_parsed and is_full_index:
+            parse_status = parsed
+
+        # Deterministic ID based on repo + branch + path. Byte-for-byte the
+        # same as uuid5(NAMESPACE_DNS, ...), with the SHA-1 digest and the
+        # version/variant bits done inline instead of through uuid5().
+        digest = bytearray(
+            sha1(id_prefix + path.encode(), usedforsecurity=False).digest()[:16]
+        )
+        digest[6] = (digest[6] & 0x0F) | 0x50
+        digest[8] = (digest[8] & 0x3F) | 0x80
+        artifact_id = make_uuid(bytes=bytes(digest))
 
+        add_record(
+            {
+                "id": artifact_id,
+                "repository_id": repo_uuid,
+                "branch_id": branch_uuid,
+                "path": path,
+                "file_type": file_type,
+                "size_bytes": file_info.size_bytes,
+                "parse_status": parse_status,
+                "has_line_map": is_full_index,
+                "last_seen_commit": commit_sha,
+                "last_indexed_at": indexed_at if is_full_index else None,
+                "updated_at": indexed_at,
+            }
+        )
+        add_doc(
+            {
+                "id": str(artifact_id),
+                "repository_id": repository_id,
+                "branch_id": branch_id,
+                "path": path,
+                "file_type": file_type.value,
+                "size_bytes": file_info.size_bytes,
+                "parse_status": parse_status.value,
+                "last_indexed_at": indexed_at_iso if is_full_index else None,
+            }
+        )
+
+    return db_records, meilisearch_docs
 
-def _index_action_to_parse_status(action: IndexAction) -> ParseStatus:
-    """Convert IndexAction to ParseStatus enum.
+
+def _upsert_chunk_size(records: list[dict]) -> int:
+    """Rows per upsert statement that stay within the bind-parameter limit.
 
     Args:
-        action: Index action from filtering.
+        records: Artifact record dicts; all share the first record's keys.
 
     Returns:
-        Corresponding ParseStatus for DB storage.
+        Number of records to send per INSERT statement.
     """
-    if action == IndexAction.FULL_INDEX:
-        return ParseStatus.PARSED
-    elif action == IndexAction.CATALOG_ONLY:
-        return ParseStatus.SKIPPED
-    else:
-        return ParseStatus.SKIPPED
+    return max(1, min(UPSERT_CHUNK_SIZE, PG_MAX_BIND_PARAMS // len(records[0])))
+
+
+def _build_upsert_stmt() -> Insert:
+    """Build the parameterized INSERT ... ON CONFLICT DO UPDATE for artifacts.
+
+    The statement carries no VALUES of its own; rows are passed as an
+    executemany parameter list, so one compiled form is reused for every
+    batch instead of compiling a new multi-row VALUES clause per call.
+    RETURNING id reports the rows actually inserted or updated.
+
+    Returns:
+        PostgreSQL upsert statement.
+    """
+    stmt = insert(Artifact.__table__)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["id"],
+        set_={
+            "path": stmt.excluded.path,
+            "file_type": stmt.excluded.file_type,
+            "size_bytes": stmt.excluded.size_bytes,
+            "parse_status": stmt.excluded.parse_status,
+            "has_line_map": stmt.excluded.has_line_map,
+            "last_seen_commit": stmt.excluded.last_seen_commit,
+            "last_indexed_at": stmt.excluded.last_indexed_at,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    return stmt.returning(Artifact.__table__.c.id)
+
+
+_UPSERT_STMT = _build_upsert_stmt()
+
+
+def _paths_at_commit_stmts(
+    files: list[FileInfo],
+    repo_uuid: uuid.UUID,
+    branch_uuid: uuid.UUID,
+    commit_sha: str,
+) -> Iterator[Select]:
+    """Select which of the given files were last written at a commit.
+
+    Only the files' own paths are looked up, in chunks of
+    UNCHANGED_LOOKUP_CHUNK_SIZE, so each write batch reads back just its
+    rows rather than every artifact of the branch.
+
+    Args:
+        files: Files about to be written.
+        repo_uuid: Parsed repository UUID.
+        branch_uuid: Parsed branch UUID.
+        commit_sha: Commit SHA to match against last_seen_commit.
+
+    Yields:
+        SELECT statements yielding artifact paths.
+    """
+    for i in range(0, len(files), UNCHANGED_LOOKUP_CHUNK_SIZE):
+        yield select(Artifact.path).where(
+            Artifact.repository_id == repo_uuid,
+            Artifact.branch_id == branch_uuid,
+            Artifact.last_seen_commit == commit_sha,
+            Artifact.path.in_(
+                [f.relative_path for f in files[i : i + UNCHANGED_LOOKUP_CHUNK_SIZE]]
+            ),
+        )
+
+
+def _drop_unchanged(
+    files: list[FileInfo],
+    unchanged: set[str],
+    result: ArtifactWriteResult,
+) -> list[FileInfo]:
+    """Filter out files already written at the current commit.
+
+    Args:
+        files: Files about to be written.
+        unchanged: Relative paths already stored at the current commit.
+        result: Write result; artifacts_unchanged is updated.
+
+    Returns:
+        Files that still need writing.
+    """
+    if not unchanged:
+        return files
+
+    remaining = [f for f in files if f.relative_path not in unchanged]
+    result.artifacts_unchanged += len(files) - len(remaining)
+    logger.debug(
+        "Skipping unchanged artifacts",
+        skipped=len(files) - len(remaining),
+        remaining=len(remaining),
+    )
+    return remaining
 
 
 class ArtifactWriter:
@@ -99,8 +298,11 @@ class ArtifactWriter:
             client: Meilisearch client instance.
             index_name: Name of the index to write to. Defaults to ARTIFACTS_INDEX.
         """
+        settings = get_settings()
         self.client = client or get_meilisearch_client()
         self.index_name = index_name or ARTIFACTS_INDEX
+        self.batch_size = settings.meilisearch_batch_size
+        self.concurrency = settings.meilisearch_write_concurrency
 
     async def write_artifacts(
         self,
@@ -109,6 +311,7 @@ class ArtifactWriter:
         branch_id: str,
         commit_sha: str | None = None,
         mark_as_parsed: bool = False,
+        skip_unchanged: bool = True,
     ) -> ArtifactWriteResult:
         """Write artifact metadata for discovered files.
 
@@ -121,6 +324,46 @@ class ArtifactWriter:
             branch_id: Branch UUID string.
             commit_sha: Optional commit SHA for last_seen_commit.
             mark_as_parsed: If True, mark FULL_INDEX files as parsed.
+            skip_unchanged: If True, skip files whose artifact was already
+                written at commit_sha.
+
+        Returns:
+            ArtifactWriteResult with counts and errors.
+        """
+        return await self._write_artifacts_prepared(
+            files,
+            uuid.UUID(repository_id),
+            uuid.UUID(branch_id),
+            repository_id,
+            branch_id,
+            commit_sha,
+            mark_as_parsed,
+            skip_unchanged,
+        )
+
+    async def _write_artifacts_prepared(
+        self,
+        files: list[FileInfo],
+        repo_uuid: uuid.UUID,
+        branch_uuid: uuid.UUID,
+        repository_id: str,
+        branch_id: str,
+        commit_sha: str | None,
+        mark_as_parsed: bool,
+        skip_unchanged: bool,
+    ) -> ArtifactWriteResult:
+        """Write artifact metadata with repository/branch IDs already parsed.
+
+        Args:
+            files: List of FileInfo from discovery.
+            repo_uuid: Parsed repository UUID.
+            branch_uuid: Parsed branch UUID.
+            repository_id: Repository UUID string.
+            branch_id: Branch UUID string.
+            commit_sha: Optional commit SHA for last_seen_commit.
+            mark_as_parsed: If True, mark FULL_INDEX files as parsed.
+            skip_unchanged: If True, skip files whose artifact was already
+                written at commit_sha.
 
         Returns:
             ArtifactWriteResult with counts and errors.
@@ -128,6 +371,11 @@ class ArtifactWriter:
         result = ArtifactWriteResult()
         indexed_at = datetime.now(timezone.utc)
 
+        if skip_unchanged and commit_sha:
+            files = await self._filter_unchanged(
+                files, repo_uuid, branch_uuid, commit_sha, result
+            )
+
         if not files:
             logger.debug("No artifacts to write")
             return result
@@ -139,82 +387,63 @@ class ArtifactWriter:
             file_count=len(files),
         )
 
-        # Prepare DB records and Meilisearch documents
-        db_records = []
-        meilisearch_docs = []
-        repo_uuid = uuid.UUID(repository_id)
-        branch_uuid = uuid.UUID(branch_id)
-
-        for file_info in files:
-            file_type = _file_category_to_file_type(file_info.category)
-            parse_status = _index_action_to_parse_status(file_info.action)
-
-            # If mark_as_parsed is True and the file was fully indexed, mark as parsed
-            if mark_as_parsed and file_info.action == IndexAction.FULL_INDEX:
-                parse_status = ParseStatus.PARSED
-
-            # Generate deterministic ID based on repo + branch + path
-            artifact_id = uuid.uuid5(
-                uuid.NAMESPACE_DNS,
-                f"{repository_id}:{branch_id}:{file_info.relative_path}",
-            )
-
-            db_record = {
-                "id": artifact_id,
-                "repository_id": repo_uuid,
-                "branch_id": branch_uuid,
-                "path": file_info.relative_path,
-                "file_type": file_type,
-                "size_bytes": file_info.size_bytes,
-                "parse_status": parse_status,
-                "has_line_map": file_info.action == IndexAction.FULL_INDEX,
-                "last_seen_commit": commit_sha,
-                "last_indexed_at": indexed_at
-                if file_info.action == IndexAction.FULL_INDEX
-                else None,
-                "updated_at": indexed_at,
-            }
-            db_records.append(db_record)
+        # Stream one batch at a time: build its records, then hand them to a
+        # bounded set of senders. Only about batch_size * concurrency records
+        # are alive at once, and building overlaps with earlier batches being
+        # written.
+        queue: asyncio.Queue[tuple[int, list[dict], list[dict]] | None] = asyncio.Queue(
+            maxsize=self.concurrency
+        )
 
-            meilisearch_doc = {
-                "id": str(artifact_id),
-                "repository_id": repository_id,
-                "branch_id": branch_id,
-                "path": file_info.relative_path,
-                "file_type": file_type.value,
-                "size_bytes": file_info.size_bytes,
-                "parse_status": parse_status.value,
-                "last_indexed_at": indexed_at.isoformat()
-                if file_info.action == IndexAction.FULL_INDEX
-                else None,
-            }
-            meilisearch_docs.append(meilisearch_doc)
+        async def _consume() -> None:
+            while (item := await queue.get()) is not None:
+                batch_start, db_records, batch = item
+                try:
+                    await self._write_meilisearch_batch(batch)
+                except Exception as e:
+                    self._record_meilisearch_failure(result, batch_start, batch, e)
+                    continue
+                result.meilisearch_indexed += len(batch)
 
-        # Write to database
+                # Rows carry last_seen_commit, which skip_unchanged trusts, so
+                # only upsert them once the batch is indexed: a failed batch
+                # is then rewritten when ingestion retries the same commit.
+                try:
+                    result.db_upserted += await self._upsert_to_db(db_records)
+                except Exception as e:
+                    result.errors.append(f"DB upsert failed: {e}")
+                    logger.error(
+                        "DB upsert failed", batch_start=batch_start, error=str(e)
+                    )
+
+        batch_starts = range(0, len(files), self.batch_size)
+        consumers = [
+            asyncio.create_task(_consume())
+            for _ in range(min(self.concurrency, len(batch_starts)))
+        ]
         try:
-            db_upserted = await self._upsert_to_db(db_records)
-            result.db_upserted = db_upserted
-            logger.debug("DB upsert complete", count=db_upserted)
-        except Exception as e:
-            result.errors.append(f"DB upsert failed: {e}")
-            logger.error("DB upsert failed", error=str(e))
-
-        # Write to Meilisearch in batches
-        batch_size = 100
-        for i in range(0, len(meilisearch_docs), batch_size):
-            batch = meilisearch_docs[i : i + batch_size]
-            try:
-                await self._write_meilisearch_batch(batch)
-                result.meilisearch_indexed += len(batch)
-            except Exception as e:
-                result.artifacts_failed += len(batch)
-                result.errors.append(f"Meilisearch batch write failed: {e}")
-                logger.error(
-                    "Meilisearch batch write failed",
-                    batch_start=i,
-                    batch_size=len(batch),
-                    error=str(e),
+            for batch_start in batch_starts:
+                # Pure CPU work over the batch, so keep it off the event loop
+                db_records, meilisearch_docs = await asyncio.to_thread(
+                    _build_records,
+                    files[batch_start : batch_start + self.batch_size],
+                    repo_uuid,
+                    branch_uuid,
+                    repository_id,
+                    branch_id,
+                    commit_sha,
+                    indexed_at,
+                    mark_as_parsed,
                 )
+                await queue.put((batch_start, db_records, meilisearch_docs))
+
+            for _ in consumers:
+                await queue.put(None)
+            await asyncio.gather(*consumers)
+        except BaseException:
+            for consumer in consumers:
+                consumer.cancel()
+            raise
 
         result.artifacts_written = result.db_upserted
 
@@ -223,11 +452,70 @@ class ArtifactWriter:
             artifacts_written=result.artifacts_written,
             db_upserted=result.db_upserted,
             meilisearch_indexed=result.meilisearch_indexed,
+            artifacts_unchanged=result.artifacts_unchanged,
             errors=len(result.errors),
         )
 
         return result
 
+    async def _filter_unchanged(
+        self,
+        files: list[FileInfo],
+        repo_uuid: uuid.UUID,
+        branch_uuid: uuid.UUID,
+        commit_sha: str,
+        result: ArtifactWriteResult,
+    ) -> list[FileInfo]:
+        """Drop files whose artifact was already written at this commit.
+
+        Args:
+            files: Files about to be written.
+            repo_uuid: Parsed repository UUID.
+            branch_uuid: Parsed branch UUID.
+            commit_sha: Commit being ingested.
+            result: Write result; artifacts_unchanged is updated.
+
+        Returns:
+            Files that still need writing. On lookup failure, all files.
+        """
+        try:
+            unchanged: set[str] = set()
+            async with get_session_context() as session:
+                for stmt in _paths_at_commit_stmts(
+                    files, repo_uuid, branch_uuid, commit_sha
+                ):
+                    rows = await session.execute(stmt)
+                    unchanged.update(rows.scalars())
+        except Exception as e:
+            logger.warning("Unchanged artifact lookup failed", error=str(e))
+            return files
+
+        return _drop_unchanged(files, unchanged, result)
+
+    def _record_meilisearch_failure(
+        self,
+        result: ArtifactWriteResult,
+        batch_start: int,
+        batch: list[dict],
+        error: Exception,
+    ) -> None:
+        """Tally a failed Meilisearch batch on the write result.
+
+        Args:
+            result: Write result to update.
+            batch_start: Offset of the batch within the written files.
+            batch: Documents that failed to index.
+            error: Exception raised by the write.
+        """
+        result.artifacts_failed += len(batch)
+        result.errors.append(f"Meilisearch batch write failed: {error}")
+        logger.error(
+            "Meilisearch batch write failed",
+            batch_start=batch_start,
+            batch_size=len(batch),
+            error=str(error),
+        )
+
     async def _upsert_to_db(self, records: list[dict]) -> int:
         """Upsert artifact records to PostgreSQL.
 
@@ -235,30 +523,20 @@ class ArtifactWriter:
             records: List of artifact record dicts.
 
         Returns:
-            Number of records upserted.
+            Number of rows the database reports as inserted or updated.
         """
         if not records:
             return 0
 
+        chunk_size = _upsert_chunk_size(records)
+        upserted = 0
         async with get_session_context() as session:
-            # Use PostgreSQL upsert (INSERT ... ON CONFLICT)
-            stmt = insert(Artifact).values(records)
-            stmt = stmt.on_conflict_do_update(
-                index_elements=["id"],
-                set_={
-                    "path": stmt.excluded.path,
-                    "file_type": stmt.excluded.file_type,
-                    "size_bytes": stmt.excluded.size_bytes,
-                    "parse_status": stmt.excluded.parse_status,
-                    "has_line_map": stmt.excluded.has_line_map,
-                    "last_seen_commit": stmt.excluded.last_seen_commit,
-                    "last_indexed_at": stmt.excluded.last_indexed_at,
-                    "updated_at": stmt.excluded.updated_at,
-                },
-            )
-            await session.execute(stmt)
+            # Several statements, one transaction: commits atomically
+            for i in range(0, len(records), chunk_size):
+                rows = await session.execute(_UPSERT_STMT, records[i : i + chunk_size])
+                upserted += len(rows.all())
 
-        return len(records)
+        return upserted
 
     async def _write_meilisearch_batch(self, documents: list[dict]) -> None:
         """Write a batch of documents to Meilisearch.
@@ -269,7 +547,11 @@ class ArtifactWriter:
         Raises:
             Exception: If write fails.
         """
-        await self.client.add_documents(self.index_name, documents)
+        # The Meilisearch SDK is blocking; run it on the default executor so
+        # concurrent batches actually overlap their HTTP round-trips.
+        await asyncio.to_thread(
+            self.client.add_documents_sync, self.index_name, documents
+        )
 
     async def delete_branch_artifacts(
         self,
@@ -292,7 +574,7 @@ class ArtifactWriter:
         )
 
         # Delete from Meilisearch
-        filter_str = f"repository_id = '{repository_id}' AND branch_id = '{branch_id}'"
+        filter_str = branch_filter(repository_id, branch_id)
         deleted = await self.client.delete_documents_by_filter(
             self.index_name, filter_str
         )
@@ -302,17 +584,13 @@ class ArtifactWriter:
             repo_uuid = uuid.UUID(repository_id)
             branch_uuid = uuid.UUID(branch_id)
 
-            stmt = select(Artifact).where(
+            # Single set-based DELETE; index_records go via ON DELETE CASCADE
+            stmt = delete(Artifact).where(
                 Artifact.repository_id == repo_uuid,
                 Artifact.branch_id == branch_uuid,
             )
             result = await session.execute(stmt)
-            artifacts = result.scalars().all()
-
-            for artifact in artifacts:
-                await session.delete(artifact)
-
-            db_deleted = len(artifacts)
+            db_deleted = result.rowcount
 
         logger.info(
             "Branch artifacts deleted",
@@ -349,28 +627,35 @@ class ArtifactWriter:
         repo_uuid = uuid.UUID(repository_id)
         branch_uuid = uuid.UUID(branch_id)
 
+        updated = 0
         async with get_session_context() as session:
-            stmt = select(Artifact).where(
-                Artifact.repository_id == repo_uuid,
-                Artifact.branch_id == branch_uuid,
-                Artifact.path.in_(file_paths),
-            )
-            result = await session.execute(stmt)
-            artifacts = result.scalars().all()
-
-            for artifact in artifacts:
-                artifact.parse_status = ParseStatus.PARSED
-                artifact.last_indexed_at = indexed_at
-                artifact.has_line_map = True
-
-            logger.debug(
-                "Marked artifacts as parsed",
-                repository_id=repository_id,
-                branch_id=branch_id,
-                count=len(artifacts),
-            )
+            # Bulk UPDATE per slice of paths, keeping IN (...) lists bounded
+            for i in range(0, len(file_paths), MARK_PARSED_CHUNK_SIZE):
+                stmt = (
+                    update(Artifact)
+                    .where(
+                        Artifact.repository_id == repo_uuid,
+                        Artifact.branch_id == branch_uuid,
+                        Artifact.path.in_(file_paths[i : i + MARK_PARSED_CHUNK_SIZE]),
+                    )
+                    .values(
+                        parse_status=ParseStatus.PARSED,
+                        last_indexed_at=indexed_at,
+                        has_line_map=True,
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                result = await session.execute(stmt)
+                updated += result.rowcount
 
-            return len(artifacts)
+        logger.debug(
+            "Marked artifacts as parsed",
+            repository_id=repository_id,
+            branch_id=branch_id,
+            count=updated,
+        )
+
+        return updated
 
     # =========================================================================
     # Synchronous methods for Celery workers
@@ -383,6 +668,7 @@ class ArtifactWriter:
         branch_id: str,
         commit_sha: str | None = None,
         mark_as_parsed: bool = False,
+        skip_unchanged: bool = True,
     ) -> ArtifactWriteResult:
         """Write artifact metadata (synchronous version for workers).
 
@@ -395,100 +681,112 @@ class ArtifactWriter:
             branch_id: Branch UUID string.
             commit_sha: Optional commit SHA for last_seen_commit.
             mark_as_parsed: If True, mark FULL_INDEX files as parsed.
+            skip_unchanged: If True, skip files whose artifact was already
+                written at commit_sha.
 
         Returns:
             ArtifactWriteResult with counts and errors.
         """
-        result = ArtifactWriteResult()
-        indexed_at = datetime.now(timezone.utc)
-
-        if not files:
-            logger.debug("No artifacts to write")
-            return result
-
-        logger.info(
-            "Writing artifacts (sync)",
-            repository_id=repository_id,
-            branch_id=branch_id,
-            file_count=len(files),
+        return self._write_artifacts_prepared_sync(
+            files,
+            uuid.UUID(repository_id),
+            uuid.UUID(branch_id),
+            repository_id,
+            branch_id,
+            commit_sha,
+            mark_as_parsed,
+            skip_unchanged,
         )
 
-        # Prepare DB records and Meilisearch documents
-        db_records = []
-        meilisearch_docs = []
-        repo_uuid = uuid.UUID(repository_id)
-        branch_uuid = uuid.UUID(branch_id)
-
-        for file_info in files:
-            file_type = _file_category_to_file_type(file_info.category)
-            parse_status = _index_action_to_parse_status(file_info.action)
-
-            # If mark_as_parsed is True and the file was fully indexed, mark as parsed
-            if mark_as_parsed and file_info.action == IndexAction.FULL_INDEX:
-                parse_status = ParseStatus.PARSED
+    def _write_artifacts_prepared_sync(
+        self,
+        files: list[FileInfo],
+        repo_uuid: uuid.UUID,
+        branch_uuid: uuid.UUID,
+        repository_id: str,
+        branch_id: str,
+        commit_sha: str | None,
+        mark_as_parsed: bool,
+        skip_unchanged: bool,
+    ) -> ArtifactWriteResult:
+        """Write artifact metadata with repository/branch IDs already parsed.
 
-            # Generate deterministic ID based on repo + branch + path
-            artifact_id = uuid.uuid5(
-                uuid.NAMESPACE_DNS,
-                f"{repository_id}:{branch_id}:{file_info.relative_path}",
-            )
+        Args:
+            files: List of FileInfo from discovery.
+            repo_uuid: Parsed repository UUID.
+            branch_uuid: Parsed branch UUID.
+            repository_id: Repository UUID string.
+            branch_id: Branch UUID string.
+            commit_sha: Optional commit SHA for last_seen_commit.
+            mark_as_parsed: If True, mark FULL_INDEX files as parsed.
+            skip_unchanged: If True, skip files whose artifact was already
+                written at commit_sha.
 
-            db_record = {
-                "id": artifact_id,
-                "repository_id": repo_uuid,
-                "branch_id": branch_uuid,
-                "path": file_info.relative_path,
-                "file_type": file_type,
-                "size_bytes": file_info.size_bytes,
-                "parse_status": parse_status,
-                "has_line_map": file_info.action == IndexAction.FULL_INDEX,
-                "last_seen_commit": commit_sha,
-                "last_indexed_at": indexed_at
-                if file_info.action == IndexAction.FULL_INDEX
-                else None,
-                "updated_at": indexed_at,
-            }
-            db_records.append(db_record)
+        Returns:
+            ArtifactWriteResult with counts and errors. A failed commit is
+            reported here rather than raised.
 
-            meilisearch_doc = {
-                "id": str(artifact_id),
-                "repository_id": repository_id,
-                "branch_id": branch_id,
-                "path": file_info.relative_path,
-                "file_type": file_type.value,
-                "size_bytes": file_info.size_bytes,
-                "parse_status": parse_status.value,
-                "last_indexed_at": indexed_at.isoformat()
-                if file_info.action == IndexAction.FULL_INDEX
-                else None,
-            }
-            meilisearch_docs.append(meilisearch_doc)
+        Raises:
+            Exception: Failures before the commit other than a failed
+                lookup or batch, e.g. opening the session.
+        """
+        result = ArtifactWriteResult()
+        indexed_at = datetime.now(timezone.utc)
 
-        # Write to database
+        # One session (and connection) for the whole write: the lookup and
+        # every batch's upsert run in their own savepoints, and everything
+        # is committed together when the context exits. Batch and lookup
+        # failures are handled inside; anything else raised before the
+        # commit propagates with its own cause.
+        committing = False
         try:
-            db_upserted = self._upsert_to_db_sync(db_records)
-            result.db_upserted = db_upserted
-            logger.debug("DB upsert complete (sync)", count=db_upserted)
+            with get_sync_session_context() as session:
+                if skip_unchanged and commit_sha:
+                    files = self._filter_unchanged_sync(
+                        session, files, repo_uuid, branch_uuid, commit_sha, result
+                    )
+
+                if files:
+                    logger.info(
+                        "Writing artifacts (sync)",
+                        repository_id=repository_id,
+                        branch_id=branch_id,
+                        file_count=len(files),
+                    )
+
+                    self._write_batches_sync(
+                        session,
+                        files,
+                        repo_uuid,
+                        branch_uuid,
+                        repository_id,
+                        branch_id,
+                        commit_sha,
+                        indexed_at,
+                        mark_as_parsed,
+                        result,
+                    )
+                committing = True
         except Exception as e:
-            result.errors.append(f"DB upsert failed: {e}")
-            logger.error("DB upsert failed (sync)", error=str(e))
+            if not committing:
+                raise
+            # Documents Meilisearch already accepted now have no DB rows.
+            # Their paths are not recorded at this commit, so a retry
+            # rewrites them and the two stores converge again.
+            result.db_upserted = 0
+            result.errors.append(
+                f"DB commit failed; {result.meilisearch_indexed} documents "
+                f"indexed in Meilisearch have no DB rows: {e}"
+            )
+            logger.error(
+                "DB commit failed (sync), Meilisearch and DB diverged",
+                meilisearch_only=result.meilisearch_indexed,
+                error=str(e),
+            )
 
-        # Write to Meilisearch in batches
-        batch_size = 100
-        for i in range(0, len(meilisearch_docs), batch_size):
-            batch = meilisearch_docs[i : i + batch_size]
-            try:
-                self._write_meilisearch_batch_sync(batch)
-                result.meilisearch_indexed += len(batch)
-            except Exception as e:
-                result.artifacts_failed += len(batch)
-                result.errors.append(f"Meilisearch batch write failed: {e}")
-                logger.error(
-                    "Meilisearch batch write failed (sync)",
-                    batch_start=i,
-                    batch_size=len(batch),
-                    error=str(e),
-                )
+        if not files:
+            logger.debug("No artifacts to write")
+            return result
 
         result.artifacts_written = result.db_upserted
 
@@ -497,43 +795,153 @@ class ArtifactWriter:
             artifacts_written=result.artifacts_written,
             db_upserted=result.db_upserted,
             meilisearch_indexed=result.meilisearch_indexed,
+            artifacts_unchanged=result.artifacts_unchanged,
             errors=len(result.errors),
         )
 
         return result
 
-    def _upsert_to_db_sync(self, records: list[dict]) -> int:
+    def _write_batches_sync(
+        self,
+        session: Session,
+        files: list[FileInfo],
+        repo_uuid: uuid.UUID,
+        branch_uuid: uuid.UUID,
+        repository_id: str,
+        branch_id: str,
+        commit_sha: str | None,
+        indexed_at: datetime,
+        mark_as_parsed: bool,
+        result: ArtifactWriteResult,
+    ) -> None:
+        """Stream batches of files to the DB session and Meilisearch.
+
+        Builds one batch at a time (see write_artifacts), keeping at most
+        `concurrency` Meilisearch writes in flight on a thread pool. A batch
+        is upserted only after its Meilisearch write succeeds.
+
+        Args:
+            session: Session shared by all batches of this write.
+            files: Files to write.
+            repo_uuid: Parsed repository UUID.
+            branch_uuid: Parsed branch UUID.
+            repository_id: Repository UUID string.
+            branch_id: Branch UUID string.
+            commit_sha: Optional commit SHA for last_seen_commit.
+            indexed_at: Timestamp for this write.
+            mark_as_parsed: If True, mark FULL_INDEX files as parsed.
+            result: Write result to update.
+        """
+        batch_starts = range(0, len(files), self.batch_size)
+        in_flight: deque[tuple[int, list[dict], list[dict], Future[None]]] = deque()
+
+        def _collect(
+            batch_start: int,
+            db_records: list[dict],
+            batch: list[dict],
+            future: Future[None],
+        ) -> None:
+            try:
+                future.result()
+            except Exception as e:
+                self._record_meilisearch_failure(result, batch_start, batch, e)
+                return
+            result.meilisearch_indexed += len(batch)
+
+            # Only upsert once the batch is indexed (see
+            # _write_artifacts_prepared)
+            try:
+                result.db_upserted += self._upsert_to_db_sync(session, db_records)
+            except Exception as e:
+                result.errors.append(f"DB upsert failed: {e}")
+                logger.error(
+                    "DB upsert failed (sync)", batch_start=batch_start, error=str(e)
+                )
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.concurrency, len(batch_starts))
+        ) as executor:
+            for batch_start in batch_starts:
+                db_records, meilisearch_docs = _build_records(
+                    files[batch_start : batch_start + self.batch_size],
+                    repo_uuid,
+                    branch_uuid,
+                    repository_id,
+                    branch_id,
+                    commit_sha,
+                    indexed_at,
+                    mark_as_parsed,
+                )
+
+                if len(in_flight) >= self.concurrency:
+                    _collect(*in_flight.popleft())
+                future = executor.submit(
+                    self._write_meilisearch_batch_sync, meilisearch_docs
+                )
+                in_flight.append((batch_start, db_records, meilisearch_docs, future))
+
+            while in_flight:
+                _collect(*in_flight.popleft())
+
+    def _filter_unchanged_sync(
+        self,
+        session: Session,
+        files: list[FileInfo],
+        repo_uuid: uuid.UUID,
+        branch_uuid: uuid.UUID,
+        commit_sha: str,
+        result: ArtifactWriteResult,
+    ) -> list[FileInfo]:
+        """Drop files whose artifact was already written at this commit (sync).
+
+        Args:
+            session: Session shared by the surrounding write.
+            files: Files about to be written.
+            repo_uuid: Parsed repository UUID.
+            branch_uuid: Parsed branch UUID.
+            commit_sha: Commit being ingested.
+            result: Write result; artifacts_unchanged is updated.
+
+        Returns:
+            Files that still need writing. On lookup failure, all files.
+        """
+        try:
+            unchanged: set[str] = set()
+            with session.begin_nested():
+                for stmt in _paths_at_commit_stmts(
+                    files, repo_uuid, branch_uuid, commit_sha
+                ):
+                    unchanged.update(session.execute(stmt).scalars())
+        except Exception as e:
+            logger.warning("Unchanged artifact lookup failed (sync)", error=str(e))
+            return files
+
+        return _drop_unchanged(files, unchanged, result)
+
+    def _upsert_to_db_sync(self, session: Session, records: list[dict]) -> int:
         """Upsert artifact records to PostgreSQL (synchronous).
 
+        Runs in a savepoint on the caller's session, so a failed batch is
+        rolled back on its own and the caller commits once for all batches.
+
         Args:
+            session: Session shared by the surrounding write.
             records: List of artifact record dicts.
 
         Returns:
-            Number of records upserted.
+            Number of rows the database reports as inserted or updated.
         """
         if not records:
             return 0
 
-        with get_sync_session_context() as session:
-            # Use PostgreSQL upsert (INSERT ... ON CONFLICT)
-            stmt = insert(Artifact).values(records)
-            stmt = stmt.on_conflict_do_update(
-                index_elements=["id"],
-                set_={
-                    "path": stmt.excluded.path,
-                    "file_type": stmt.excluded.file_type,
-                    "size_bytes": stmt.excluded.size_bytes,
-                    "parse_status": stmt.excluded.parse_status,
-                    "has_line_map": stmt.excluded.has_line_map,
-                    "last_seen_commit": stmt.excluded.last_seen_commit,
-                    "last_indexed_at": stmt.excluded.last_indexed_at,
-                    "updated_at": stmt.excluded.updated_at,
-                },
-            )
-            session.execute(stmt)
-            session.commit()
+        chunk_size = _upsert_chunk_size(records)
+        upserted = 0
+        with session.begin_nested():
+            for i in range(0, len(records), chunk_size):
+                rows = session.execute(_UPSERT_STMT, records[i : i + chunk_size])
+                upserted += len(rows.all())
 
-        return len(records)
+        return upserted
 
     def _write_meilisearch_batch_sync(self, documents: list[dict]) -> None:
         """Write a batch of documents to Meilisearch (synchronous).
@@ -567,7 +975,7 @@ class ArtifactWriter:
         )
 
         # Delete from Meilisearch
-        filter_str = f"repository_id = '{repository_id}' AND branch_id = '{branch_id}'"
+        filter_str = branch_filter(repository_id, branch_id)
         deleted = self.client.delete_documents_by_filter_sync(
             self.index_name, filter_str
         )
@@ -577,18 +985,14 @@ class ArtifactWriter:
             repo_uuid = uuid.UUID(repository_id)
             branch_uuid = uuid.UUID(branch_id)
 
-            stmt = select(Artifact).where(
+            # Single set-based DELETE; index_records go via ON DELETE CASCADE
+            stmt = delete(Artifact).where(
                 Artifact.repository_id == repo_uuid,
                 Artifact.branch_id == branch_uuid,
             )
             result = session.execute(stmt)
-            artifacts = result.scalars().all()
-
-            for artifact in artifacts:
-                session.delete(artifact)
-
             session.commit()
-            db_deleted = len(artifacts)
+            db_deleted = result.rowcount
 
         logger.info(
             "Branch artifacts deleted (sync)",
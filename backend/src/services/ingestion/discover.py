@@ -1,6 +1,10 @@
 """Artifact discovery for repository ingestion."""
 
 import os
+import threading
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -15,6 +19,13 @@ from backend.src.services.ingestion.file_filters import (
 
 logger = get_logger(__name__)
 
+# Directories with at least this many files have their entries stat()ed on
+# a thread pool; smaller ones are cheaper to stat inline.
+PARALLEL_STAT_MIN_FILES = 64
+
+# Name of the git dir, which is a plain file in worktrees and submodules
+GITFILE_NAME = ".git"
+
 
 @dataclass
 class DiscoveryResult:
@@ -28,6 +39,36 @@ class DiscoveryResult:
     errors: list[str] = field(default_factory=list)
 
 
+def _merge_results(target: DiscoveryResult, source: DiscoveryResult) -> None:
+    """Fold a subtree's discovery result into the overall result.
+
+    Args:
+        target: Result to update in place.
+        source: Result from a single subtree.
+    """
+    target.files_to_index.extend(source.files_to_index)
+    target.files_catalog_only.extend(source.files_catalog_only)
+    target.files_skipped += source.files_skipped
+    target.directories_skipped += source.directories_skipped
+    target.total_size_bytes += source.total_size_bytes
+    target.errors.extend(source.errors)
+
+
+def _entry_size(entry: os.DirEntry[str]) -> int | OSError:
+    """Stat a directory entry, returning the error instead of raising.
+
+    Args:
+        entry: Directory entry for a file.
+
+    Returns:
+        File size in bytes, or the OSError raised by stat().
+    """
+    try:
+        return entry.stat().st_size
+    except OSError as e:
+        return e
+
+
 class ArtifactDiscovery:
     """Discover and filter artifacts in a repository."""
 
@@ -35,15 +76,21 @@ class ArtifactDiscovery:
         self,
         file_filter: FileFilter | None = None,
         batch_size: int = MAX_BATCH_SIZE,
+        max_workers: int | None = None,
     ):
         """Initialize artifact discovery.
 
         Args:
             file_filter: File filter instance.
             batch_size: Maximum files per batch.
+            max_workers: Threads used to walk the repository tree. Defaults
+                to min(32, cpu_count * 4), the usual sizing for IO-bound pools.
         """
         self.file_filter = file_filter or get_file_filter()
         self.batch_size = batch_size
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        self._stat_executor: ThreadPoolExecutor | None = None
+        self._stat_executor_lock = threading.Lock()
 
     def discover(
         self,
@@ -75,7 +122,25 @@ class ArtifactDiscovery:
             result.errors.append(f"Repository path is not a directory: {repo_path}")
             return result
 
-        self._walk_directory(repo_path, repo_path, result)
+        # Scan the root here, then walk each top-level subtree on the pool.
+        # readdir/stat release the GIL, so threads overlap filesystem
+        # latency (cold caches, network and overlay filesystems).
+        base_len = len(os.path.join(repo_path, ""))
+        subtrees = self._scan_directory(base_len, os.fspath(repo_path), result)
+        if self.max_workers > 1 and len(subtrees) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(subtrees))
+            ) as executor:
+                futures = [
+                    executor.submit(self._walk_subtree, repo_path, subtree)
+                    for subtree in subtrees
+                ]
+                # Merge in submission order so file order is deterministic
+                for future in futures:
+                    _merge_results(result, future.result())
+        else:
+            for subtree in subtrees:
+                self._walk_directory(repo_path, Path(subtree), result)
 
         logger.info(
             "Artifact discovery complete",
@@ -88,59 +153,277 @@ class ArtifactDiscovery:
 
         return result
 
+    def iter_files(
+        self,
+        repo_path: Path,
+        stats: DiscoveryResult | None = None,
+    ) -> Iterator[FileInfo]:
+        """Lazily yield indexable files in a repository.
+
+        Unlike discover(), nothing is accumulated: files are yielded one
+        directory at a time, so memory stays flat regardless of repo size.
+        Skipped files (SKIP action) are not yielded.
+
+        With more than one worker, directories are scanned ahead on a thread
+        pool, at most 2 * max_workers at a time, and yielded in the order
+        they were submitted, so the order is deterministic.
+
+        Args:
+            repo_path: Path to repository root.
+            stats: Optional result that receives counts, sizes and errors.
+                Its file lists are left empty.
+
+        Yields:
+            FileInfo for each FULL_INDEX or CATALOG_ONLY file.
+        """
+        if stats is None:
+            stats = DiscoveryResult()
+
+        if not repo_path.is_dir():
+            stats.errors.append(f"Repository path is not a directory: {repo_path}")
+            return
+
+        base_len = len(os.path.join(repo_path, ""))
+        stack = [os.fspath(repo_path)]
+
+        if self.max_workers == 1:
+            while stack:
+                scratch = DiscoveryResult()
+                stack.extend(self._scan_directory(base_len, stack.pop(), scratch))
+                yield from self._drain_scan(scratch, stats)
+            return
+
+        in_flight: deque[tuple[Future[list[str]], DiscoveryResult]] = deque()
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="discover-walk"
+        ) as executor:
+            while stack or in_flight:
+                while stack and len(in_flight) < self.max_workers * 2:
+                    scratch = DiscoveryResult()
+                    future = executor.submit(
+                        self._scan_directory, base_len, stack.pop(), scratch
+                    )
+                    in_flight.append((future, scratch))
+
+                future, scratch = in_flight.popleft()
+                stack.extend(future.result())
+                yield from self._drain_scan(scratch, stats)
+
+    @staticmethod
+    def _drain_scan(
+        scratch: DiscoveryResult,
+        stats: DiscoveryResult,
+    ) -> Iterator[FileInfo]:
+        """Yield one directory's files and fold its counts into stats.
+
+        Args:
+            scratch: Result of scanning a single directory.
+            stats: Result that receives counts, sizes and errors.
+
+        Yields:
+            FileInfo for each FULL_INDEX or CATALOG_ONLY file.
+        """
+        yield from scratch.files_to_index
+        yield from scratch.files_catalog_only
+
+        stats.files_skipped += scratch.files_skipped
+        stats.directories_skipped += scratch.directories_skipped
+        stats.total_size_bytes += scratch.total_size_bytes
+        stats.errors.extend(scratch.errors)
+
+    def iter_batches(
+        self,
+        repo_path: Path,
+        batch_size: int | None = None,
+        stats: DiscoveryResult | None = None,
+    ) -> Iterator[tuple[IndexAction, list[FileInfo]]]:
+        """Lazily yield batches of discovered files grouped by action.
+
+        Args:
+            repo_path: Path to repository root.
+            batch_size: Maximum files per batch. Defaults to self.batch_size.
+            stats: Optional result that receives counts, sizes and errors.
+
+        Yields:
+            (action, files) tuples where action is FULL_INDEX or CATALOG_ONLY.
+            Every batch but the last of each action holds batch_size files.
+        """
+        batch_size = batch_size or self.batch_size
+        pending: dict[IndexAction, list[FileInfo]] = {
+            IndexAction.FULL_INDEX: [],
+            IndexAction.CATALOG_ONLY: [],
+        }
+
+        for file_info in self.iter_files(repo_path, stats):
+            batch = pending[file_info.action]
+            batch.append(file_info)
+            if len(batch) >= batch_size:
+                yield file_info.action, batch
+                pending[file_info.action] = []
+
+        for action, batch in pending.items():
+            if batch:
+                yield action, batch
+
     def _walk_directory(
         self,
         base_path: Path,
         current_path: Path,
         result: DiscoveryResult,
     ) -> None:
-        """Recursively walk directory and discover files.
+        """Walk a directory tree and discover files.
+
+        Uses an explicit stack instead of recursion. Symlinked directories
+        are not followed.
 
         Args:
             base_path: Repository root path.
-            current_path: Current directory being walked.
+            current_path: Directory to start walking from.
             result: Result accumulator.
         """
+        # Length of "<base_path>/" so relative paths are a plain slice
+        base_len = len(os.path.join(base_path, ""))
+
+        stack = [os.fspath(current_path)]
+        while stack:
+            stack.extend(self._scan_directory(base_len, stack.pop(), result))
+
+    def _walk_subtree(self, base_path: Path, subtree: str) -> DiscoveryResult:
+        """Walk one subtree into its own result (thread pool worker).
+
+        Args:
+            base_path: Repository root path.
+            subtree: Directory to walk.
+
+        Returns:
+            DiscoveryResult for the subtree.
+        """
+        result = DiscoveryResult()
+        self._walk_directory(base_path, Path(subtree), result)
+        return result
+
+    def _scan_directory(
+        self,
+        base_len: int,
+        directory: str,
+        result: DiscoveryResult,
+    ) -> list[str]:
+        """Analyze the files of a single directory.
+
+        Uses os.scandir so file/directory checks come from the directory
+        entry type instead of an extra stat() per entry.
+
+        Args:
+            base_len: Length of the repository root path plus separator.
+            directory: Directory to scan.
+            result: Result accumulator.
+
+        Returns:
+            Subdirectories to descend into.
+        """
+        file_filter = self.file_filter
+        full_index = IndexAction.FULL_INDEX
+        catalog_only = IndexAction.CATALOG_ONLY
+        subdirectories: list[str] = []
+        file_entries: list[os.DirEntry[str]] = []
+
         try:
-            entries = list(current_path.iterdir())
-        except PermissionError as e:
-            result.errors.append(f"Permission denied: {current_path}")
-            logger.warning("Permission denied", path=str(current_path))
-            return
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except PermissionError:
+            result.errors.append(f"Permission denied: {directory}")
+            logger.warning("Permission denied", path=directory)
+            return subdirectories
         except OSError as e:
-            result.errors.append(f"OS error reading {current_path}: {e}")
-            logger.warning("OS error", path=str(current_path), error=str(e))
-            return
+            result.errors.append(f"OS error reading {directory}: {e}")
+            logger.warning("OS error", path=directory, error=str(e))
+            return subdirectories
 
         for entry in entries:
             try:
-                if entry.is_dir():
+                if entry.is_dir(follow_symlinks=False):
                     # Check if we should skip this directory
-                    if self.file_filter.should_skip_directory(entry.name):
+                    if file_filter.should_skip_directory(entry.name):
                         result.directories_skipped += 1
                         logger.debug("Skipping directory", name=entry.name)
                         continue
 
-                    # Recurse into subdirectory
-                    self._walk_directory(base_path, entry, result)
+                    subdirectories.append(entry.path)
+
+                elif entry.name == GITFILE_NAME:
+                    # Worktree and submodule checkouts have a .git *file*
+                    # (gitfile) pointing at the real git dir; skip it too
+                    result.files_skipped += 1
+                    logger.debug("Skipping gitfile", path=entry.path)
 
                 elif entry.is_file():
-                    # Analyze file
-                    relative_path = str(entry.relative_to(base_path))
-                    file_info = self.file_filter.analyze_file(entry, relative_path)
+                    file_entries.append(entry)
+
+            except OSError as e:
+                result.errors.append(f"Error processing {entry.path}: {e}")
+                logger.warning("Error processing entry", path=entry.path, error=str(e))
+
+        for entry, size in zip(
+            file_entries, self._stat_entries(file_entries), strict=True
+        ):
+            if isinstance(size, OSError):
+                result.errors.append(f"Error processing {entry.path}: {size}")
+                logger.warning(
+                    "Error processing entry", path=entry.path, error=str(size)
+                )
+                continue
+
+            # Analyze file
+            file_info = file_filter.analyze_file(
+                entry.path,
+                entry.path[base_len:],
+                size_bytes=size,
+                file_name=entry.name,
+            )
+
+            result.total_size_bytes += file_info.size_bytes
+
+            if file_info.action is full_index:
+                result.files_to_index.append(file_info)
+            elif file_info.action is catalog_only:
+                result.files_catalog_only.append(file_info)
+            else:
+                result.files_skipped += 1
+
+        return subdirectories
+
+    def _stat_entries(self, entries: list[os.DirEntry[str]]) -> list[int | OSError]:
+        """Stat file entries, in parallel for large directories.
+
+        stat() releases the GIL, so a directory with many files overlaps
+        its metadata lookups on a thread pool. Results keep entry order.
 
-                    result.total_size_bytes += file_info.size_bytes
+        Args:
+            entries: File entries of one directory.
 
-                    if file_info.action == IndexAction.FULL_INDEX:
-                        result.files_to_index.append(file_info)
-                    elif file_info.action == IndexAction.CATALOG_ONLY:
-                        result.files_catalog_only.append(file_info)
-                    else:
-                        result.files_skipped += 1
+        Returns:
+            Size in bytes or the stat() error for each entry.
+        """
+        if self.max_workers == 1 or len(entries) < PARALLEL_STAT_MIN_FILES:
+            return [_entry_size(entry) for entry in entries]
+        return list(self._get_stat_executor().map(_entry_size, entries))
 
-            except OSError as e:
-                result.errors.append(f"Error processing {entry}: {e}")
-                logger.warning("Error processing entry", path=str(entry), error=str(e))
+    def _get_stat_executor(self) -> ThreadPoolExecutor:
+        """Get the pool used for parallel stat() calls, creating it lazily.
+
+        Kept separate from the subtree pool: subtree workers block on this
+        pool, so sharing one pool could starve it.
+
+        Returns:
+            Shared stat thread pool.
+        """
+        with self._stat_executor_lock:
+            if self._stat_executor is None:
+                self._stat_executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="discover-stat",
+                )
+            return self._stat_executor
 
     def get_batches(
         self,
@@ -2,7 +2,13 @@
 
 import asyncio
 import hashlib
-import uuid
+import mmap
+import multiprocessing
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -12,9 +18,11 @@ from backend.src.config.constants import (
     MAX_CHUNKS_PER_FILE,
 )
 from backend.src.config.logging import get_logger
+from backend.src.config.settings import get_settings
 from backend.src.services.ai.embeddings import EmbeddingClient, get_embedding_client
 from backend.src.services.ingestion.file_filters import FileInfo
 from backend.src.services.search.chunk_embed import (
+    Chunk,
     ChunkingService,
     get_chunking_service,
     get_language_from_extension,
@@ -22,14 +30,23 @@ from backend.src.services.search.chunk_embed import (
 
 logger = get_logger(__name__)
 
+# Encodings tried in order when decoding file content
+_ENCODINGS = ("utf-8", "latin-1", "cp1252")
 
-@dataclass
+# Files at least this large are decoded from an mmap instead of a read()
+MMAP_READ_THRESHOLD = 64 * 1024
+
+# Files per task handed to a worker process; amortizes pickling overhead
+PROCESS_POOL_CHUNKSIZE = 16
+
+
+@dataclass(slots=True)
 class EmbeddedChunk:
     """A chunk of text with embedding and metadata."""
 
     id: str
     content: str
-    embedding: list[float] | None
+    embedding: array | None  # Packed float32 ("f") or int8 ("b") vector
     file_path: str
     line_start: int
     line_end: int
@@ -40,9 +57,10 @@ class EmbeddedChunk:
     end_index: int | None = None  # Character offset in original file
     chunking_mode: str = "token"  # Which chunker produced this
     language: str | None = None  # Detected/specified programming language
+    embedding_scale: float | None = None  # Set when embedding is int8
 
 
-@dataclass
+@dataclass(slots=True)
 class EmbeddingResult:
     """Result of embedding a file."""
 
@@ -62,6 +80,7 @@ class EmbedService:
         chunk_size: int = CHUNK_SIZE_TOKENS,
         chunk_overlap: int = CHUNK_OVERLAP_TOKENS,
         max_chunks: int = MAX_CHUNKS_PER_FILE,
+        max_workers: int | None = None,
     ):
         """Initialize embedding service.
 
@@ -71,12 +90,149 @@ class EmbedService:
             chunk_size: Target chunk size in tokens.
             chunk_overlap: Overlap between chunks.
             max_chunks: Maximum chunks per file.
+            max_workers: Workers used by process_files. Defaults to the CPU
+                count; 1 processes files in the calling thread.
         """
         self.chunking_service = chunking_service or get_chunking_service()
         self.embedding_client = embedding_client or get_embedding_client()
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.max_chunks = max_chunks
+        self.max_workers = max_workers or os.cpu_count() or 1
+        settings = get_settings()
+        self.embed_concurrency = settings.embedding_max_concurrency
+        self.quantize = settings.embedding_quantization == "int8"
+        self.chunk_cache_size = settings.chunk_cache_size
+        self._chunk_cache: OrderedDict[tuple[bytes, str | None, str], list[Chunk]] = (
+            OrderedDict()
+        )
+        self._chunk_cache_lock = threading.Lock()
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._thread_pool: ThreadPoolExecutor | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def __enter__(self) -> "EmbedService":
+        """Start the event loop used for embedding requests."""
+        self._get_loop()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the event loop and worker pool."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the event loop and shut down the worker pools, if started."""
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown()
+            self._thread_pool = None
+
+    def process_files(
+        self,
+        files: list[FileInfo],
+        repository_id: str,
+        branch_id: str,
+    ) -> list[EmbeddingResult]:
+        """Process several files into chunks with embeddings.
+
+        Files are read on a thread pool, since file IO releases the GIL.
+        Chunking and hashing are CPU-bound, so the read files are spread
+        over a process pool with one EmbedService per worker.
+
+        Daemonic processes cannot start children, and Celery's prefork
+        workers are daemonic. There, files are chunked on the thread pool
+        instead. That overlaps the parts of chunking that release the GIL
+        (tokenizers, hashing of large buffers), but not pure-Python work.
+        A single file or max_workers=1 is processed in the calling thread.
+
+        Embeddings are then requested for every chunk of every file at
+        once, in provider-sized batches, instead of one request per file.
+
+        Args:
+            files: Files from discovery.
+            repository_id: Repository UUID.
+            branch_id: Branch UUID.
+
+        Returns:
+            One EmbeddingResult per file, in input order.
+        """
+        if len(files) <= 1 or self.max_workers == 1:
+            # Reads are serial here; queue them with the kernel up front so
+            # disk latency overlaps with chunking
+            _prefetch_files(files)
+            results = [
+                self._chunk_file(file_info, repository_id, branch_id)
+                for file_info in files
+            ]
+        elif multiprocessing.current_process().daemon:
+            results = list(
+                self._get_thread_pool().map(
+                    lambda file_info: self._chunk_file(
+                        file_info, repository_id, branch_id
+                    ),
+                    files,
+                )
+            )
+        else:
+            contents = self._get_thread_pool().map(
+                self._read_file, (file_info.path for file_info in files)
+            )
+            items = [
+                (file_info, content, repository_id, branch_id)
+                for file_info, content in zip(files, contents, strict=True)
+            ]
+            results = list(
+                self._get_process_pool().map(
+                    _chunk_file_in_worker, items, chunksize=PROCESS_POOL_CHUNKSIZE
+                )
+            )
+
+        self._get_loop().run_until_complete(self._embed_results(results))
+        return results
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        """Get the thread pool for reads and daemonic chunking, creating it lazily.
+
+        Returns:
+            Thread pool sized to max_workers.
+        """
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="embed"
+            )
+        return self._thread_pool
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Get the worker process pool, creating it on first use.
+
+        Returns:
+            Process pool whose workers each hold their own EmbedService.
+        """
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_process_worker,
+            )
+        return self._process_pool
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the event loop for embedding requests, creating it on first use.
+
+        One loop is kept for the service's lifetime instead of a fresh
+        asyncio.run() per call, which would set up and tear down a loop
+        and its default executor for every file or batch.
+
+        Returns:
+            Event loop owned by this service.
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop
 
     def process_file(
         self,
@@ -94,27 +250,123 @@ class EmbedService:
         Returns:
             EmbeddingResult with chunks.
         """
+        result = self._chunk_file(file_info, repository_id, branch_id)
+        self._get_loop().run_until_complete(self._embed_results([result]))
+        return result
+
+    async def _embed_results(self, results: list[EmbeddingResult]) -> None:
+        """Fill in embeddings for the chunks of several files.
+
+        Chunks from all files are flattened and sent in batches of the
+        client's batch_size, with at most embed_concurrency requests in
+        flight. Embeddings are written back onto the chunks in place as
+        packed float32 arrays, or as int8 arrays with a scale when
+        quantization is enabled. A failed batch is logged and its chunks
+        keep no embedding.
+
+        Args:
+            results: Chunked files; results with an error are skipped.
+        """
+        if not self.embedding_client.enabled:
+            return
+
+        chunks = [chunk for r in results if r.error is None for chunk in r.chunks]
+        if not chunks:
+            return
+
+        batch_size = self.embedding_client.batch_size
+        semaphore = asyncio.Semaphore(self.embed_concurrency)
+
+        async def embed_batch(batch: list[EmbeddedChunk]) -> None:
+            async with semaphore:
+                try:
+                    embeddings = await self.embedding_client.embed_batch(
+                        [chunk.content for chunk in batch]
+                    )
+                except Exception as e:
+                    logger.warning(
+                        "Failed to generate embeddings, continuing without",
+                        chunk_count=len(batch),
+                        error=str(e),
+                    )
+                    return
+
+            for chunk, embedding in zip(batch, embeddings, strict=False):
+                if self.quantize:
+                    chunk.embedding, chunk.embedding_scale = quantize_int8(embedding)
+                else:
+                    chunk.embedding = array("f", embedding)
+
+        await asyncio.gather(
+            *(
+                embed_batch(chunks[i : i + batch_size])
+                for i in range(0, len(chunks), batch_size)
+            )
+        )
+
+        logger.debug(
+            "Generated embeddings for files",
+            file_count=len(results),
+            chunk_count=len(chunks),
+            batch_count=-(-len(chunks) // batch_size),
+        )
+
+    def _chunk_file(
+        self,
+        file_info: FileInfo,
+        repository_id: str,
+        branch_id: str,
+    ) -> EmbeddingResult:
+        """Read and chunk a file, leaving chunk embeddings empty.
+
+        Args:
+            file_info: File information from discovery.
+            repository_id: Repository UUID.
+            branch_id: Branch UUID.
+
+        Returns:
+            EmbeddingResult with chunks whose embedding is None.
+        """
+        return self._chunk_content_of(
+            file_info, self._read_file(file_info.path), repository_id, branch_id
+        )
+
+    def _chunk_content_of(
+        self,
+        file_info: FileInfo,
+        content: str | None,
+        repository_id: str,
+        branch_id: str,
+    ) -> EmbeddingResult:
+        """Chunk a file's content, leaving chunk embeddings empty.
+
+        Args:
+            file_info: File information from discovery.
+            content: Content from _read_file, or None if it was unreadable.
+            repository_id: Repository UUID.
+            branch_id: Branch UUID.
+
+        Returns:
+            EmbeddingResult with chunks whose embedding is None.
+        """
         result = EmbeddingResult(file_path=file_info.relative_path)
+        if content is None:
+            result.error = "Failed to read file"
+            return result
 
         try:
-            # Read file content
-            content = self._read_file(file_info.path)
-            if content is None:
-                result.error = "Failed to read file"
-                return result
-
             # Derive language from file extension for code-aware chunking
             file_extension = file_info.extension
             language = (
                 get_language_from_extension(file_extension) if file_extension else None
             )
 
+            # Encode the file once; the bytes key the chunk cache and chunks
+            # are hashed straight from this buffer
+            encoded = memoryview(content.encode())
+
             # Chunk the content with language awareness
-            chunks = self.chunking_service.chunk_text(
-                content,
-                language=language,
-                file_extension=file_extension,
-            )
+            chunks = self._chunk_content(content, encoded, language, file_extension)
 
             # Limit chunks per file
             if len(chunks) > self.max_chunks:
@@ -126,73 +378,44 @@ class EmbedService:
                 )
                 chunks = chunks[: self.max_chunks]
 
-            # Generate embeddings for all chunks in batch
-            chunk_texts = [chunk.text for chunk in chunks]
-            embeddings: list[list[float]] = []
-            if chunk_texts and self.embedding_client.enabled:
-                try:
-                    embeddings = asyncio.run(
-                        self.embedding_client.embed_batch(chunk_texts)
-                    )
-                    logger.debug(
-                        "Generated embeddings for file",
-                        file_path=file_info.relative_path,
-                        chunk_count=len(chunks),
-                        embedding_count=len(embeddings),
-                    )
-                except Exception as e:
-                    logger.warning(
-                        "Failed to generate embeddings, continuing without",
-                        file_path=file_info.relative_path,
-                        error=str(e),
-                    )
-                    embeddings = []
-
-            # Process each chunk - use line numbers from chunk if available
-            for idx, chunk in enumerate(chunks):
-                # Use line numbers computed by chunker (more accurate for CodeChunker)
-                line_start = chunk.line_start
-                line_end = chunk.line_end
-
-                # Generate chunk ID
-                chunk_id = self._generate_chunk_id(
-                    repository_id=repository_id,
-                    branch_id=branch_id,
-                    file_path=file_info.relative_path,
-                    chunk_index=idx,
-                )
-
-                # Calculate content hash
-                content_hash = hashlib.sha256(chunk.text.encode()).hexdigest()[:16]
+            # For ASCII content character offsets are byte offsets
+            byte_offsets = (
+                None if len(encoded) == len(content) else _byte_offsets(content, chunks)
+            )
 
-                # Get embedding for this chunk (if available)
-                chunk_embedding = embeddings[idx] if idx < len(embeddings) else None
+            # Repository, branch and path are shared by every chunk ID
+            id_prefix = _chunk_id_prefix(
+                repository_id, branch_id, file_info.relative_path
+            )
 
-                embedded_chunk = EmbeddedChunk(
-                    id=chunk_id,
+            # Build the chunk list in one pass; line numbers come from the
+            # chunker (more accurate for CodeChunker)
+            relative_path = file_info.relative_path
+            result.chunks = [
+                EmbeddedChunk(
+                    id=_chunk_id(id_prefix, idx),
                     content=chunk.text,
-                    embedding=chunk_embedding,
-                    file_path=file_info.relative_path,
-                    line_start=line_start,
-                    line_end=line_end,
+                    embedding=None,
+                    file_path=relative_path,
+                    line_start=chunk.line_start,
+                    line_end=chunk.line_end,
                     token_count=chunk.token_count,
                     chunk_index=idx,
-                    content_hash=content_hash,
+                    content_hash=_content_hash(content, encoded, byte_offsets, chunk),
                     start_index=chunk.start_index,
                     end_index=chunk.end_index,
                     chunking_mode=chunk.chunking_mode,
                     language=language,
                 )
-
-                result.chunks.append(embedded_chunk)
-                result.total_tokens += chunk.token_count
+                for idx, chunk in enumerate(chunks)
+            ]
+            result.total_tokens = sum(chunk.token_count for chunk in chunks)
 
             logger.debug(
                 "File processed",
                 file_path=file_info.relative_path,
                 chunks=len(result.chunks),
                 total_tokens=result.total_tokens,
-                embeddings_generated=len(embeddings) > 0,
                 language=language,
                 chunking_mode=chunks[0].chunking_mode if chunks else "none",
             )
@@ -207,6 +430,51 @@ class EmbedService:
 
         return result
 
+    def _chunk_content(
+        self,
+        content: str,
+        encoded: memoryview,
+        language: str | None,
+        file_extension: str,
+    ) -> list[Chunk]:
+        """Chunk file content, reusing results for content seen before.
+
+        Chunker output is kept in an LRU cache keyed on the SHA-256 of the
+        content bytes plus language and extension, so unchanged files skip
+        the chunker on re-ingestion. Cached chunks are shared and must not
+        be mutated.
+
+        Args:
+            content: Decoded file content.
+            encoded: View of content's UTF-8 bytes.
+            language: Language passed to the chunker.
+            file_extension: File extension passed to the chunker.
+
+        Returns:
+            Chunks for the content.
+        """
+        if self.chunk_cache_size == 0:
+            return self.chunking_service.chunk_text(
+                content, language=language, file_extension=file_extension
+            )
+
+        key = (hashlib.sha256(encoded).digest(), language, file_extension)
+        with self._chunk_cache_lock:
+            chunks = self._chunk_cache.get(key)
+            if chunks is not None:
+                self._chunk_cache.move_to_end(key)
+                return chunks
+
+        chunks = self.chunking_service.chunk_text(
+            content, language=language, file_extension=file_extension
+        )
+
+        with self._chunk_cache_lock:
+            self._chunk_cache[key] = chunks
+            if len(self._chunk_cache) > self.chunk_cache_size:
+                self._chunk_cache.popitem(last=False)
+        return chunks
+
     def _read_file(self, file_path: Path) -> str | None:
         """Read file content with encoding detection.
 
@@ -216,27 +484,35 @@ class EmbedService:
         Returns:
             File content or None if unreadable.
         """
-        encodings = ["utf-8", "latin-1", "cp1252"]
-
-        for encoding in encodings:
-            try:
-                with open(file_path, encoding=encoding) as f:
-                    return f.read()
-            except UnicodeDecodeError:
-                continue
-            except OSError as e:
-                logger.warning(
-                    "OS error reading file",
-                    file_path=str(file_path),
-                    error=str(e),
-                )
-                return None
+        try:
+            with open(file_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size >= MMAP_READ_THRESHOLD:
+                    # Decode straight from the mapping, without first
+                    # copying the whole file into a bytes object
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        content = _decode(mapped)
+                else:
+                    content = _decode(f.read())
+        except (OSError, ValueError) as e:
+            # ValueError: mmap of a file truncated to empty after fstat
+            logger.warning(
+                "OS error reading file",
+                file_path=str(file_path),
+                error=str(e),
+            )
+            return None
 
-        logger.warning(
-            "Could not decode file with any encoding",
-            file_path=str(file_path),
-        )
-        return None
+        if content is None:
+            logger.warning(
+                "Could not decode file with any encoding",
+                file_path=str(file_path),
+            )
+            return None
+
+        # Match text-mode reads, which translate \r\n and \r to \n
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content
 
     def _generate_chunk_id(
         self,
@@ -256,10 +532,208 @@ class EmbedService:
         Returns:
             Chunk ID string.
         """
-        # Create deterministic ID based on content location
-        content = f"{repository_id}:{branch_id}:{file_path}:{chunk_index}"
-        hash_bytes = hashlib.sha256(content.encode()).digest()[:16]
-        return str(uuid.UUID(bytes=hash_bytes))
+        return _chunk_id(
+            _chunk_id_prefix(repository_id, branch_id, file_path), chunk_index
+        )
+
+
+def _decode(data: bytes | mmap.mmap) -> str | None:
+    """Decode file bytes, trying each of _ENCODINGS in order.
+
+    Decodes the one buffer for every attempt rather than re-reading the
+    file per encoding.
+
+    Args:
+        data: File bytes or a read-only mapping of the file.
+
+    Returns:
+        Decoded text, or None if no encoding applies.
+    """
+    for encoding in _ENCODINGS:
+        try:
+            return str(data, encoding)
+        except UnicodeDecodeError:
+            continue
+    return None
+
+
+def _prefetch_files(files: list[FileInfo]) -> None:
+    """Ask the kernel to start reading files into the page cache.
+
+    posix_fadvise(WILLNEED) queues readahead and returns without waiting,
+    so a batch of cold files is fetched concurrently while earlier files
+    are chunked. A no-op where posix_fadvise is unavailable; errors only
+    lose the hint.
+
+    Args:
+        files: Files about to be read.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+
+    for file_info in files:
+        try:
+            fd = os.open(file_info.path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def _chunk_id_prefix(
+    repository_id: str,
+    branch_id: str,
+    file_path: str,
+) -> "hashlib._Hash":
+    """Start the chunk ID hash for one file.
+
+    Args:
+        repository_id: Repository UUID.
+        branch_id: Branch UUID.
+        file_path: Relative file path.
+
+    Returns:
+        SHA-256 state over "{repository_id}:{branch_id}:{file_path}:".
+    """
+    return hashlib.sha256(f"{repository_id}:{branch_id}:{file_path}:".encode())
+
+
+def _chunk_id(prefix: "hashlib._Hash", chunk_index: int) -> str:
+    """Finish a deterministic chunk ID from a file's prefix hash.
+
+    The ID is the first 16 bytes of sha256(
+    "{repository_id}:{branch_id}:{file_path}:{chunk_index}") formatted
+    as a UUID string; copying the prefix state avoids rehashing the
+    shared part for every chunk.
+
+    Args:
+        prefix: State from _chunk_id_prefix.
+        chunk_index: Chunk index within file.
+
+    Returns:
+        Chunk ID string.
+    """
+    digest = prefix.copy()
+    digest.update(str(chunk_index).encode())
+    h = digest.digest()[:16].hex()
+    # Same as str(uuid.UUID(bytes=...)), without building the UUID object
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _byte_offsets(content: str, chunks: list[Chunk]) -> dict[int, int]:
+    """Map the chunks' character offsets to UTF-8 byte offsets.
+
+    Walks the sorted boundaries once, encoding only the gaps between
+    them, so the file is encoded about once in total rather than once
+    per (overlapping) chunk.
+
+    Args:
+        content: Decoded file content.
+        chunks: Chunks whose start_index/end_index need byte offsets.
+
+    Returns:
+        Byte offset for every character offset the chunks carry.
+    """
+    positions = {
+        offset
+        for chunk in chunks
+        for offset in (chunk.start_index, chunk.end_index)
+        if offset is not None
+    }
+    offsets: dict[int, int] = {}
+    char_pos = byte_pos = 0
+    for position in sorted(positions):
+        byte_pos += len(content[char_pos:position].encode())
+        char_pos = position
+        offsets[position] = byte_pos
+    return offsets
+
+
+def _content_hash(
+    content: str,
+    encoded: memoryview,
+    byte_offsets: dict[int, int] | None,
+    chunk: Chunk,
+) -> str:
+    """Hash a chunk's text, reusing the file's encoded bytes when possible.
+
+    Equivalent to sha256(chunk.text.encode()).hexdigest()[:16]. When the
+    chunk text is exactly content[start:end], its byte range is hashed in
+    place instead of re-encoding the text.
+
+    Args:
+        content: Decoded file content.
+        encoded: View of content's UTF-8 bytes.
+        byte_offsets: Character-to-byte offsets from _byte_offsets, or
+            None when the content is ASCII and they are equal.
+        chunk: Chunk to hash.
+
+    Returns:
+        16 hex characters of the SHA-256 digest.
+    """
+    text = chunk.text
+    start = chunk.start_index
+    end = chunk.end_index
+    if (
+        start is not None
+        and end == start + len(text)
+        and content.startswith(text, start)
+    ):
+        if byte_offsets is not None:
+            start, end = byte_offsets[start], byte_offsets[end]
+        data: bytes | memoryview = encoded[start:end]
+    else:
+        data = text.encode()
+    # SHA-256 rather than BLAKE2b: OpenSSL's SHA-NI path measured about
+    # twice as fast for chunk-sized inputs, and existing hashes stay valid
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def quantize_int8(vector: list[float]) -> tuple[array, float]:
+    """Quantize an embedding to int8 with a symmetric per-vector scale.
+
+    Args:
+        vector: Embedding values.
+
+    Returns:
+        Tuple of the int8 ("b") array and the scale that maps it back,
+        so that vector[i] ~= quantized[i] * scale.
+    """
+    max_abs = max(map(abs, vector), default=0.0)
+    if max_abs == 0.0:
+        return array("b", bytes(len(vector))), 1.0
+    factor = 127.0 / max_abs
+    return array("b", [round(v * factor) for v in vector]), max_abs / 127.0
+
+
+# Per-process service for process_files workers; separate from the
+# _embed_service singleton so workers never share the parent's clients
+_worker_service: EmbedService | None = None
+
+
+def _init_process_worker() -> None:
+    """Build the EmbedService used by a process_files worker."""
+    global _worker_service
+    _worker_service = EmbedService(max_workers=1)
+
+
+def _chunk_file_in_worker(
+    item: tuple[FileInfo, str | None, str, str],
+) -> EmbeddingResult:
+    """Chunk one file's content in a worker process.
+
+    Args:
+        item: (file_info, content, repository_id, branch_id).
+
+    Returns:
+        EmbeddingResult for the file, without embeddings.
+    """
+    service = _worker_service or EmbedService(max_workers=1)
+    return service._chunk_content_of(*item)
 
 
 # Service singleton
@@ -38,7 +38,28 @@ class IndexAction(StrEnum):
     SKIP = "skip"  # Ignore entirely
 
 
-@dataclass
+# Categories that are chunked and indexed when small enough
+_INDEXABLE_CATEGORIES = frozenset(
+    {FileCategory.CODE, FileCategory.DOCUMENTATION, FileCategory.CONFIGURATION}
+)
+
+
+def _path_suffix(name: str) -> str:
+    """Get a file name's extension, matching PurePath.suffix.
+
+    Args:
+        name: File name without directories.
+
+    Returns:
+        Extension including the dot, or "" for none (".bashrc", "file.").
+    """
+    i = name.rfind(".")
+    if 0 < i < len(name) - 1:
+        return name[i:]
+    return ""
+
+
+@dataclass(slots=True)
 class FileInfo:
     """Information about a file for ingestion decisions."""
 
@@ -85,6 +106,17 @@ class FileFilter:
         self.config_extensions = config_extensions
         self.binary_extensions = binary_extensions
 
+        # Extension -> category in one table. Built lowest precedence first
+        # so an extension in several sets keeps the get_category() order.
+        self._ext_category: dict[str, FileCategory] = {}
+        for extensions, category in (
+            (binary_extensions, FileCategory.BINARY),
+            (config_extensions, FileCategory.CONFIGURATION),
+            (doc_extensions, FileCategory.DOCUMENTATION),
+            (code_extensions, FileCategory.CODE),
+        ):
+            self._ext_category.update(dict.fromkeys(extensions, category))
+
     def should_skip_directory(self, dir_name: str) -> bool:
         """Check if a directory should be skipped.
 
@@ -105,18 +137,7 @@ class FileFilter:
         Returns:
             File category.
         """
-        ext_lower = extension.lower()
-
-        if ext_lower in self.code_extensions:
-            return FileCategory.CODE
-        elif ext_lower in self.doc_extensions:
-            return FileCategory.DOCUMENTATION
-        elif ext_lower in self.config_extensions:
-            return FileCategory.CONFIGURATION
-        elif ext_lower in self.binary_extensions:
-            return FileCategory.BINARY
-        else:
-            return FileCategory.UNKNOWN
+        return self._ext_category.get(extension.lower(), FileCategory.UNKNOWN)
 
     def determine_action(
         self,
@@ -135,7 +156,7 @@ class FileFilter:
             Action to take for the file.
         """
         # Skip binary files
-        if category == FileCategory.BINARY:
+        if category is FileCategory.BINARY:
             return IndexAction.SKIP
 
         # Skip files with paths too long
@@ -153,11 +174,7 @@ class FileFilter:
             return IndexAction.CATALOG_ONLY
 
         # Full index for recognized types
-        if category in (
-            FileCategory.CODE,
-            FileCategory.DOCUMENTATION,
-            FileCategory.CONFIGURATION,
-        ):
+        if category in _INDEXABLE_CATEGORIES:
             return IndexAction.FULL_INDEX
 
         # Unknown files get catalog-only
@@ -165,28 +182,37 @@ class FileFilter:
 
     def analyze_file(
         self,
-        file_path: Path,
+        file_path: Path | str,
         relative_path: str,
         size_bytes: int | None = None,
+        file_name: str | None = None,
     ) -> FileInfo:
         """Analyze a file and determine its indexing treatment.
 
+        Works on the path string with os.path so discovery's hot loop can
+        pass scandir paths without building intermediate pathlib objects.
+
         Args:
             file_path: Absolute path to file.
             relative_path: Path relative to repository root.
             size_bytes: File size (will be read if not provided).
+            file_name: Final path component, such as DirEntry.name (taken
+                from file_path if not provided).
 
         Returns:
             FileInfo with category and action.
         """
+        path_str = os.fspath(file_path)
         if size_bytes is None:
             try:
-                size_bytes = file_path.stat().st_size
+                size_bytes = os.stat(path_str).st_size
             except OSError:
                 size_bytes = 0
 
-        extension = file_path.suffix
-        category = self.get_category(extension)
+        if file_name is None:
+            file_name = os.path.basename(path_str)
+        extension = _path_suffix(file_name)
+        category = self._ext_category.get(extension.lower(), FileCategory.UNKNOWN)
         action = self.determine_action(
             size_bytes=size_bytes,
             category=category,
@@ -194,7 +220,7 @@ class FileFilter:
         )
 
         return FileInfo(
-            path=file_path,
+            path=file_path if isinstance(file_path, Path) else Path(path_str),
             relative_path=relative_path,
             size_bytes=size_bytes,
             extension=extension,
@@ -206,6 +232,8 @@ class FileFilter:
 def is_text_file(file_path: Path, sample_size: int = 8192) -> bool:
     """Check if a file appears to be text (not binary).
 
+    Empty files count as text.
+
     Args:
         file_path: Path to file.
         sample_size: Number of bytes to sample.
@@ -216,32 +244,14 @@ def is_text_file(file_path: Path, sample_size: int = 8192) -> bool:
     try:
         with open(file_path, "rb") as f:
             sample = f.read(sample_size)
-
-        # Empty files are text
-        if not sample:
-            return True
-
-        # Check for null bytes (common in binary files)
-        if b"\x00" in sample:
-            return False
-
-        # Try to decode as UTF-8
-        try:
-            sample.decode("utf-8")
-            return True
-        except UnicodeDecodeError:
-            pass
-
-        # Try Latin-1 as fallback
-        try:
-            sample.decode("latin-1")
-            return True
-        except UnicodeDecodeError:
-            return False
-
     except OSError:
         return False
 
+    # Null bytes are common in binary files and rare in text. Anything
+    # else decodes as Latin-1, so no decode attempt can change the answer
+    # and the sample is not run through a codec.
+    return b"\x00" not in sample
+
 
 # Default filter instance
 _default_filter: FileFilter | None = None
@@ -1,44 +1,76 @@
 """Index writer for Meilisearch."""
 
+import asyncio
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any
+
+import orjson
 
 from backend.src.config.logging import get_logger
+from backend.src.config.settings import get_settings
 from backend.src.services.ingestion.embed import EmbeddedChunk, EmbeddingResult
 from backend.src.services.search.index_client import (
     CHUNKS_INDEX,
     MeilisearchClient,
+    branch_filter,
     get_meilisearch_client,
 )
 
 logger = get_logger(__name__)
 
+# Lowercase extension (without dot) -> file_type stored on chunk documents
+_FILE_TYPE_BY_EXTENSION: dict[str, str] = {
+    **dict.fromkeys(
+        (
+            "py",
+            "js",
+            "ts",
+            "jsx",
+            "tsx",
+            "go",
+            "rs",
+            "java",
+            "kt",
+            "c",
+            "cpp",
+            "h",
+            "cs",
+            "rb",
+            "php",
+            "swift",
+            "scala",
+        ),
+        "code",
+    ),
+    **dict.fromkeys(("md", "rst", "txt", "adoc"), "documentation"),
+    **dict.fromkeys(
+        ("json", "yaml", "yml", "toml", "ini", "cfg", "xml"), "configuration"
+    ),
+}
+
+# Estimated JSON bytes for a chunk document's fields other than content
+_DOCUMENT_OVERHEAD_BYTES = 400
+
+# Estimated JSON bytes per embedding value ("-0.012345678901234567,")
+_VECTOR_VALUE_BYTES = 20
+
+# Estimated JSON bytes per int8 embedding value ("-127,")
+_INT8_VALUE_BYTES = 4
 
-@dataclass
-class IndexDocument:
-    """Document to be indexed in Meilisearch."""
-
-    id: str
-    content: str
-    repository_id: str
-    repository_name: str
-    branch_id: str
-    branch_name: str
-    file_path: str
-    line_start: int
-    line_end: int
-    file_type: str
-    chunk_index: int
-    content_hash: str
-    indexed_at: str
-    embedding: list[float] | None = None
-    start_index: int | None = None  # Character offset in original file
-    end_index: int | None = None  # Character offset in original file
-    chunking_mode: str = "token"  # Which chunker produced this chunk
-    language: str | None = None  # Programming language (if detected)
-
-
-@dataclass
+# Batches smaller than this are encoded inline; shipping them to a worker
+# process costs more than encoding them
+_MIN_POOLED_BATCH = 32
+
+# (chunk, file type of its file) pairs, the unit batches are split on
+ChunkBatch = list[tuple[EmbeddedChunk, str]]
+
+_encode_pool: ProcessPoolExecutor | None = None
+
+
+@dataclass(slots=True)
 class IndexWriteResult:
     """Result of an index write operation."""
 
@@ -47,6 +79,195 @@ class IndexWriteResult:
     errors: list[str] = field(default_factory=list)
 
 
+def _categorize_extension(extension: str) -> str:
+    """Categorize file extension into file type.
+
+    Args:
+        extension: File extension without dot.
+
+    Returns:
+        File type category.
+    """
+    return _FILE_TYPE_BY_EXTENSION.get(extension.lower(), "other")
+
+
+def _file_type_for_path(file_path: str) -> str:
+    """Get the document file type for a repository path.
+
+    Args:
+        file_path: Path relative to the repository root.
+
+    Returns:
+        File type category.
+    """
+    extension = file_path.rsplit(".", 1)[-1] if "." in file_path else ""
+    return _categorize_extension(extension)
+
+
+def _chunk_document(
+    chunk: EmbeddedChunk,
+    repository_id: str,
+    repository_name: str,
+    branch_id: str,
+    branch_name: str,
+    file_type: str,
+) -> dict[str, Any]:
+    """Build the Meilisearch document for a chunk.
+
+    Args:
+        chunk: Embedded chunk.
+        repository_id: Repository UUID.
+        repository_name: Repository display name.
+        branch_id: Branch UUID.
+        branch_name: Branch name.
+        file_type: File type of the chunk's file.
+
+    Returns:
+        Document fields keyed as the chunks index expects.
+    """
+    doc: dict[str, Any] = {
+        "id": chunk.id,
+        "content": chunk.content,
+        "repository_id": repository_id,
+        "repository_name": repository_name,
+        "branch_id": branch_id,
+        "branch_name": branch_name,
+        "path": chunk.file_path,
+        "line_start": chunk.line_start,
+        "line_end": chunk.line_end,
+        "file_type": file_type,
+        "chunk_index": chunk.chunk_index,
+        "content_hash": chunk.content_hash,
+        "chunking_mode": chunk.chunking_mode,
+    }
+    # Add optional fields only if they have values
+    if chunk.start_index is not None:
+        doc["start_index"] = chunk.start_index
+    if chunk.end_index is not None:
+        doc["end_index"] = chunk.end_index
+    if chunk.language:
+        doc["language"] = chunk.language
+    if chunk.embedding:
+        # int8 vectors are sent unscaled as small integers, about a fifth
+        # of the JSON of float values; Meilisearch ranks vectors by cosine
+        # similarity, which a positive per-vector scale does not change
+        doc["_vectors"] = {"default": chunk.embedding.tolist()}
+        if chunk.embedding_scale is not None:
+            doc["embedding_scale"] = chunk.embedding_scale
+    return doc
+
+
+def _prepare_encoded_batch(
+    batch: ChunkBatch,
+    repository_id: str,
+    repository_name: str,
+    branch_id: str,
+    branch_name: str,
+) -> bytes:
+    """Build and JSON-encode the documents of a batch.
+
+    This is the CPU-bound part of a write. It is a module-level function of
+    picklable arguments so it can run in a worker process: chunks hold
+    their embeddings as compact arrays and pickle far cheaper than the
+    documents built from them.
+
+    Args:
+        batch: Chunks to encode with the file type of their file.
+        repository_id: Repository UUID.
+        repository_name: Repository display name.
+        branch_id: Branch UUID.
+        branch_name: Branch name.
+
+    Returns:
+        UTF-8 JSON array of documents.
+    """
+    return orjson.dumps(
+        [
+            _chunk_document(
+                chunk,
+                repository_id,
+                repository_name,
+                branch_id,
+                branch_name,
+                file_type,
+            )
+            for chunk, file_type in batch
+        ]
+    )
+
+
+def _get_encode_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Get the process pool used to encode batches, creating it on first use.
+
+    Args:
+        max_workers: Worker processes for a newly created pool.
+
+    Returns:
+        Shared ProcessPoolExecutor.
+    """
+    global _encode_pool
+    if _encode_pool is None:
+        _encode_pool = ProcessPoolExecutor(max_workers=max_workers)
+    return _encode_pool
+
+
+def _estimate_chunk_bytes(chunk: EmbeddedChunk) -> int:
+    """Estimate the encoded JSON size of a chunk's document without building it.
+
+    Args:
+        chunk: Embedded chunk.
+
+    Returns:
+        Approximate size in bytes: content plus fixed field overhead plus
+        the JSON text of the embedding values.
+    """
+    size = len(chunk.content) + _DOCUMENT_OVERHEAD_BYTES
+    if chunk.embedding:
+        value_bytes = (
+            _INT8_VALUE_BYTES
+            if chunk.embedding_scale is not None
+            else _VECTOR_VALUE_BYTES
+        )
+        size += value_bytes * len(chunk.embedding)
+    return size
+
+
+def _iter_size_limited_batches(
+    chunks: Iterable[tuple[EmbeddedChunk, str]],
+    max_bytes: int,
+    max_docs: int,
+) -> Iterator[tuple[int, ChunkBatch]]:
+    """Split chunks into batches capped by count and estimated document size.
+
+    A batch ends when adding the next chunk would exceed max_bytes or when
+    it holds max_docs chunks. A single chunk larger than max_bytes still
+    gets a batch of its own. Chunks are consumed lazily, so only the batch
+    being filled is held here.
+
+    Args:
+        chunks: (chunk, file type) pairs in write order.
+        max_bytes: Estimated payload size limit per batch.
+        max_docs: Document count limit per batch.
+
+    Yields:
+        Tuples of (index of the first chunk, batch).
+    """
+    batch: ChunkBatch = []
+    batch_start = 0
+    batch_bytes = 0
+    for item in chunks:
+        chunk_bytes = _estimate_chunk_bytes(item[0])
+        if batch and (len(batch) >= max_docs or batch_bytes + chunk_bytes > max_bytes):
+            yield batch_start, batch
+            batch_start += len(batch)
+            batch = []
+            batch_bytes = 0
+        batch.append(item)
+        batch_bytes += chunk_bytes
+    if batch:
+        yield batch_start, batch
+
+
 class IndexWriter:
     """Write documents to Meilisearch index."""
 
@@ -54,15 +275,27 @@ class IndexWriter:
         self,
         client: MeilisearchClient | None = None,
         index_name: str | None = None,
+        max_batch_docs: int | None = None,
+        max_batch_bytes: int | None = None,
     ):
         """Initialize index writer.
 
         Args:
             client: Meilisearch client instance.
             index_name: Name of the index to write to. Defaults to CHUNKS_INDEX.
+            max_batch_docs: Most documents per add-documents request.
+                Defaults to the meilisearch_chunk_batch_docs setting.
+            max_batch_bytes: Estimated payload size at which a batch is
+                sent early. Defaults to the meilisearch_chunk_batch_bytes
+                setting.
         """
+        settings = get_settings()
         self.client = client or get_meilisearch_client()
         self.index_name = index_name or CHUNKS_INDEX
+        self.concurrency = settings.meilisearch_write_concurrency
+        self.encode_processes = settings.meilisearch_encode_processes
+        self.max_batch_docs = max_batch_docs or settings.meilisearch_chunk_batch_docs
+        self.max_batch_bytes = max_batch_bytes or settings.meilisearch_chunk_batch_bytes
 
     async def write_embedding_results(
         self,
@@ -85,52 +318,66 @@ class IndexWriter:
             IndexWriteResult with counts and errors.
         """
         write_result = IndexWriteResult()
-        documents = []
-        indexed_at = datetime.now(timezone.utc).isoformat()
-
-        for result in results:
-            if result.error:
-                write_result.errors.append(
-                    f"Skipping {result.file_path}: {result.error}"
-                )
-                continue
-
-            for chunk in result.chunks:
-                doc = self._create_document(
-                    chunk=chunk,
-                    repository_id=repository_id,
-                    repository_name=repository_name,
-                    branch_id=branch_id,
-                    branch_name=branch_name,
-                    indexed_at=indexed_at,
-                )
-                documents.append(doc)
+        batches = _iter_size_limited_batches(
+            self._iter_chunks(results, write_result),
+            self.max_batch_bytes,
+            self.max_batch_docs,
+        )
+        document_fields = (repository_id, repository_name, branch_id, branch_name)
+        loop = asyncio.get_running_loop()
+        pool = (
+            _get_encode_pool(self.encode_processes) if self.encode_processes else None
+        )
 
-        if not documents:
-            logger.warning("No documents to index")
-            return write_result
+        # Write batches as they fill, up to self.concurrency in flight.
+        # Acquiring the semaphore before building the next batch bounds
+        # memory to the batches in flight. Meilisearch applies writes on
+        # a single thread, so more than a few concurrent batches mostly
+        # just queue on the server. With a process pool, encoding of
+        # later batches overlaps the upload of earlier ones.
+        semaphore = asyncio.Semaphore(self.concurrency)
 
-        # Write documents in batches
-        batch_size = 100
-        for i in range(0, len(documents), batch_size):
-            batch = documents[i : i + batch_size]
+        async def send_batch(batch_start: int, batch: ChunkBatch) -> None:
             try:
-                await self._write_batch(batch)
-                write_result.documents_indexed += len(batch)
-                logger.debug(
-                    "Batch indexed",
-                    batch_size=len(batch),
-                    total_indexed=write_result.documents_indexed,
-                )
+                if pool is not None and len(batch) >= _MIN_POOLED_BATCH:
+                    body = await loop.run_in_executor(
+                        pool, _prepare_encoded_batch, batch, *document_fields
+                    )
+                else:
+                    body = _prepare_encoded_batch(batch, *document_fields)
+                await self._write_batch(body)
             except Exception as e:
                 write_result.documents_failed += len(batch)
                 write_result.errors.append(f"Batch write failed: {e}")
                 logger.error(
                     "Batch write failed",
-                    batch_start=i,
+                    batch_start=batch_start,
                     batch_size=len(batch),
                     error=str(e),
                 )
+                return
+            finally:
+                semaphore.release()
+            write_result.documents_indexed += len(batch)
+            logger.debug(
+                "Batch indexed",
+                batch_size=len(batch),
+                total_indexed=write_result.documents_indexed,
+            )
+
+        tasks = []
+        while True:
+            await semaphore.acquire()
+            next_batch = next(batches, None)
+            if next_batch is None:
+                semaphore.release()
+                break
+            tasks.append(asyncio.create_task(send_batch(*next_batch)))
+        await asyncio.gather(*tasks)
+
+        if not tasks:
+            logger.warning("No documents to index")
+            return write_result
 
         logger.info(
             "Index write complete",
@@ -141,135 +388,44 @@ class IndexWriter:
 
         return write_result
 
-    def _create_document(
+    def _iter_chunks(
         self,
-        chunk: EmbeddedChunk,
-        repository_id: str,
-        repository_name: str,
-        branch_id: str,
-        branch_name: str,
-        indexed_at: str,
-    ) -> IndexDocument:
-        """Create an index document from a chunk.
+        results: list[EmbeddingResult],
+        write_result: IndexWriteResult,
+    ) -> Iterator[tuple[EmbeddedChunk, str]]:
+        """Yield every chunk of the successful results with its file type.
+
+        Failed results are recorded in write_result.errors and skipped.
 
         Args:
-            chunk: Embedded chunk.
-            repository_id: Repository UUID.
-            repository_name: Repository display name.
-            branch_id: Branch UUID.
-            branch_name: Branch name.
-            indexed_at: Index timestamp.
+            results: List of embedding results from processing.
+            write_result: Result to record skipped files on.
 
-        Returns:
-            IndexDocument ready for indexing.
+        Yields:
+            (chunk, file type) pairs in result and chunk order.
         """
-        # Determine file type from extension
-        extension = chunk.file_path.rsplit(".", 1)[-1] if "." in chunk.file_path else ""
-        file_type = self._categorize_extension(extension)
-
-        return IndexDocument(
-            id=chunk.id,
-            content=chunk.content,
-            repository_id=repository_id,
-            repository_name=repository_name,
-            branch_id=branch_id,
-            branch_name=branch_name,
-            file_path=chunk.file_path,
-            line_start=chunk.line_start,
-            line_end=chunk.line_end,
-            file_type=file_type,
-            chunk_index=chunk.chunk_index,
-            content_hash=chunk.content_hash,
-            indexed_at=indexed_at,
-            embedding=chunk.embedding,
-            start_index=chunk.start_index,
-            end_index=chunk.end_index,
-            chunking_mode=chunk.chunking_mode,
-            language=chunk.language,
-        )
-
-    def _categorize_extension(self, extension: str) -> str:
-        """Categorize file extension into file type.
+        for result in results:
+            if result.error:
+                write_result.errors.append(
+                    f"Skipping {result.file_path}: {result.error}"
+                )
+                continue
 
-        Args:
-            extension: File extension without dot.
+            # Every chunk of a result comes from the same file
+            file_type = _file_type_for_path(result.file_path)
+            for chunk in result.chunks:
+                yield chunk, file_type
 
-        Returns:
-            File type category.
-        """
-        code_exts = {
-            "py",
-            "js",
-            "ts",
-            "jsx",
-            "tsx",
-            "go",
-            "rs",
-            "java",
-            "kt",
-            "c",
-            "cpp",
-            "h",
-            "cs",
-            "rb",
-            "php",
-            "swift",
-            "scala",
-        }
-        doc_exts = {"md", "rst", "txt", "adoc"}
-        config_exts = {"json", "yaml", "yml", "toml", "ini", "cfg", "xml"}
-
-        ext_lower = extension.lower()
-        if ext_lower in code_exts:
-            return "code"
-        elif ext_lower in doc_exts:
-            return "documentation"
-        elif ext_lower in config_exts:
-            return "configuration"
-        else:
-            return "other"
-
-    async def _write_batch(self, documents: list[IndexDocument]) -> None:
-        """Write a batch of documents to the index.
+    async def _write_batch(self, body: bytes) -> None:
+        """Write an encoded batch of documents to the index.
 
         Args:
-            documents: Documents to write.
+            body: UTF-8 JSON array of documents.
 
         Raises:
             Exception: If write fails.
         """
-        # Convert to dicts for Meilisearch
-        docs_dict = []
-        for doc in documents:
-            doc_dict = {
-                "id": doc.id,
-                "content": doc.content,
-                "repository_id": doc.repository_id,
-                "repository_name": doc.repository_name,
-                "branch_id": doc.branch_id,
-                "branch_name": doc.branch_name,
-                "path": doc.file_path,
-                "line_start": doc.line_start,
-                "line_end": doc.line_end,
-                "file_type": doc.file_type,
-                "chunk_index": doc.chunk_index,
-                "content_hash": doc.content_hash,
-                "indexed_at": doc.indexed_at,
-                "chunking_mode": doc.chunking_mode,
-            }
-            # Add optional fields only if they have values
-            if doc.start_index is not None:
-                doc_dict["start_index"] = doc.start_index
-            if doc.end_index is not None:
-                doc_dict["end_index"] = doc.end_index
-            if doc.language:
-                doc_dict["language"] = doc.language
-            if doc.embedding:
-                doc_dict["_vectors"] = {"default": doc.embedding}
-            docs_dict.append(doc_dict)
-
-        # Write to Meilisearch
-        await self.client.add_documents(self.index_name, docs_dict)
+        await self.client.add_documents_raw(self.index_name, body)
 
     async def delete_branch_documents(
         self,
@@ -292,7 +448,7 @@ class IndexWriter:
         )
 
         # Use filter to delete matching documents
-        filter_str = f"repository_id = '{repository_id}' AND branch_id = '{branch_id}'"
+        filter_str = branch_filter(repository_id, branch_id)
         deleted = await self.client.delete_documents_by_filter(
             self.index_name, filter_str
         )
@@ -331,37 +487,24 @@ class IndexWriter:
             IndexWriteResult with counts and errors.
         """
         write_result = IndexWriteResult()
-        documents = []
-        indexed_at = datetime.now(timezone.utc).isoformat()
-
-        for result in results:
-            if result.error:
-                write_result.errors.append(
-                    f"Skipping {result.file_path}: {result.error}"
-                )
-                continue
-
-            for chunk in result.chunks:
-                doc = self._create_document(
-                    chunk=chunk,
-                    repository_id=repository_id,
-                    repository_name=repository_name,
-                    branch_id=branch_id,
-                    branch_name=branch_name,
-                    indexed_at=indexed_at,
-                )
-                documents.append(doc)
-
-        if not documents:
-            logger.warning("No documents to index (sync)")
-            return write_result
+        batches = _iter_size_limited_batches(
+            self._iter_chunks(results, write_result),
+            self.max_batch_bytes,
+            self.max_batch_docs,
+        )
 
-        # Write documents in batches
-        batch_size = 100
-        for i in range(0, len(documents), batch_size):
-            batch = documents[i : i + batch_size]
+        # Write batches as they fill; only one batch of documents is alive.
+        # Encoding stays inline: Celery prefork workers are daemonic and
+        # cannot start the processes of an encode pool.
+        batch_count = 0
+        for batch_start, batch in batches:
+            batch_count += 1
             try:
-                self._write_batch_sync(batch)
+                self._write_batch_sync(
+                    _prepare_encoded_batch(
+                        batch, repository_id, repository_name, branch_id, branch_name
+                    )
+                )
                 write_result.documents_indexed += len(batch)
                 logger.debug(
                     "Batch indexed (sync)",
@@ -373,11 +516,15 @@ class IndexWriter:
                 write_result.errors.append(f"Batch write failed: {e}")
                 logger.error(
                     "Batch write failed (sync)",
-                    batch_start=i,
+                    batch_start=batch_start,
                     batch_size=len(batch),
                     error=str(e),
                 )
 
+        if batch_count == 0:
+            logger.warning("No documents to index (sync)")
+            return write_result
+
         logger.info(
             "Index write complete (sync)",
             documents_indexed=write_result.documents_indexed,
@@ -387,47 +534,16 @@ class IndexWriter:
 
         return write_result
 
-    def _write_batch_sync(self, documents: list[IndexDocument]) -> None:
-        """Write a batch of documents to the index (synchronous).
+    def _write_batch_sync(self, body: bytes) -> None:
+        """Write an encoded batch of documents to the index (synchronous).
 
         Args:
-            documents: Documents to write.
+            body: UTF-8 JSON array of documents.
 
         Raises:
             Exception: If write fails.
         """
-        # Convert to dicts for Meilisearch
-        docs_dict = []
-        for doc in documents:
-            doc_dict = {
-                "id": doc.id,
-                "content": doc.content,
-                "repository_id": doc.repository_id,
-                "repository_name": doc.repository_name,
-                "branch_id": doc.branch_id,
-                "branch_name": doc.branch_name,
-                "path": doc.file_path,
-                "line_start": doc.line_start,
-                "line_end": doc.line_end,
-                "file_type": doc.file_type,
-                "chunk_index": doc.chunk_index,
-                "content_hash": doc.content_hash,
-                "indexed_at": doc.indexed_at,
-                "chunking_mode": doc.chunking_mode,
-            }
-            # Add optional fields only if they have values
-            if doc.start_index is not None:
-                doc_dict["start_index"] = doc.start_index
-            if doc.end_index is not None:
-                doc_dict["end_index"] = doc.end_index
-            if doc.language:
-                doc_dict["language"] = doc.language
-            if doc.embedding:
-                doc_dict["_vectors"] = {"default": doc.embedding}
-            docs_dict.append(doc_dict)
-
-        # Write to Meilisearch
-        self.client.add_documents_sync(self.index_name, docs_dict)
+        self.client.add_documents_raw_sync(self.index_name, body)
 
     def delete_branch_documents_sync(
         self,
@@ -450,7 +566,7 @@ class IndexWriter:
         )
 
         # Use filter to delete matching documents
-        filter_str = f"repository_id = '{repository_id}' AND branch_id = '{branch_id}'"
+        filter_str = branch_filter(repository_id, branch_id)
         deleted = self.client.delete_documents_by_filter_sync(
             self.index_name, filter_str
         )
@@ -465,13 +581,18 @@ class IndexWriter:
         return deleted
 
 
-# Service singleton
-_index_writer: IndexWriter | None = None
+# Service singletons, one per index
+@lru_cache(maxsize=8)
+def get_index_writer(index_name: str = CHUNKS_INDEX) -> IndexWriter:
+    """Get the index writer for an index.
+
+    One writer is kept per index name, and all of them share the
+    Meilisearch client singleton.
 
+    Args:
+        index_name: Name of the index to write to (without prefix).
 
-def get_index_writer() -> IndexWriter:
-    """Get index writer singleton."""
-    global _index_writer
-    if _index_writer is None:
-        _index_writer = IndexWriter()
-    return _index_writer
+    Returns:
+        IndexWriter for the index.
+    """
+    return IndexWriter(index_name=index_name)
@@ -1,14 +1,23 @@
 """Listing service for aggregating repositories/branches with freshness status."""
 
+import asyncio
+import time
 import uuid
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 
+from sqlalchemy import Select, func, select
+
 from backend.src.config.constants import FRESHNESS_STALE_THRESHOLD_HOURS
 from backend.src.config.logging import get_logger
-from backend.src.models.repository import AccessState
+from backend.src.config.settings import get_settings
+from backend.src.db.session import get_session_context
+from backend.src.models.branch import Branch
+from backend.src.models.notification import Notification, NotificationStatus
+from backend.src.models.repository import AccessState, Repository
 
 logger = get_logger(__name__)
 
@@ -50,6 +59,33 @@ class RepositoryInfo:
 class ListingService:
     """Service for listing repositories and branches with status aggregation."""
 
+    def __init__(self) -> None:
+        """Initialize the service with an empty listing cache.
+
+        Listings are cached per set of requested repository IDs for
+        listing_cache_ttl_seconds. Writes made in this process invalidate
+        the affected entries; writes from ingestion workers show up once
+        the entry expires. Cached lists are shared between callers and
+        must not be mutated.
+        """
+        self.cache_ttl = get_settings().listing_cache_ttl_seconds
+        self._cache: dict[tuple[str, ...], tuple[float, list[RepositoryInfo]]] = {}
+        self._cache_locks: dict[tuple[str, ...], asyncio.Lock] = {}
+
+    def invalidate(self, repository_id: str | uuid.UUID | None = None) -> None:
+        """Drop cached listings that include a repository.
+
+        Args:
+            repository_id: Repository whose data changed. Listings of all
+                repositories always include it. None drops every entry.
+        """
+        if repository_id is None:
+            self._cache.clear()
+            return
+        rid = str(repository_id)
+        for key in [k for k in self._cache if not k or rid in k]:
+            del self._cache[key]
+
     async def list_repositories(
         self,
         repository_ids: list[str] | None = None,
@@ -68,20 +104,30 @@ class ListingService:
             filter_ids=repository_ids,
         )
 
-        # In a real implementation, this would query the database with
-        # aggregations for freshness and backlog counts
-        #
-        # SELECT r.*, 
-        #     COUNT(n.id) FILTER (WHERE n.status = 'pending') as backlog_size,
-        #     MAX(b.last_indexed_at) as last_indexed_at
-        # FROM repositories r
-        # LEFT JOIN branches b ON b.repository_id = r.id
-        # LEFT JOIN notifications n ON n.repository_id = r.id
-        # WHERE (repository_ids IS NULL OR r.id IN :repository_ids)
-        # GROUP BY r.id
-
-        # Placeholder - in production, query and aggregate from database
-        return []
+        if self.cache_ttl <= 0:
+            return await self._query_repositories(_parse_ids(repository_ids))
+
+        key = tuple(sorted(repository_ids or ()))
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+
+        # Single-flight: concurrent misses for a key wait for one query
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._cache.get(key)
+            if entry is not None and time.monotonic() < entry[0]:
+                return entry[1]
+            repositories = await self._query_repositories(_parse_ids(repository_ids))
+            now = time.monotonic()
+            # Drop expired entries so keys of past callers do not pile up
+            for stale in [
+                k for k, (expires, _) in self._cache.items() if expires <= now
+            ]:
+                del self._cache[stale]
+                self._cache_locks.pop(stale, None)
+            self._cache[key] = (now + self.cache_ttl, repositories)
+            return repositories
 
     async def get_repository_with_branches(
         self,
@@ -100,15 +146,68 @@ class ListingService:
             repository_id=str(repository_id),
         )
 
-        # In a real implementation:
-        # repo = await session.get(Repository, repository_id)
-        # if not repo:
-        #     return None
-        #
-        # branches = await self._get_branches_with_status(repository_id)
-        # return self._build_repository_info(repo, branches)
+        repositories = await self._query_repositories([repository_id])
+        return repositories[0] if repositories else None
 
-        return None
+    async def _query_repositories(
+        self,
+        repository_ids: list[uuid.UUID] | None,
+    ) -> list[RepositoryInfo]:
+        """Load repositories with branch status in one round trip.
+
+        Args:
+            repository_ids: Repositories to load, or None for all.
+
+        Returns:
+            RepositoryInfo per repository, ordered by name.
+        """
+        async with get_session_context() as session:
+            result = await session.execute(_listing_query(repository_ids))
+            return self._build_repositories(result.all())
+
+    def _build_repositories(self, rows: Sequence[Any]) -> list[RepositoryInfo]:
+        """Group listing query rows into repositories in a single pass.
+
+        Args:
+            rows: Rows from _listing_query, one per branch (or one with no
+                branch columns for a repository without branches), grouped
+                by repository.
+
+        Returns:
+            RepositoryInfo per repository in row order.
+        """
+        repositories: dict[uuid.UUID, RepositoryInfo] = {}
+        for row in rows:
+            repo = repositories.get(row.id)
+            if repo is None:
+                repo = repositories[row.id] = RepositoryInfo(
+                    id=str(row.id),
+                    name=row.name,
+                    default_branch=row.default_branch,
+                    freshness_status=FreshnessStatus.UNKNOWN,
+                    last_indexed_at=row.repository_last_indexed_at,
+                    backlog_size=row.repository_backlog,
+                    branches=[],
+                )
+            if row.branch_name is None:
+                continue
+            repo.branches.append(
+                BranchInfo(
+                    name=row.branch_name,
+                    is_default=row.is_default,
+                    freshness_status=self.compute_freshness_status(
+                        row.branch_last_indexed_at,
+                        row.access_state,
+                        row.branch_backlog,
+                    ),
+                    last_indexed_at=row.branch_last_indexed_at,
+                    backlog_size=row.branch_backlog,
+                )
+            )
+
+        for repo in repositories.values():
+            repo.freshness_status = self.aggregate_repository_status(repo.branches)
+        return list(repositories.values())
 
     async def get_branch_status(
         self,
@@ -204,6 +303,84 @@ class ListingService:
         return worst_status
 
 
+def _parse_ids(repository_ids: list[str] | None) -> list[uuid.UUID] | None:
+    """Convert requested repository IDs to UUIDs, or None for all.
+
+    Args:
+        repository_ids: Repository IDs as strings, or None/empty for all.
+
+    Returns:
+        UUIDs to filter by, or None.
+    """
+    return [uuid.UUID(rid) for rid in repository_ids] if repository_ids else None
+
+
+def _listing_query(repository_ids: list[uuid.UUID] | None) -> Select[Any]:
+    """Build the query returning every repository with its branches' status.
+
+    Pending notifications are counted per branch and per repository in
+    grouped subqueries, so joining them does not
+    multiply rows. Notifications without a branch count toward the
+    repository backlog only.
+
+    Args:
+        repository_ids: Repositories to include, or None for all.
+
+    Returns:
+        Select yielding one row per branch, and one row with null branch
+        columns for a repository without branches.
+    """
+    pending = [Notification.status == NotificationStatus.PENDING]
+    if repository_ids is not None:
+        # Repeat the filter so the subqueries only count the listed repositories
+        pending.append(Notification.repository_id.in_(repository_ids))
+    branch_pending = (
+        select(
+            Notification.branch_id,
+            func.count().label("backlog"),
+        )
+        .where(*pending, Notification.branch_id.is_not(None))
+        .group_by(Notification.branch_id)
+        .subquery()
+    )
+    repository_pending = (
+        select(
+            Notification.repository_id,
+            func.count().label("backlog"),
+        )
+        .where(*pending)
+        .group_by(Notification.repository_id)
+        .subquery()
+    )
+
+    query = (
+        select(
+            Repository.id,
+            Repository.name,
+            Repository.default_branch,
+            Repository.access_state,
+            func.coalesce(repository_pending.c.backlog, 0).label("repository_backlog"),
+            func.max(Branch.last_indexed_at)
+            .over(partition_by=Repository.id)
+            .label("repository_last_indexed_at"),
+            Branch.name.label("branch_name"),
+            Branch.is_default,
+            Branch.last_indexed_at.label("branch_last_indexed_at"),
+            func.coalesce(branch_pending.c.backlog, 0).label("branch_backlog"),
+        )
+        .outerjoin(Branch, Branch.repository_id == Repository.id)
+        .outerjoin(branch_pending, branch_pending.c.branch_id == Branch.id)
+        .outerjoin(
+            repository_pending,
+            repository_pending.c.repository_id == Repository.id,
+        )
+        .order_by(Repository.name, Repository.id, Branch.name)
+    )
+    if repository_ids is not None:
+        query = query.where(Repository.id.in_(repository_ids))
+    return query
+
+
 # Singleton instance
 _listing_service: ListingService | None = None
 
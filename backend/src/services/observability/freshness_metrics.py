@@ -1,15 +1,25 @@
 """Freshness and backlog metrics for observability."""
 
+import asyncio
+import uuid
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+from sqlalchemy import func, select
+from sqlalchemy.orm import selectinload
+
 from backend.src.config.constants import (
     BACKLOG_CRITICAL_THRESHOLD,
     BACKLOG_WARNING_THRESHOLD,
     NOTIFICATION_TO_INDEX_MINUTES,
 )
 from backend.src.config.logging import get_logger
+from backend.src.config.settings import get_settings
+from backend.src.db.session import get_session_context
+from backend.src.models.notification import Notification, NotificationStatus
+from backend.src.models.repository import Repository
 
 logger = get_logger(__name__)
 
@@ -65,6 +75,7 @@ class FreshnessMetrics:
         freshness_window_minutes: int = NOTIFICATION_TO_INDEX_MINUTES,
         backlog_warning: int = BACKLOG_WARNING_THRESHOLD,
         backlog_critical: int = BACKLOG_CRITICAL_THRESHOLD,
+        max_concurrent: int | None = None,
     ):
         """Initialize metrics service.
 
@@ -72,10 +83,14 @@ class FreshnessMetrics:
             freshness_window_minutes: Minutes before considered stale.
             backlog_warning: Pending count for warning status.
             backlog_critical: Pending count for critical status.
+            max_concurrent: Repositories whose metrics are fetched at once
+                for the summary. Defaults to the database pool size, since
+                more concurrent sessions would only wait for a connection.
         """
         self.freshness_window_minutes = freshness_window_minutes
         self.backlog_warning = backlog_warning
         self.backlog_critical = backlog_critical
+        self.max_concurrent = max_concurrent or get_settings().database_pool_size
 
     def compute_freshness_status(
         self,
@@ -158,28 +173,115 @@ class FreshnessMetrics:
         Returns:
             RepositoryMetrics or None if not found.
         """
-        # TODO: Query database for repository details
-        # This would aggregate data from repositories, branches, and notifications
         logger.debug("Fetching repository metrics", repository_id=repository_id)
-        return None
+
+        repo_uuid = uuid.UUID(repository_id)
+        async with get_session_context() as session:
+            result = await session.execute(
+                select(Repository)
+                .options(selectinload(Repository.branches))
+                .where(Repository.id == repo_uuid)
+            )
+            repository = result.scalar_one_or_none()
+            if repository is None:
+                return None
+
+            counts = await session.execute(
+                select(
+                    Notification.branch_id,
+                    Notification.status,
+                    func.count(),
+                )
+                .where(
+                    Notification.repository_id == repo_uuid,
+                    Notification.status.in_(
+                        (NotificationStatus.PENDING, NotificationStatus.PROCESSING)
+                    ),
+                )
+                .group_by(Notification.branch_id, Notification.status)
+            )
+
+        # Keyed by branch ID; notifications without a branch are keyed None
+        # and count toward the repository only
+        pending: Counter[uuid.UUID | None] = Counter()
+        processing: Counter[uuid.UUID | None] = Counter()
+        for branch_id, status, count in counts:
+            if status == NotificationStatus.PENDING:
+                pending[branch_id] += count
+            else:
+                processing[branch_id] += count
+
+        branches = [
+            BranchMetrics(
+                branch_id=str(branch.id),
+                branch_name=branch.name,
+                is_default=branch.is_default,
+                freshness=self.compute_freshness_status(branch.last_indexed_at),
+                backlog=self.compute_backlog_status(
+                    pending[branch.id], processing[branch.id]
+                ),
+            )
+            for branch in sorted(repository.branches, key=lambda b: b.name)
+        ]
+        last_indexed_at = max(
+            (b.last_indexed_at for b in repository.branches if b.last_indexed_at),
+            default=None,
+        )
+
+        return RepositoryMetrics(
+            repository_id=str(repository.id),
+            repository_name=repository.name,
+            freshness=self.compute_freshness_status(last_indexed_at),
+            backlog=self.compute_backlog_status(
+                sum(pending.values()), sum(processing.values())
+            ),
+            branches=branches,
+        )
 
     async def get_all_metrics_summary(self) -> dict[str, Any]:
         """Get summary metrics across all repositories.
 
+        Repository metrics are fetched concurrently, at most
+        max_concurrent at a time.
+
         Returns:
             Aggregated metrics summary.
         """
         logger.debug("Fetching all repository metrics")
 
-        # TODO: Query database for aggregated metrics
+        async with get_session_context() as session:
+            result = await session.execute(select(Repository.id))
+            repository_ids = result.scalars().all()
+
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        async def fetch(repository_id: uuid.UUID) -> RepositoryMetrics | None:
+            async with semaphore:
+                return await self.get_repository_metrics(str(repository_id))
+
+        all_metrics = await asyncio.gather(*(fetch(rid) for rid in repository_ids))
+
+        freshness_counts: Counter[str] = Counter()
+        pending_count = 0
+        processing_count = 0
+        for metrics in all_metrics:
+            # A repository deleted after the ID query has no metrics
+            if metrics is None:
+                continue
+            freshness_counts[metrics.freshness.status] += 1
+            pending_count += metrics.backlog.pending_count
+            processing_count += metrics.backlog.processing_count
+
         return {
-            "total_repositories": 0,
-            "repositories_fresh": 0,
-            "repositories_stale": 0,
-            "repositories_critical": 0,
-            "total_pending_notifications": 0,
-            "total_processing_notifications": 0,
-            "backlog_status": "healthy",
+            "total_repositories": freshness_counts.total(),
+            "repositories_fresh": freshness_counts["fresh"],
+            "repositories_stale": freshness_counts["stale"],
+            "repositories_critical": freshness_counts["critical"],
+            "total_pending_notifications": pending_count,
+            "total_processing_notifications": processing_count,
+            "backlog_status": self.compute_backlog_status(
+                pending_count, processing_count
+            ).status,
         }
 
     def emit_metrics(
@@ -18,6 +18,7 @@ from backend.src.models.notification import (
 )
 from backend.src.models.repository import AccessState, AuthType, Repository
 from backend.src.services.git.operations import GitCredentials
+from backend.src.services.listing_service import get_listing_service
 
 logger = get_logger(__name__)
 
@@ -88,6 +89,8 @@ class RepositoryService:
             repo_id = str(repository.id)
             branch_id = str(default_branch_record.id)
 
+        get_listing_service().invalidate(repo_id)
+
         # Trigger initial ingestion for the new repository (outside the session)
         from backend.src.workers.tasks.ingestion import full_reindex_repository
 
@@ -208,6 +211,7 @@ class RepositoryService:
                 .where(Repository.id == repository_id)
                 .values(access_state=state, updated_at=datetime.now(timezone.utc))
             )
+        get_listing_service().invalidate(repository_id)
 
     async def get_branch(self, branch_id: uuid.UUID) -> Branch | None:
         """Get branch by ID.
@@ -444,7 +448,9 @@ class NotificationService:
                 repository_id=str(repository_id),
             )
 
-            return notification
+        # The new pending notification changes the repository's backlog
+        get_listing_service().invalidate(repository_id)
+        return notification
 
     async def _find_by_event_id(
         self,
@@ -1,7 +1,9 @@
 """Chonkie-based chunking and embedding utility with AST-aware CodeChunker support."""
 
+from bisect import bisect_left
 from dataclasses import dataclass
 from enum import StrEnum
+from functools import lru_cache
 from typing import Any
 
 from chonkie import TokenChunker  # type: ignore[attr-defined]
@@ -79,9 +81,13 @@ EXTENSION_TO_LANGUAGE: dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=1024)
 def get_language_from_extension(extension: str) -> str | None:
     """Get tree-sitter language name from file extension.
 
+    Cached: repositories draw extensions from a small set, so nearly every
+    call after the first few is a hit.
+
     Args:
         extension: File extension including dot (e.g., ".py").
 
@@ -109,7 +115,7 @@ def get_language_from_mode(mode: str) -> str | None:
     return None
 
 
-@dataclass
+@dataclass(slots=True)
 class ChunkResult:
     """Result of chunking a document."""
 
@@ -195,30 +201,54 @@ def _get_code_chunker(
     )
 
 
+def _newline_offsets(text: str) -> list[int]:
+    """Find the character offset of every newline in a text.
+
+    Args:
+        text: Text to scan.
+
+    Returns:
+        Sorted newline offsets.
+    """
+    offsets: list[int] = []
+    find = text.find
+    position = find("\n")
+    while position != -1:
+        offsets.append(position)
+        position = find("\n", position + 1)
+    return offsets
+
+
 def _calculate_line_numbers(
     full_text: str,
     chunk_start_char: int,
     chunk_end_char: int,
+    newline_offsets: list[int] | None = None,
 ) -> tuple[int, int]:
     """Calculate line numbers for a chunk within the full text.
 
+    Line numbers are found by bisecting the text's newline offsets, so
+    callers chunking one text should compute them once with
+    _newline_offsets and pass them for every chunk.
+
     Args:
         full_text: The complete text content.
         chunk_start_char: Character position where chunk starts.
         chunk_end_char: Character position where chunk ends.
+        newline_offsets: Precomputed _newline_offsets(full_text).
 
     Returns:
         Tuple of (start_line, end_line) both 1-indexed.
     """
-    # Count newlines before chunk start to get starting line
-    text_before = full_text[:chunk_start_char]
-    start_line = text_before.count("\n") + 1
+    if newline_offsets is None:
+        newline_offsets = _newline_offsets(full_text)
 
-    # Count newlines within chunk to get ending line
-    chunk_text = full_text[chunk_start_char:chunk_end_char]
-    end_line = start_line + chunk_text.count("\n")
+    # Newlines before chunk start give the starting line, newlines before
+    # chunk end the ending line
+    start_line = bisect_left(newline_offsets, chunk_start_char) + 1
+    end_line = bisect_left(newline_offsets, chunk_end_char) + 1
 
-    return start_line, end_line
+    return start_line, max(start_line, end_line)
 
 
 def _chunk_with_token_chunker(
@@ -262,6 +292,7 @@ def _chunk_with_token_chunker(
 
     results: list[ChunkResult] = []
     current_position = 0
+    newline_offsets = _newline_offsets(content)
 
     for chunk in chunks[:max_chunks]:
         chunk_text_content = chunk.text
@@ -274,7 +305,9 @@ def _chunk_with_token_chunker(
         chunk_end = chunk_start + len(chunk_text_content)
         current_position = chunk_start + 1
 
-        start_line, end_line = _calculate_line_numbers(content, chunk_start, chunk_end)
+        start_line, end_line = _calculate_line_numbers(
+            content, chunk_start, chunk_end, newline_offsets
+        )
 
         results.append(
             ChunkResult(
@@ -316,12 +349,15 @@ def _chunk_with_code_chunker(
     chunks = chunker.chunk(content)
 
     results: list[ChunkResult] = []
+    newline_offsets = _newline_offsets(content)
     for chunk in chunks[:max_chunks]:
         # CodeChunker provides start_index and end_index directly
         chunk_start = getattr(chunk, "start_index", 0)
         chunk_end = getattr(chunk, "end_index", len(chunk.text))
 
-        start_line, end_line = _calculate_line_numbers(content, chunk_start, chunk_end)
+        start_line, end_line = _calculate_line_numbers(
+            content, chunk_start, chunk_end, newline_offsets
+        )
 
         results.append(
             ChunkResult(
@@ -493,6 +529,17 @@ def estimate_token_count(text: str) -> int:
 class Chunk:
     """A chunk of text with optional embedding."""
 
+    __slots__ = (
+        "text",
+        "token_count",
+        "embedding",
+        "line_start",
+        "line_end",
+        "start_index",
+        "end_index",
+        "chunking_mode",
+    )
+
     def __init__(
         self,
         text: str,
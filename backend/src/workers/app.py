@@ -1,10 +1,26 @@
 """Celery application configuration with Redis broker."""
 
+import asyncio
+
 from celery import Celery
 
 from backend.src.config.settings import get_settings
 
 
+def _install_uvloop() -> None:
+    """Use uvloop for event loops created inside worker tasks.
+
+    uvloop ships with uvicorn[standard]; fall back to the default asyncio
+    policy when it is unavailable (e.g. on Windows).
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def create_celery_app() -> Celery:
     """Create and configure the Celery application.
 
@@ -57,4 +73,5 @@ def create_celery_app() -> Celery:
 
 
 # Global Celery app instance
+_install_uvloop()
 celery_app = create_celery_app()
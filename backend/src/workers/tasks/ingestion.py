@@ -14,8 +14,12 @@ from backend.src.models.notification import NotificationStatus
 from backend.src.models.repository import AccessState
 from backend.src.services.git.operations import get_git_operations_service
 from backend.src.services.ingestion.artifact_writer import get_artifact_writer
-from backend.src.services.ingestion.discover import get_artifact_discovery
+from backend.src.services.ingestion.discover import (
+    DiscoveryResult,
+    get_artifact_discovery,
+)
 from backend.src.services.ingestion.embed import get_embed_service
+from backend.src.services.ingestion.file_filters import IndexAction, get_file_filter
 from backend.src.services.ingestion.index_writer import get_index_writer
 from backend.src.services.repository_service import (
     get_notification_service,
@@ -49,6 +53,72 @@ def batched(iterable: Iterable[T], n: int) -> Iterator[tuple[T, ...]]:
 logger = get_logger(__name__)
 
 
+def _stream_discovered_files(
+    repo_path: Path,
+    repository_id: str,
+    branch_id: str | None,
+    commit_sha: str | None,
+) -> dict[str, Any]:
+    """Discover files and hand them to the artifact writer and batch tasks.
+
+    Files are discovered lazily in batches sized for one concurrent round
+    of artifact writes, so the repository's full file list is never held
+    in memory. Each batch's artifacts are written before its files are
+    enqueued for chunk processing.
+
+    Args:
+        repo_path: Path to the checked-out repository.
+        repository_id: Repository UUID.
+        branch_id: Branch UUID; artifacts are only written when set.
+        commit_sha: Commit SHA for last_seen_commit.
+
+    Returns:
+        Discovery and artifact write counts plus any errors.
+    """
+    discovery = get_artifact_discovery()
+    artifact_writer = get_artifact_writer()
+    stats = DiscoveryResult()
+    counts: dict[str, Any] = {
+        "files_to_index": 0,
+        "files_catalog_only": 0,
+        "files_skipped": 0,
+        "artifacts_written": 0,
+        "meilisearch_indexed": 0,
+        "errors": [],
+    }
+
+    batch_size = artifact_writer.batch_size * artifact_writer.concurrency
+    for action, files in discovery.iter_batches(repo_path, batch_size, stats):
+        if branch_id:
+            artifact_result = artifact_writer.write_artifacts_sync(
+                files=files,
+                repository_id=repository_id,
+                branch_id=branch_id,
+                commit_sha=commit_sha,
+                mark_as_parsed=False,  # Will be marked after chunk processing
+            )
+            counts["artifacts_written"] += artifact_result.artifacts_written
+            counts["meilisearch_indexed"] += artifact_result.meilisearch_indexed
+            counts["errors"].extend(artifact_result.errors)
+
+        if action is not IndexAction.FULL_INDEX:
+            counts["files_catalog_only"] += len(files)
+            continue
+
+        for batch in batched(files, MAX_BATCH_SIZE):
+            ingest_repository_batch.delay(
+                repository_id=repository_id,
+                branch_id=branch_id or "",
+                file_paths=[f.relative_path for f in batch],
+                repo_base_path=str(repo_path),
+            )
+        counts["files_to_index"] += len(files)
+
+    counts["files_skipped"] = stats.files_skipped
+    counts["errors"].extend(stats.errors)
+    return counts
+
+
 @shared_task(
     bind=True,
     max_retries=3,
@@ -152,54 +222,29 @@ def process_notification(self, notification_id: str) -> dict[str, Any]:
             commit_sha=clone_result.commit_sha,
         )
 
-        # Discover files
-        discovery = get_artifact_discovery()
-        discovery_result = discovery.discover(repo_path)
+        # Discover files, write them to the artifacts index (DB + Meilisearch)
+        # and enqueue chunk processing, streaming batch by batch
+        discovered = _stream_discovered_files(
+            repo_path=repo_path,
+            repository_id=repository_id,
+            branch_id=branch_id,
+            commit_sha=clone_result.commit_sha,
+        )
+        result["files_indexed"] = discovered["files_to_index"]
+        if branch_id:
+            result["artifacts_written"] = discovered["artifacts_written"]
+        result["errors"].extend(discovered["errors"])
 
         logger.info(
             "Files discovered",
             repository_id=repository_id,
-            files_to_index=len(discovery_result.files_to_index),
-            files_catalog_only=len(discovery_result.files_catalog_only),
-            files_skipped=discovery_result.files_skipped,
+            files_to_index=discovered["files_to_index"],
+            files_catalog_only=discovered["files_catalog_only"],
+            files_skipped=discovered["files_skipped"],
+            artifacts_written=discovered["artifacts_written"],
+            meilisearch_indexed=discovered["meilisearch_indexed"],
         )
 
-        # Write all discovered files to artifacts index (DB + Meilisearch)
-        if branch_id:
-            all_discovered_files = (
-                discovery_result.files_to_index + discovery_result.files_catalog_only
-            )
-            if all_discovered_files:
-                artifact_writer = get_artifact_writer()
-                artifact_result = artifact_writer.write_artifacts_sync(
-                    files=all_discovered_files,
-                    repository_id=repository_id,
-                    branch_id=branch_id,
-                    commit_sha=clone_result.commit_sha,
-                    mark_as_parsed=False,  # Will be marked after chunk processing
-                )
-                result["artifacts_written"] = artifact_result.artifacts_written
-                if artifact_result.errors:
-                    result["errors"].extend(artifact_result.errors)
-
-                logger.info(
-                    "Artifacts written",
-                    repository_id=repository_id,
-                    artifacts_written=artifact_result.artifacts_written,
-                    meilisearch_indexed=artifact_result.meilisearch_indexed,
-                )
-
-        # Process files in batches
-        for batch in batched(discovery_result.files_to_index, MAX_BATCH_SIZE):
-            file_paths = [f.relative_path for f in batch]
-            ingest_repository_batch.delay(
-                repository_id=repository_id,
-                branch_id=branch_id or "",
-                file_paths=file_paths,
-                repo_base_path=str(repo_path),
-            )
-            result["files_indexed"] += len(file_paths)
-
         # Mark as done
         notification_service.update_status_sync(
             uuid.UUID(notification_id),
@@ -284,28 +329,24 @@ def ingest_repository_batch(
         embed_service = get_embed_service()
         base_path = Path(repo_base_path)
 
-        embedding_results = []
+        file_filter = get_file_filter()
+        file_infos = []
         for rel_path in file_paths:
             file_path = base_path / rel_path
             if not file_path.exists():
                 result["errors"].append(f"File not found: {rel_path}")
                 continue
+            file_infos.append(file_filter.analyze_file(file_path, rel_path))
 
-            # Create minimal FileInfo
-            from backend.src.services.ingestion.file_filters import FileFilter
-
-            file_filter = FileFilter()
-            file_info = file_filter.analyze_file(file_path, rel_path)
-
-            # Process file
-            embed_result = embed_service.process_file(
-                file_info=file_info,
-                repository_id=repository_id,
-                branch_id=branch_id,
-            )
-
+        # Chunk and embed across the embed service's worker pools
+        embedding_results = []
+        for embed_result in embed_service.process_files(
+            file_infos, repository_id, branch_id
+        ):
             if embed_result.error:
-                result["errors"].append(f"{rel_path}: {embed_result.error}")
+                result["errors"].append(
+                    f"{embed_result.file_path}: {embed_result.error}"
+                )
             else:
                 embedding_results.append(embed_result)
                 result["files_processed"] += 1
@@ -440,43 +481,24 @@ def full_reindex_repository(
             commit_sha=clone_result.commit_sha,
         )
 
-        # Discover files to index
-        discovery = get_artifact_discovery()
-        discovery_result = discovery.discover(repo_path, branch=branch.name)
-        result["files_discovered"] = len(discovery_result.files_to_index)
-
-        # Write all discovered files to artifacts index (DB + Meilisearch)
-        all_discovered_files = (
-            discovery_result.files_to_index + discovery_result.files_catalog_only
+        # Discover files, write them to the artifacts index (DB + Meilisearch)
+        # and enqueue chunk processing, streaming batch by batch
+        discovered = _stream_discovered_files(
+            repo_path=repo_path,
+            repository_id=repository_id,
+            branch_id=branch_id,
+            commit_sha=clone_result.commit_sha,
         )
-        if all_discovered_files:
-            artifact_result = artifact_writer.write_artifacts_sync(
-                files=all_discovered_files,
-                repository_id=repository_id,
-                branch_id=branch_id,
-                commit_sha=clone_result.commit_sha,
-                mark_as_parsed=False,
-            )
-            result["artifacts_written"] = artifact_result.artifacts_written
-            if artifact_result.errors:
-                result["errors"].extend(artifact_result.errors)
-
-            logger.info(
-                "Artifacts written during reindex",
-                repository_id=repository_id,
-                artifacts_written=artifact_result.artifacts_written,
-            )
+        result["files_discovered"] = discovered["files_to_index"]
+        result["files_indexed"] = discovered["files_to_index"]
+        result["artifacts_written"] = discovered["artifacts_written"]
+        result["errors"].extend(discovered["errors"])
 
-        # Process files in batches
-        for batch in batched(discovery_result.files_to_index, MAX_BATCH_SIZE):
-            file_paths = [f.relative_path for f in batch]
-            ingest_repository_batch.delay(
-                repository_id=repository_id,
-                branch_id=branch_id,
-                file_paths=file_paths,
-                repo_base_path=str(repo_path),
-            )
-            result["files_indexed"] += len(file_paths)
+        logger.info(
+            "Artifacts written during reindex",
+            repository_id=repository_id,
+            artifacts_written=discovered["artifacts_written"],
+        )
 
         logger.info(
             "Full reindex complete",
@@ -0,0 +1,463 @@
+"""Unit tests for the artifact writer."""
+
+import uuid
+from contextlib import asynccontextmanager, contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.dml import Delete, Update
+
+from backend.src.models.artifact import FileType, ParseStatus
+from backend.src.services.ingestion import artifact_writer
+from backend.src.services.ingestion.artifact_writer import (
+    ArtifactWriter,
+    _build_records,
+)
+from backend.src.services.ingestion.file_filters import (
+    FileCategory,
+    FileInfo,
+    IndexAction,
+)
+
+REPO_ID = str(uuid.uuid4())
+BRANCH_ID = str(uuid.uuid4())
+
+
+def _make_files(count: int) -> list[FileInfo]:
+    return [
+        FileInfo(
+            path=Path(f"/repo/src/file_{i}.py"),
+            relative_path=f"src/file_{i}.py",
+            size_bytes=100 + i,
+            extension=".py",
+            category=FileCategory.CODE,
+            action=IndexAction.FULL_INDEX,
+        )
+        for i in range(count)
+    ]
+
+
+def _make_writer(client: MagicMock, batch_size: int = 2) -> ArtifactWriter:
+    writer = ArtifactWriter(client=client)
+    writer.batch_size = batch_size
+    writer.concurrency = 2
+    return writer
+
+
+def _upsert_len(session: MagicMock, records: list[dict]) -> int:
+    return len(records)
+
+
+class TestBuildRecords:
+    """Tests for building DB records and Meilisearch documents."""
+
+    def test_build_records_uses_deterministic_ids(self) -> None:
+        """Should derive IDs from repository, branch and path."""
+        indexed_at = datetime.now(UTC)
+        files = _make_files(1)
+        files.append(
+            FileInfo(
+                path=Path("/repo/README.md"),
+                relative_path="README.md",
+                size_bytes=10,
+                extension=".md",
+                category=FileCategory.DOCUMENTATION,
+                action=IndexAction.CATALOG_ONLY,
+            )
+        )
+
+        db_records, docs = _build_records(
+            files,
+            uuid.UUID(REPO_ID),
+            uuid.UUID(BRANCH_ID),
+            REPO_ID,
+            BRANCH_ID,
+            "abc123",
+            indexed_at,
+            False,
+        )
+
+        expected_id = uuid.uuid5(
+            uuid.NAMESPACE_DNS, f"{REPO_ID}:{BRANCH_ID}:src/file_0.py"
+        )
+        assert db_records[0]["id"] == expected_id
+        assert docs[0]["id"] == str(expected_id)
+        assert db_records[0]["file_type"] == FileType.CODE
+        assert db_records[0]["last_indexed_at"] == indexed_at
+        assert docs[0]["last_indexed_at"] == indexed_at.isoformat()
+        assert db_records[1]["file_type"] == FileType.DOC
+        assert db_records[1]["parse_status"] == ParseStatus.SKIPPED
+        assert db_records[1]["has_line_map"] is False
+        assert docs[1]["last_indexed_at"] is None
+        assert docs[1]["parse_status"] == "skipped"
+
+
+@pytest.fixture
+def client() -> MagicMock:
+    """Meilisearch client mock recording add_documents_sync batches."""
+    return MagicMock()
+
+
+class TestMeilisearchBatching:
+    """Tests for batched Meilisearch writes."""
+
+    async def test_write_artifacts_sends_all_batches(self, client: MagicMock) -> None:
+        """Should split documents into batches and index all of them."""
+        writer = _make_writer(client)
+
+        with patch.object(writer, "_upsert_to_db", side_effect=len) as upsert:
+            result = await writer.write_artifacts(_make_files(5), REPO_ID, BRANCH_ID)
+
+        sizes = [len(c.args[1]) for c in client.add_documents_sync.call_args_list]
+        assert sorted(sizes) == [1, 2, 2]
+        # DB records are streamed per batch rather than built up front
+        assert sorted(len(c.args[0]) for c in upsert.await_args_list) == [1, 2, 2]
+        assert result.db_upserted == 5
+        assert result.meilisearch_indexed == 5
+        assert result.artifacts_failed == 0
+        assert result.errors == []
+
+    async def test_write_artifacts_tallies_failed_batches(
+        self, client: MagicMock
+    ) -> None:
+        """Should count a failing batch without dropping the others."""
+
+        def add_documents(index_name: str, documents: list[dict]) -> str:
+            if documents[0]["path"] == "src/file_2.py":
+                raise RuntimeError("boom")
+            return "1"
+
+        client.add_documents_sync.side_effect = add_documents
+        writer = _make_writer(client)
+
+        with patch.object(writer, "_upsert_to_db", side_effect=len):
+            result = await writer.write_artifacts(_make_files(5), REPO_ID, BRANCH_ID)
+
+        assert result.meilisearch_indexed == 3
+        assert result.artifacts_failed == 2
+        assert result.errors == ["Meilisearch batch write failed: boom"]
+
+    async def test_write_artifacts_skips_upsert_of_failed_batch(
+        self, client: MagicMock
+    ) -> None:
+        """Should only upsert DB rows for batches Meilisearch accepted."""
+
+        def add_documents(index_name: str, documents: list[dict]) -> str:
+            if documents[0]["path"] == "src/file_2.py":
+                raise RuntimeError("boom")
+            return "1"
+
+        client.add_documents_sync.side_effect = add_documents
+        writer = _make_writer(client)
+
+        with patch.object(writer, "_upsert_to_db", side_effect=len) as upsert:
+            result = await writer.write_artifacts(_make_files(5), REPO_ID, BRANCH_ID)
+
+        upserted = sorted(r["path"] for c in upsert.await_args_list for r in c.args[0])
+        assert upserted == ["src/file_0.py", "src/file_1.py", "src/file_4.py"]
+        assert result.db_upserted == 3
+        assert result.artifacts_written == 3
+
+    def test_write_artifacts_sync_sends_all_batches(self, client: MagicMock) -> None:
+        """Should index every document from the worker code path."""
+        session = MagicMock()
+
+        @contextmanager
+        def session_context():
+            yield session
+
+        writer = _make_writer(client)
+        with (
+            patch.object(artifact_writer, "get_sync_session_context", session_context),
+            patch.object(
+                writer, "_upsert_to_db_sync", side_effect=_upsert_len
+            ) as upsert,
+        ):
+            result = writer.write_artifacts_sync(_make_files(5), REPO_ID, BRANCH_ID)
+
+        paths = sorted(
+            doc["path"]
+            for c in client.add_documents_sync.call_args_list
+            for doc in c.args[1]
+        )
+        assert paths == sorted(f.relative_path for f in _make_files(5))
+        assert result.meilisearch_indexed == 5
+        assert result.artifacts_written == 5
+        # Every batch shares the one session, committed once by its context
+        assert upsert.call_count == 3
+        assert {id(c.args[0]) for c in upsert.call_args_list} == {id(session)}
+
+
+class TestDeleteBranchArtifacts:
+    """Tests for deleting a branch's artifacts."""
+
+    def test_delete_branch_artifacts_sync_issues_single_delete(
+        self, client: MagicMock
+    ) -> None:
+        """Should remove DB rows with one DELETE rather than loading them."""
+        client.delete_documents_by_filter_sync.return_value = 3
+        session = MagicMock()
+        session.execute.return_value.rowcount = 3
+
+        @contextmanager
+        def session_context():
+            yield session
+
+        writer = _make_writer(client)
+        with patch(
+            "backend.src.services.ingestion.artifact_writer.get_sync_session_context",
+            session_context,
+        ):
+            deleted = writer.delete_branch_artifacts_sync(REPO_ID, BRANCH_ID)
+
+        assert deleted == 3
+        session.execute.assert_called_once()
+        stmt = session.execute.call_args.args[0]
+        assert isinstance(stmt, Delete)
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("DELETE FROM artifacts WHERE")
+        session.delete.assert_not_called()
+
+
+class TestMarkArtifactsParsed:
+    """Tests for marking artifacts as parsed."""
+
+    async def test_mark_artifacts_parsed_bulk_updates_in_chunks(
+        self, client: MagicMock
+    ) -> None:
+        """Should issue one UPDATE per chunk of paths and sum the rowcounts."""
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=MagicMock(rowcount=2))
+
+        @asynccontextmanager
+        async def session_context():
+            yield session
+
+        writer = _make_writer(client)
+        paths = [f"src/file_{i}.py" for i in range(5)]
+        with (
+            patch.object(artifact_writer, "get_session_context", session_context),
+            patch.object(artifact_writer, "MARK_PARSED_CHUNK_SIZE", 2),
+        ):
+            updated = await writer.mark_artifacts_parsed(REPO_ID, BRANCH_ID, paths)
+
+        assert updated == 6
+        assert session.execute.await_count == 3
+        for call in session.execute.await_args_list:
+            assert isinstance(call.args[0], Update)
+
+
+class TestUpsertToDb:
+    """Tests for chunked artifact upserts."""
+
+    def test_upsert_to_db_sync_chunks_statements(self, client: MagicMock) -> None:
+        """Should split large upserts into several statements in one savepoint."""
+        session = MagicMock()
+        session.execute.side_effect = lambda stmt, params: MagicMock(
+            all=MagicMock(return_value=[(r["id"],) for r in params])
+        )
+
+        records = [{"id": uuid.uuid4(), "path": f"p{i}"} for i in range(5)]
+        writer = _make_writer(client)
+        with patch.object(artifact_writer, "UPSERT_CHUNK_SIZE", 2):
+            upserted = writer._upsert_to_db_sync(session, records)
+
+        assert upserted == 5
+        assert session.execute.call_count == 3
+        # One cached statement executed with a parameter list per chunk
+        stmts = {id(c.args[0]) for c in session.execute.call_args_list}
+        assert stmts == {id(artifact_writer._UPSERT_STMT)}
+        assert [c.args[1] for c in session.execute.call_args_list] == [
+            records[0:2],
+            records[2:4],
+            records[4:5],
+        ]
+        session.begin_nested.assert_called_once()
+        session.commit.assert_not_called()
+
+    def test_upsert_to_db_sync_counts_returned_rows(self, client: MagicMock) -> None:
+        """Should report the rows RETURNING yields, not the records sent."""
+        session = MagicMock()
+        session.execute.return_value.all.return_value = [(uuid.uuid4(),)]
+
+        records = [{"id": uuid.uuid4(), "path": f"p{i}"} for i in range(3)]
+        upserted = _make_writer(client)._upsert_to_db_sync(session, records)
+
+        assert upserted == 1
+
+    def test_upsert_stmt_returns_ids(self) -> None:
+        """Should compile to an upsert with RETURNING id."""
+        sql = str(artifact_writer._UPSERT_STMT.compile(dialect=postgresql.dialect()))
+
+        assert "ON CONFLICT (id) DO UPDATE" in sql
+        assert sql.rstrip().endswith("RETURNING artifacts.id")
+
+
+class TestSkipUnchanged:
+    """Tests for skipping artifacts already written at the current commit."""
+
+    def test_write_artifacts_sync_skips_paths_at_same_commit(
+        self, client: MagicMock
+    ) -> None:
+        """Should only write files not already stored at this commit."""
+        session = MagicMock()
+        session.execute.return_value.scalars.return_value = iter(
+            ["src/file_0.py", "src/file_1.py"]
+        )
+
+        @contextmanager
+        def session_context():
+            yield session
+
+        writer = _make_writer(client, batch_size=10)
+        with (
+            patch.object(artifact_writer, "get_sync_session_context", session_context),
+            patch.object(
+                writer, "_upsert_to_db_sync", side_effect=_upsert_len
+            ) as upsert,
+        ):
+            result = writer.write_artifacts_sync(
+                _make_files(3), REPO_ID, BRANCH_ID, commit_sha="abc123"
+            )
+
+        written = [r["path"] for r in upsert.call_args.args[1]]
+        assert written == ["src/file_2.py"]
+        assert result.artifacts_unchanged == 2
+        assert result.meilisearch_indexed == 1
+
+    def test_unchanged_lookup_binds_only_batch_paths(self) -> None:
+        """Should look up the batch's own paths, chunked, not the whole branch."""
+        files = _make_files(3)
+
+        with patch.object(artifact_writer, "UNCHANGED_LOOKUP_CHUNK_SIZE", 2):
+            stmts = list(
+                artifact_writer._paths_at_commit_stmts(
+                    files, uuid.UUID(REPO_ID), uuid.UUID(BRANCH_ID), "abc123"
+                )
+            )
+
+        bound = [
+            stmt.compile(dialect=postgresql.dialect()).params["path_1"]
+            for stmt in stmts
+        ]
+        assert bound == [["src/file_0.py", "src/file_1.py"], ["src/file_2.py"]]
+
+    def test_write_artifacts_sync_retries_failed_batch_at_same_commit(
+        self, client: MagicMock
+    ) -> None:
+        """Should rewrite a batch Meilisearch rejected when retried."""
+        stored: set[str] = set()
+
+        def upsert(session: MagicMock, records: list[dict]) -> int:
+            stored.update(r["path"] for r in records)
+            return len(records)
+
+        def reject_first_batch(index_name: str, documents: list[dict]) -> str:
+            if documents[0]["path"] == "src/file_0.py":
+                raise RuntimeError("boom")
+            return "1"
+
+        session = MagicMock()
+        session.execute.side_effect = lambda *_: MagicMock(
+            scalars=lambda: iter(sorted(stored))
+        )
+
+        @contextmanager
+        def session_context():
+            yield session
+
+        writer = _make_writer(client)
+        files = _make_files(4)
+        with (
+            patch.object(artifact_writer, "get_sync_session_context", session_context),
+            patch.object(writer, "_upsert_to_db_sync", side_effect=upsert),
+        ):
+            client.add_documents_sync.side_effect = reject_first_batch
+            first = writer.write_artifacts_sync(
+                files, REPO_ID, BRANCH_ID, commit_sha="abc123"
+            )
+            client.add_documents_sync.side_effect = None
+            client.add_documents_sync.reset_mock()
+            second = writer.write_artifacts_sync(
+                files, REPO_ID, BRANCH_ID, commit_sha="abc123"
+            )
+
+        assert first.artifacts_failed == 2
+        assert first.db_upserted == 2
+        # The rejected batch was not recorded at this commit, so it is retried
+        assert second.artifacts_unchanged == 2
+        retried = [
+            doc["path"]
+            for c in client.add_documents_sync.call_args_list
+            for doc in c.args[1]
+        ]
+        assert sorted(retried) == ["src/file_0.py", "src/file_1.py"]
+        assert stored == {f.relative_path for f in files}
+
+    def test_write_artifacts_sync_writes_all_when_lookup_fails(
+        self, client: MagicMock
+    ) -> None:
+        """Should fall back to writing everything if the lookup errors."""
+        session = MagicMock()
+        session.execute.side_effect = RuntimeError("db down")
+
+        @contextmanager
+        def session_context():
+            yield session
+
+        writer = _make_writer(client, batch_size=10)
+        with (
+            patch.object(artifact_writer, "get_sync_session_context", session_context),
+            patch.object(writer, "_upsert_to_db_sync", side_effect=_upsert_len),
+        ):
+            result = writer.write_artifacts_sync(
+                _make_files(3), REPO_ID, BRANCH_ID, commit_sha="abc123"
+            )
+
+        assert result.artifacts_unchanged == 0
+        assert result.db_upserted == 3
+
+    def test_write_artifacts_sync_reports_commit_failure(
+        self, client: MagicMock
+    ) -> None:
+        """Should report nothing upserted when the final commit fails."""
+
+        @contextmanager
+        def session_context():
+            yield MagicMock()
+            raise RuntimeError("commit failed")
+
+        writer = _make_writer(client, batch_size=10)
+        with (
+            patch.object(artifact_writer, "get_sync_session_context", session_context),
+            patch.object(writer, "_upsert_to_db_sync", side_effect=_upsert_len),
+        ):
+            result = writer.write_artifacts_sync(_make_files(3), REPO_ID, BRANCH_ID)
+
+        assert result.db_upserted == 0
+        assert result.artifacts_written == 0
+        # Meilisearch kept the documents; the divergence is reported
+        assert result.meilisearch_indexed == 3
+        assert result.errors == [
+            "DB commit failed; 3 documents indexed in Meilisearch have no "
+            "DB rows: commit failed"
+        ]
+
+    def test_write_artifacts_sync_raises_non_commit_failures(
+        self, client: MagicMock
+    ) -> None:
+        """Should not report errors raised before the commit as commit failures."""
+        session_context = MagicMock()
+        session_context.return_value.__enter__.side_effect = RuntimeError(
+            "connection refused"
+        )
+
+        writer = _make_writer(client, batch_size=10)
+        with (
+            patch.object(artifact_writer, "get_sync_session_context", session_context),
+            pytest.raises(RuntimeError, match="connection refused"),
+        ):
+            writer.write_artifacts_sync(_make_files(3), REPO_ID, BRANCH_ID)
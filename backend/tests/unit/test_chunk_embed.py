@@ -11,6 +11,7 @@ from backend.src.services.search.chunk_embed import (
     ChunkingService,
     _calculate_line_numbers,
     _chunk_with_token_chunker,
+    _newline_offsets,
     chunk_code_file,
     chunk_text,
     get_language_from_extension,
@@ -122,6 +123,21 @@ class TestLineNumberCalculation:
         assert start == 1
         assert end == 1
 
+    def test_calculate_line_numbers_with_precomputed_offsets(self) -> None:
+        """Should match counting newlines in slices for every offset pair."""
+        content = "a\n\nbc\nd\n"
+        offsets = _newline_offsets(content)
+        assert offsets == [1, 2, 5, 7]
+
+        for start in range(len(content) + 2):
+            for end in range(start, len(content) + 2):
+                expected_start = content[:start].count("\n") + 1
+                expected_end = expected_start + content[start:end].count("\n")
+                assert _calculate_line_numbers(content, start, end, offsets) == (
+                    expected_start,
+                    expected_end,
+                )
+
 
 class TestChunkResult:
     """Tests for ChunkResult dataclass."""
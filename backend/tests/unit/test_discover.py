@@ -0,0 +1,195 @@
+"""Unit tests for artifact discovery."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from backend.src.services.ingestion.discover import (
+    PARALLEL_STAT_MIN_FILES,
+    ArtifactDiscovery,
+    DiscoveryResult,
+)
+from backend.src.services.ingestion.file_filters import FileFilter, IndexAction
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """Create a small repository tree with code, docs and skipped content."""
+    root = tmp_path / "repo"
+    (root / "src" / "pkg").mkdir(parents=True)
+    (root / "docs").mkdir()
+    (root / "node_modules" / "dep").mkdir(parents=True)
+    (root / "assets").mkdir()
+
+    (root / "README.md").write_text("# Repo\n")
+    (root / "src" / "main.py").write_text("print('hi')\n")
+    (root / "src" / "pkg" / "util.py").write_text("def f():\n    pass\n")
+    (root / "docs" / "guide.md").write_text("guide\n")
+    (root / "data.unknownext").write_text("x" * 10)
+    (root / "node_modules" / "dep" / "index.js").write_text("module.exports = 1\n")
+    (root / "assets" / "logo.png").write_bytes(b"\x89PNG\x00\x00")
+    return root
+
+
+@pytest.fixture
+def discovery() -> ArtifactDiscovery:
+    """Discovery service with the default filter."""
+    return ArtifactDiscovery(file_filter=FileFilter(), batch_size=2)
+
+
+class TestArtifactDiscovery:
+    """Tests for ArtifactDiscovery.discover."""
+
+    def test_discover_categorizes_files(
+        self, discovery: ArtifactDiscovery, repo: Path
+    ) -> None:
+        """Should find indexable files with repo-relative paths."""
+        result = discovery.discover(repo)
+
+        assert sorted(f.relative_path for f in result.files_to_index) == sorted(
+            [
+                "README.md",
+                os.path.join("docs", "guide.md"),
+                os.path.join("src", "main.py"),
+                os.path.join("src", "pkg", "util.py"),
+            ]
+        )
+        assert [f.relative_path for f in result.files_catalog_only] == [
+            "data.unknownext"
+        ]
+        assert result.files_skipped == 1
+        assert result.directories_skipped == 1
+        assert result.errors == []
+
+    def test_discover_reports_sizes_and_absolute_paths(
+        self, discovery: ArtifactDiscovery, repo: Path
+    ) -> None:
+        """Should record file sizes and absolute paths for each file."""
+        result = discovery.discover(repo)
+
+        by_path = {f.relative_path: f for f in result.files_to_index}
+        main = by_path[os.path.join("src", "main.py")]
+        assert main.path == repo / "src" / "main.py"
+        assert main.size_bytes == len("print('hi')\n")
+        assert result.total_size_bytes == sum(
+            p.stat().st_size
+            for p in repo.rglob("*")
+            if p.is_file() and "node_modules" not in p.parts
+        )
+
+    def test_parallel_walk_matches_sequential(self, repo: Path) -> None:
+        """Should find the same files whether subtrees run on threads or not."""
+        sequential = ArtifactDiscovery(file_filter=FileFilter(), max_workers=1)
+        parallel = ArtifactDiscovery(file_filter=FileFilter(), max_workers=4)
+
+        seq_result = sequential.discover(repo)
+        par_result = parallel.discover(repo)
+
+        assert par_result.files_to_index == seq_result.files_to_index
+        assert par_result.files_catalog_only == seq_result.files_catalog_only
+        assert par_result.files_skipped == seq_result.files_skipped
+        assert par_result.directories_skipped == seq_result.directories_skipped
+        assert par_result.total_size_bytes == seq_result.total_size_bytes
+
+    def test_parallel_stat_matches_inline(self, tmp_path: Path) -> None:
+        """Should size files the same when a large directory is stat()ed on threads."""
+        root = tmp_path / "flat"
+        root.mkdir()
+        for i in range(PARALLEL_STAT_MIN_FILES + 5):
+            (root / f"f{i}.py").write_text("x" * i)
+
+        inline = ArtifactDiscovery(file_filter=FileFilter(), max_workers=1)
+        parallel = ArtifactDiscovery(file_filter=FileFilter(), max_workers=4)
+
+        inline_result = inline.discover(root)
+        parallel_result = parallel.discover(root)
+
+        assert parallel._stat_executor is not None
+        assert inline._stat_executor is None
+        assert parallel_result.files_to_index == inline_result.files_to_index
+        assert parallel_result.total_size_bytes == sum(
+            range(PARALLEL_STAT_MIN_FILES + 5)
+        )
+
+    def test_discover_keeps_files_named_like_skipped_directories(
+        self, discovery: ArtifactDiscovery, tmp_path: Path
+    ) -> None:
+        """Should catalog files named build/env; only a .git file is skipped."""
+        root = tmp_path / "repo"
+        root.mkdir()
+        for name in ("build", "env", "main.py"):
+            (root / name).write_text("x\n")
+        (root / ".git").write_text("gitdir: /elsewhere/.git/worktrees/repo\n")
+
+        result = discovery.discover(root)
+
+        paths = {
+            f.relative_path for f in result.files_to_index + result.files_catalog_only
+        }
+        assert paths == {"build", "env", "main.py"}
+        assert result.files_skipped == 1
+
+    def test_discover_missing_path(
+        self, discovery: ArtifactDiscovery, tmp_path: Path
+    ) -> None:
+        """Should report an error for a missing repository path."""
+        result = discovery.discover(tmp_path / "missing")
+
+        assert result.files_to_index == []
+        assert len(result.errors) == 1
+
+
+class TestIterBatches:
+    """Tests for lazy batch discovery."""
+
+    def test_iter_batches_groups_by_action(
+        self, discovery: ArtifactDiscovery, repo: Path
+    ) -> None:
+        """Should yield full batches per action and flush the remainders."""
+        stats = DiscoveryResult()
+
+        batches = list(discovery.iter_batches(repo, stats=stats))
+
+        full_index = [b for a, b in batches if a == IndexAction.FULL_INDEX]
+        catalog_only = [b for a, b in batches if a == IndexAction.CATALOG_ONLY]
+        assert [len(b) for b in full_index] == [2, 2]
+        assert [[f.relative_path for f in b] for b in catalog_only] == [
+            ["data.unknownext"]
+        ]
+        assert stats.files_skipped == 1
+        assert stats.directories_skipped == 1
+        assert stats.files_to_index == []
+
+    def test_parallel_iter_files_matches_sequential(self, repo: Path) -> None:
+        """Should yield the same files and stats with or without the pool."""
+        sequential = ArtifactDiscovery(file_filter=FileFilter(), max_workers=1)
+        parallel = ArtifactDiscovery(file_filter=FileFilter(), max_workers=4)
+        seq_stats = DiscoveryResult()
+        par_stats = DiscoveryResult()
+
+        seq_files = list(sequential.iter_files(repo, seq_stats))
+        par_files = list(parallel.iter_files(repo, par_stats))
+
+        assert sorted(par_files, key=lambda f: f.relative_path) == sorted(
+            seq_files, key=lambda f: f.relative_path
+        )
+        assert par_stats == seq_stats
+        # Scans are yielded in submission order, so the order is repeatable
+        assert list(parallel.iter_files(repo)) == par_files
+
+    def test_iter_batches_matches_discover(
+        self, discovery: ArtifactDiscovery, repo: Path
+    ) -> None:
+        """Should yield the same files that discover() collects."""
+        result = discovery.discover(repo)
+
+        streamed = [
+            f.relative_path
+            for _, batch in discovery.iter_batches(repo, batch_size=100)
+            for f in batch
+        ]
+
+        assert sorted(streamed) == sorted(
+            f.relative_path for f in result.files_to_index + result.files_catalog_only
+        )
@@ -0,0 +1,494 @@
+"""Unit tests for the ingestion embed service."""
+
+import asyncio
+import hashlib
+import os
+import pickle
+import uuid
+from array import array
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.src.services.ingestion import embed
+from backend.src.services.ingestion.embed import (
+    EmbeddedChunk,
+    EmbeddingResult,
+    EmbedService,
+    _byte_offsets,
+    _content_hash,
+    quantize_int8,
+)
+from backend.src.services.ingestion.file_filters import (
+    FileCategory,
+    FileInfo,
+    IndexAction,
+)
+from backend.src.services.search.chunk_embed import Chunk
+
+REPO_ID = "test-repo-id"
+BRANCH_ID = "test-branch-id"
+
+
+@pytest.fixture
+def embedding_client() -> MagicMock:
+    """Embedding client with embeddings disabled."""
+    client = MagicMock()
+    client.enabled = False
+    return client
+
+
+@pytest.fixture
+def files(tmp_path: Path) -> list[FileInfo]:
+    """A few small Python files on disk."""
+    infos = []
+    for i in range(3):
+        path = tmp_path / f"mod_{i}.py"
+        path.write_text(f"def func_{i}():\n    return {i}\n")
+        infos.append(
+            FileInfo(
+                path=path,
+                relative_path=path.name,
+                size_bytes=path.stat().st_size,
+                extension=".py",
+                category=FileCategory.CODE,
+                action=IndexAction.FULL_INDEX,
+            )
+        )
+    return infos
+
+
+class TestProcessFiles:
+    """Tests for EmbedService.process_files."""
+
+    def test_process_files_runs_inline_with_one_worker(
+        self, embedding_client: MagicMock, files: list[FileInfo]
+    ) -> None:
+        """Should call process_file in order without starting a pool."""
+        service = EmbedService(embedding_client=embedding_client, max_workers=1)
+
+        with patch.object(
+            service,
+            "process_file",
+            side_effect=lambda f, *_: EmbeddingResult(file_path=f.relative_path),
+        ):
+            results = service.process_files(files, REPO_ID, BRANCH_ID)
+
+        assert [r.file_path for r in results] == [f.relative_path for f in files]
+        assert service._process_pool is None
+
+    def test_process_files_matches_inline_in_worker_processes(
+        self, embedding_client: MagicMock, files: list[FileInfo]
+    ) -> None:
+        """Should produce the same chunks in worker processes as inline."""
+        service = EmbedService(embedding_client=embedding_client, max_workers=2)
+        expected = [service.process_file(f, REPO_ID, BRANCH_ID) for f in files]
+
+        # Workers build their own service; keep their embeddings disabled too
+        with patch.object(embed, "get_embedding_client", return_value=embedding_client):
+            try:
+                results = service.process_files(files, REPO_ID, BRANCH_ID)
+                assert service._process_pool is not None
+            finally:
+                service.close()
+
+        assert [r.file_path for r in results] == [r.file_path for r in expected]
+        assert [[c.id for c in r.chunks] for r in results] == [
+            [c.id for c in r.chunks] for r in expected
+        ]
+        assert all(r.error is None for r in results)
+
+    def test_process_files_uses_threads_in_daemonic_worker(
+        self, embedding_client: MagicMock, files: list[FileInfo]
+    ) -> None:
+        """Should chunk on threads where child processes are not allowed."""
+        service = EmbedService(embedding_client=embedding_client, max_workers=2)
+        expected = [service.process_file(f, REPO_ID, BRANCH_ID) for f in files]
+
+        with patch.object(
+            embed.multiprocessing,
+            "current_process",
+            return_value=MagicMock(daemon=True),
+        ):
+            try:
+                results = service.process_files(files, REPO_ID, BRANCH_ID)
+                assert service._thread_pool is not None
+                assert service._process_pool is None
+            finally:
+                service.close()
+
+        assert [[c.id for c in r.chunks] for r in results] == [
+            [c.id for c in r.chunks] for r in expected
+        ]
+        assert all(r.error is None for r in results)
+
+
+class TestResultTypes:
+    """Tests for the result containers passed between processes."""
+
+    def test_results_use_slots_and_pickle(self) -> None:
+        """Should carry no per-instance __dict__ and survive pickling."""
+        chunk = EmbeddedChunk(
+            id="id",
+            content="x = 1",
+            embedding=None,
+            file_path="a.py",
+            line_start=1,
+            line_end=1,
+            token_count=3,
+            chunk_index=0,
+            content_hash="0" * 16,
+        )
+        result = EmbeddingResult(file_path="a.py", chunks=[chunk], total_tokens=3)
+
+        assert not hasattr(chunk, "__dict__")
+        assert not hasattr(result, "__dict__")
+        assert pickle.loads(pickle.dumps(result)) == result
+
+
+class TestEmbedAcrossFiles:
+    """Tests for embedding chunks of many files in shared batches."""
+
+    @pytest.fixture
+    def enabled_client(self) -> MagicMock:
+        """Embedding client returning one vector per text, [len(text)]."""
+        client = MagicMock()
+        client.enabled = True
+        client.batch_size = 2
+        client.embed_batch = AsyncMock(
+            side_effect=lambda texts: [[float(len(t))] for t in texts]
+        )
+        return client
+
+    def test_process_files_batches_chunks_across_files(
+        self, enabled_client: MagicMock, files: list[FileInfo]
+    ) -> None:
+        """Should send provider-sized batches spanning files, not one per file."""
+        service = EmbedService(embedding_client=enabled_client, max_workers=1)
+
+        results = service.process_files(files, REPO_ID, BRANCH_ID)
+
+        chunks = [c for r in results for c in r.chunks]
+        assert len(chunks) == 3
+        assert enabled_client.embed_batch.await_count == 2
+        sent = [
+            t
+            for call in enabled_client.embed_batch.await_args_list
+            for t in call.args[0]
+        ]
+        assert sent == [c.content for c in chunks]
+        assert all(c.embedding == array("f", [len(c.content)]) for c in chunks)
+        assert all(c.embedding.typecode == "f" for c in chunks)
+
+    def test_failed_batch_leaves_chunks_without_embeddings(
+        self, enabled_client: MagicMock, files: list[FileInfo]
+    ) -> None:
+        """Should keep chunks from a failed batch and embed the rest."""
+        calls = 0
+
+        async def embed_batch(texts: list[str]) -> list[list[float]]:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("provider down")
+            return [[1.0] for _ in texts]
+
+        enabled_client.embed_batch = AsyncMock(side_effect=embed_batch)
+        service = EmbedService(embedding_client=enabled_client, max_workers=1)
+
+        results = service.process_files(files, REPO_ID, BRANCH_ID)
+
+        embeddings = [c.embedding for r in results for c in r.chunks]
+        assert embeddings.count(None) == 2
+        assert embeddings.count(array("f", [1.0])) == 1
+        assert all(r.error is None for r in results)
+
+
+class TestQuantization:
+    """Tests for int8 embedding quantization."""
+
+    def test_round_trip_is_close(self) -> None:
+        """Should reconstruct each value to within half a quantization step."""
+        vector = [0.5, -0.25, 0.125, -1.0, 0.0, 0.3333]
+
+        quantized, scale = quantize_int8(vector)
+
+        assert quantized.typecode == "b"
+        assert max(map(abs, quantized)) == 127
+        restored = [q * scale for q in quantized]
+        assert all(
+            abs(a - b) <= scale / 2 + 1e-9
+            for a, b in zip(vector, restored, strict=True)
+        )
+
+    def test_zero_vector(self) -> None:
+        """Should quantize an all-zero vector without dividing by zero."""
+        quantized, scale = quantize_int8([0.0, 0.0])
+
+        assert quantized == array("b", [0, 0])
+        assert scale == 1.0
+
+    def test_process_files_stores_int8_when_enabled(
+        self, embedding_client: MagicMock, files: list[FileInfo]
+    ) -> None:
+        """Should keep int8 vectors and a scale on chunks when quantizing."""
+        embedding_client.enabled = True
+        embedding_client.batch_size = 10
+        embedding_client.embed_batch = AsyncMock(
+            side_effect=lambda texts: [[0.5, -1.0] for _ in texts]
+        )
+        service = EmbedService(embedding_client=embedding_client, max_workers=1)
+        service.quantize = True
+
+        results = service.process_files(files, REPO_ID, BRANCH_ID)
+
+        chunks = [c for r in results for c in r.chunks]
+        assert chunks
+        for chunk in chunks:
+            assert chunk.embedding == array("b", [64, -127])
+            assert chunk.embedding_scale == pytest.approx(1.0 / 127)
+
+
+class TestChunkCache:
+    """Tests for reusing chunker output across unchanged files."""
+
+    @pytest.fixture
+    def chunking_service(self) -> MagicMock:
+        """Chunking service returning one chunk covering the content."""
+        service = MagicMock()
+        service.chunk_text = MagicMock(
+            side_effect=lambda content, **_: [
+                Chunk(
+                    text=content,
+                    token_count=1,
+                    line_start=1,
+                    line_end=1,
+                    start_index=0,
+                    end_index=len(content),
+                )
+            ]
+        )
+        return service
+
+    def test_unchanged_content_skips_chunker(
+        self,
+        chunking_service: MagicMock,
+        embedding_client: MagicMock,
+        files: list[FileInfo],
+    ) -> None:
+        """Should chunk identical content once and reuse the result."""
+        service = EmbedService(
+            chunking_service=chunking_service,
+            embedding_client=embedding_client,
+            max_workers=1,
+        )
+
+        first = service.process_file(files[0], REPO_ID, BRANCH_ID)
+        second = service.process_file(files[0], REPO_ID, BRANCH_ID)
+
+        assert chunking_service.chunk_text.call_count == 1
+        assert [c.content_hash for c in first.chunks] == [
+            c.content_hash for c in second.chunks
+        ]
+
+    def test_evicts_least_recently_used(
+        self,
+        chunking_service: MagicMock,
+        embedding_client: MagicMock,
+        files: list[FileInfo],
+    ) -> None:
+        """Should keep at most chunk_cache_size entries."""
+        service = EmbedService(
+            chunking_service=chunking_service,
+            embedding_client=embedding_client,
+            max_workers=1,
+        )
+        service.chunk_cache_size = 2
+
+        for info in (files[0], files[1], files[2], files[0]):
+            service.process_file(info, REPO_ID, BRANCH_ID)
+
+        assert chunking_service.chunk_text.call_count == 4
+        assert len(service._chunk_cache) == 2
+
+    def test_disabled_cache_always_chunks(
+        self,
+        chunking_service: MagicMock,
+        embedding_client: MagicMock,
+        files: list[FileInfo],
+    ) -> None:
+        """Should call the chunker every time when the cache size is 0."""
+        service = EmbedService(
+            chunking_service=chunking_service,
+            embedding_client=embedding_client,
+            max_workers=1,
+        )
+        service.chunk_cache_size = 0
+
+        service.process_file(files[0], REPO_ID, BRANCH_ID)
+        service.process_file(files[0], REPO_ID, BRANCH_ID)
+
+        assert chunking_service.chunk_text.call_count == 2
+        assert not service._chunk_cache
+
+
+class TestEventLoop:
+    """Tests for the service's persistent event loop."""
+
+    def test_embedding_calls_share_one_loop(
+        self, embedding_client: MagicMock, files: list[FileInfo]
+    ) -> None:
+        """Should run every embedding request on the same event loop."""
+        loops = []
+
+        async def embed_batch(texts: list[str]) -> list[list[float]]:
+            loops.append(asyncio.get_running_loop())
+            return [[0.0] for _ in texts]
+
+        embedding_client.enabled = True
+        embedding_client.batch_size = 10
+        embedding_client.embed_batch = AsyncMock(side_effect=embed_batch)
+
+        with EmbedService(embedding_client=embedding_client, max_workers=1) as service:
+            service.process_file(files[0], REPO_ID, BRANCH_ID)
+            service.process_files(files[1:], REPO_ID, BRANCH_ID)
+            loop = service._loop
+
+        assert loops == [loop, loop]
+        assert loop is not None and loop.is_closed()
+        assert service._loop is None
+
+
+class TestReadFile:
+    """Tests for EmbedService._read_file."""
+
+    @pytest.fixture
+    def service(self, embedding_client: MagicMock) -> EmbedService:
+        """Embed service with embeddings disabled."""
+        return EmbedService(embedding_client=embedding_client, max_workers=1)
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("héllo\n".encode(), "héllo\n"),
+            ("héllo\n".encode("latin-1"), "héllo\n"),
+            (b"a\r\nb\rc\n", "a\nb\nc\n"),
+        ],
+    )
+    def test_read_file_matches_text_mode(
+        self, service: EmbedService, tmp_path: Path, raw: bytes, expected: str
+    ) -> None:
+        """Should decode like the text-mode reads it replaces."""
+        path = tmp_path / "f.txt"
+        path.write_bytes(raw)
+
+        assert service._read_file(path) == expected
+
+    @pytest.mark.parametrize("encoding", ["utf-8", "latin-1"])
+    def test_read_file_decodes_large_files_from_mmap(
+        self, service: EmbedService, tmp_path: Path, encoding: str
+    ) -> None:
+        """Should read files over the threshold via mmap with the same result."""
+        path = tmp_path / "big.txt"
+        path.write_bytes("héllo\r\nwörld\n".encode(encoding) * 100)
+
+        with (
+            patch.object(embed, "MMAP_READ_THRESHOLD", 16),
+            patch.object(embed.mmap, "mmap", wraps=embed.mmap.mmap) as mapped,
+        ):
+            content = service._read_file(path)
+
+        mapped.assert_called_once()
+        assert content == "héllo\nwörld\n" * 100
+
+    def test_read_file_missing(self, service: EmbedService, tmp_path: Path) -> None:
+        """Should return None for unreadable files."""
+        assert service._read_file(tmp_path / "missing.txt") is None
+
+
+class TestContentHash:
+    """Tests for chunk content hashing."""
+
+    @pytest.mark.parametrize(
+        ("content", "chunk"),
+        [
+            ("abc def ghi", Chunk("def", 1, start_index=4, end_index=7)),
+            ("abc def ghi", Chunk("def", 1)),
+            ("abc def ghi", Chunk("# ctx\ndef", 1, start_index=4, end_index=7)),
+            ("abc def ghi", Chunk("xyz", 1, start_index=4, end_index=7)),
+            ("héllo wörld", Chunk("wörld", 1, start_index=6, end_index=11)),
+            ("héllo wörld", Chunk("héllo", 1, start_index=0, end_index=5)),
+            ("héllo wörld", Chunk("wörld!", 1, start_index=6, end_index=12)),
+        ],
+    )
+    def test_content_hash_matches_text_hash(self, content: str, chunk: Chunk) -> None:
+        """Should equal the hash of the chunk text however it is computed."""
+        encoded = content.encode()
+        offsets = (
+            None if len(encoded) == len(content) else _byte_offsets(content, [chunk])
+        )
+
+        assert (
+            _content_hash(content, memoryview(encoded), offsets, chunk)
+            == hashlib.sha256(chunk.text.encode()).hexdigest()[:16]
+        )
+
+    def test_byte_offsets_for_multibyte_content(self) -> None:
+        """Should map character offsets to UTF-8 byte offsets."""
+        content = "aé€𝄞b"
+        chunks = [
+            Chunk(content[i:j], 1, start_index=i, end_index=j)
+            for i, j in [(0, 3), (2, 5)]
+        ]
+
+        offsets = _byte_offsets(content, chunks)
+
+        assert offsets == {i: len(content[:i].encode()) for i in (0, 2, 3, 5)}
+
+
+class TestChunkId:
+    """Tests for deterministic chunk IDs."""
+
+    def test_chunk_id_matches_full_hash(self, embedding_client: MagicMock) -> None:
+        """Should equal the UUID of sha256 over the full location string."""
+        service = EmbedService(embedding_client=embedding_client, max_workers=1)
+        repo_id = str(uuid.uuid4())
+        branch_id = str(uuid.uuid4())
+
+        for index in (0, 7, 123):
+            location = f"{repo_id}:{branch_id}:src/mod.py:{index}"
+            expected = str(
+                uuid.UUID(bytes=hashlib.sha256(location.encode()).digest()[:16])
+            )
+            assert (
+                service._generate_chunk_id(repo_id, branch_id, "src/mod.py", index)
+                == expected
+            )
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "posix_fadvise"), reason="posix_fadvise not available"
+)
+class TestPrefetchFiles:
+    """Tests for read-ahead hints before chunking."""
+
+    def test_process_files_prefetches_every_file(
+        self, embedding_client: MagicMock, files: list[FileInfo], tmp_path: Path
+    ) -> None:
+        """Should hint WILLNEED for each readable file and skip missing ones."""
+        missing = FileInfo(
+            path=tmp_path / "missing.py",
+            relative_path="missing.py",
+            size_bytes=0,
+            extension=".py",
+            category=FileCategory.CODE,
+            action=IndexAction.FULL_INDEX,
+        )
+        service = EmbedService(embedding_client=embedding_client, max_workers=1)
+
+        with patch.object(embed.os, "posix_fadvise") as fadvise:
+            service.process_files([*files, missing], REPO_ID, BRANCH_ID)
+
+        assert fadvise.call_count == len(files)
+        assert {c.args[3] for c in fadvise.call_args_list} == {os.POSIX_FADV_WILLNEED}
@@ -0,0 +1,54 @@
+"""Unit tests for the embeddings client."""
+
+import httpx
+import respx
+
+from backend.src.services.ai.embeddings import EmbeddingClient
+
+BASE_URL = "http://embeddings.test/v1"
+
+
+def _make_client() -> EmbeddingClient:
+    client = EmbeddingClient(base_url=BASE_URL, api_key="test-key", model="test")
+    client.enabled = True
+    return client
+
+
+class TestEmbeddingClient:
+    """Tests for EmbeddingClient.embed response handling."""
+
+    @respx.mock
+    async def test_embed_orders_results_by_index(self) -> None:
+        """Should place embeddings by their index, not response order."""
+        respx.post(f"{BASE_URL}/embeddings").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "data": [
+                        {"index": 2, "embedding": [2.0]},
+                        {"index": 0, "embedding": [0.0]},
+                        {"index": 1, "embedding": [1.0]},
+                    ],
+                    "model": "test",
+                    "usage": {"total_tokens": 3},
+                },
+            )
+        )
+
+        result = await _make_client().embed(["a", "b", "c"])
+
+        assert result.embeddings == [[0.0], [1.0], [2.0]]
+        assert result.total_tokens == 3
+
+    @respx.mock
+    async def test_embed_sends_auth_header(self) -> None:
+        """Should send the bearer token built at construction time."""
+        route = respx.post(f"{BASE_URL}/embeddings").mock(
+            return_value=httpx.Response(
+                200, json={"data": [{"index": 0, "embedding": [0.5]}]}
+            )
+        )
+
+        await _make_client().embed(["a"])
+
+        assert route.calls.last.request.headers["Authorization"] == "Bearer test-key"
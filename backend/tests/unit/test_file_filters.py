@@ -0,0 +1,131 @@
+"""Unit tests for file filtering."""
+
+from pathlib import Path
+
+import pytest
+
+from backend.src.services.ingestion.file_filters import (
+    FileCategory,
+    FileFilter,
+    IndexAction,
+    _path_suffix,
+    is_text_file,
+)
+
+
+class TestGetCategory:
+    """Tests for FileFilter.get_category."""
+
+    def test_get_category_is_case_insensitive(self) -> None:
+        """Should map extensions to categories regardless of case."""
+        file_filter = FileFilter()
+
+        assert file_filter.get_category(".py") == FileCategory.CODE
+        assert file_filter.get_category(".PY") == FileCategory.CODE
+        assert file_filter.get_category(".md") == FileCategory.DOCUMENTATION
+        assert file_filter.get_category(".png") == FileCategory.BINARY
+        assert file_filter.get_category(".unknownext") == FileCategory.UNKNOWN
+        assert file_filter.get_category("") == FileCategory.UNKNOWN
+
+    def test_get_category_prefers_code_over_other_sets(self) -> None:
+        """Should resolve extensions in several sets as code > doc > config > binary."""
+        file_filter = FileFilter(
+            code_extensions=frozenset({".a"}),
+            doc_extensions=frozenset({".a", ".b"}),
+            config_extensions=frozenset({".a", ".b", ".c"}),
+            binary_extensions=frozenset({".a", ".b", ".c", ".d"}),
+        )
+
+        assert file_filter.get_category(".a") == FileCategory.CODE
+        assert file_filter.get_category(".b") == FileCategory.DOCUMENTATION
+        assert file_filter.get_category(".c") == FileCategory.CONFIGURATION
+        assert file_filter.get_category(".d") == FileCategory.BINARY
+
+
+class TestAnalyzeFile:
+    """Tests for FileFilter.analyze_file."""
+
+    def test_analyze_file_actions(self) -> None:
+        """Should skip binaries and long paths, catalog large and unknown files."""
+        file_filter = FileFilter(catalog_threshold=100, max_path_length=20)
+
+        def action(relative_path: str, size_bytes: int = 10) -> IndexAction:
+            return file_filter.analyze_file(
+                Path("/repo") / relative_path, relative_path, size_bytes=size_bytes
+            ).action
+
+        assert action("src/main.py") == IndexAction.FULL_INDEX
+        assert action("README.md") == IndexAction.FULL_INDEX
+        assert action("logo.png") == IndexAction.SKIP
+        assert action("a/very/long/path/to/main.py") == IndexAction.SKIP
+        assert action("src/main.py", size_bytes=101) == IndexAction.CATALOG_ONLY
+        assert action("logo.png", size_bytes=101) == IndexAction.SKIP
+        assert action("data.unknownext") == IndexAction.CATALOG_ONLY
+
+    def test_analyze_file_reports_extension_and_category(self) -> None:
+        """Should keep the original extension case while categorizing."""
+        info = FileFilter().analyze_file(Path("/repo/Main.PY"), "Main.PY", size_bytes=5)
+
+        assert info.extension == ".PY"
+        assert info.category == FileCategory.CODE
+        assert info.size_bytes == 5
+
+    def test_analyze_file_accepts_string_paths(self, tmp_path: Path) -> None:
+        """Should stat string paths and still return a Path on FileInfo."""
+        path = tmp_path / "main.py"
+        path.write_text("print('hi')\n")
+
+        info = FileFilter().analyze_file(str(path), "main.py")
+
+        assert info.path == path
+        assert info.size_bytes == len("print('hi')\n")
+        assert info.extension == ".py"
+
+    def test_analyze_file_uses_given_file_name(self) -> None:
+        """Should take the extension from file_name when it is passed."""
+        info = FileFilter().analyze_file(
+            "/repo/src/app.ts", "src/app.ts", size_bytes=5, file_name="app.ts"
+        )
+
+        assert info.extension == ".ts"
+        assert info.category == FileCategory.CODE
+
+    @pytest.mark.parametrize(
+        "name",
+        ["main.py", "archive.tar.gz", ".bashrc", "file.", "Makefile", "..", "a.b."],
+    )
+    def test_path_suffix_matches_pathlib(self, name: str) -> None:
+        """Should extract the same extension as PurePath.suffix."""
+        assert _path_suffix(name) == Path(name).suffix
+
+
+class TestIsTextFile:
+    """Tests for the binary sniff."""
+
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            (b"print('hi')\n", True),
+            ("héllo".encode("latin-1"), True),
+            (b"", True),
+            (b"\x89PNG\r\n\x1a\n\x00\x00", False),
+        ],
+    )
+    def test_is_text_file(self, tmp_path: Path, data: bytes, expected: bool) -> None:
+        """Should treat files without null bytes as text."""
+        path = tmp_path / "f"
+        path.write_bytes(data)
+
+        assert is_text_file(path) is expected
+
+    def test_is_text_file_only_samples_the_head(self, tmp_path: Path) -> None:
+        """Should ignore null bytes past the sample size."""
+        path = tmp_path / "f"
+        path.write_bytes(b"a" * 16 + b"\x00")
+
+        assert is_text_file(path, sample_size=16) is True
+        assert is_text_file(path, sample_size=17) is False
+
+    def test_is_text_file_missing(self, tmp_path: Path) -> None:
+        """Should report unreadable files as not text."""
+        assert is_text_file(tmp_path / "missing") is False
@@ -0,0 +1,169 @@
+"""Unit tests for freshness and backlog metrics."""
+
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.src.models.notification import NotificationStatus
+from backend.src.services.observability import freshness_metrics
+from backend.src.services.observability.freshness_metrics import (
+    BacklogStatus,
+    FreshnessMetrics,
+    FreshnessStatus,
+    RepositoryMetrics,
+)
+
+
+def _session_returning(*results: Any) -> Any:
+    """Patch target yielding a session whose executes return results in order."""
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=list(results))
+
+    @asynccontextmanager
+    async def session_context() -> Any:
+        yield session
+
+    return session_context
+
+
+def _metrics(status: str, pending: int, processing: int = 0) -> RepositoryMetrics:
+    """Build repository metrics with the given freshness and backlog."""
+    return RepositoryMetrics(
+        repository_id=str(uuid.uuid4()),
+        repository_name="repo",
+        freshness=FreshnessStatus(status, None, None, 15),
+        backlog=BacklogStatus("healthy", pending, processing, 10, 50),
+        branches=[],
+    )
+
+
+class TestRepositoryMetrics:
+    """Tests for building metrics of a single repository."""
+
+    async def test_counts_backlog_per_branch(self) -> None:
+        """Should split notification counts by branch and total them."""
+        now = datetime.now(UTC)
+        main = SimpleNamespace(
+            id=uuid.uuid4(), name="main", is_default=True, last_indexed_at=now
+        )
+        dev = SimpleNamespace(
+            id=uuid.uuid4(),
+            name="dev",
+            is_default=False,
+            last_indexed_at=now - timedelta(days=1),
+        )
+        repo = SimpleNamespace(id=uuid.uuid4(), name="repo", branches=[main, dev])
+        repo_result = MagicMock()
+        repo_result.scalar_one_or_none.return_value = repo
+        counts = [
+            (dev.id, NotificationStatus.PENDING, 3),
+            (dev.id, NotificationStatus.PROCESSING, 1),
+            (None, NotificationStatus.PENDING, 2),
+        ]
+
+        with patch.object(
+            freshness_metrics,
+            "get_session_context",
+            _session_returning(repo_result, counts),
+        ):
+            metrics = await FreshnessMetrics(max_concurrent=1).get_repository_metrics(
+                str(repo.id)
+            )
+
+        assert metrics is not None
+        assert metrics.freshness.status == "fresh"
+        assert (metrics.backlog.pending_count, metrics.backlog.processing_count) == (
+            5,
+            1,
+        )
+        dev_metrics, main_metrics = metrics.branches
+        assert dev_metrics.freshness.status == "critical"
+        assert (
+            dev_metrics.backlog.pending_count,
+            dev_metrics.backlog.processing_count,
+        ) == (
+            3,
+            1,
+        )
+        assert main_metrics.backlog.pending_count == 0
+
+    async def test_missing_repository(self) -> None:
+        """Should return None for an unknown repository."""
+        repo_result = MagicMock()
+        repo_result.scalar_one_or_none.return_value = None
+
+        with patch.object(
+            freshness_metrics, "get_session_context", _session_returning(repo_result)
+        ):
+            metrics = await FreshnessMetrics(max_concurrent=1).get_repository_metrics(
+                str(uuid.uuid4())
+            )
+
+        assert metrics is None
+
+
+class TestMetricsSummary:
+    """Tests for aggregating metrics across repositories."""
+
+    async def test_fetches_concurrently_within_limit(self) -> None:
+        """Should overlap per-repository fetches without exceeding the limit."""
+        ids_result = MagicMock()
+        ids_result.scalars.return_value.all.return_value = [
+            uuid.uuid4() for _ in range(6)
+        ]
+        statuses = iter(["fresh", "fresh", "stale", "critical", "fresh", "stale"])
+        in_flight = 0
+        peak = 0
+
+        async def get_repository_metrics(repository_id: str) -> RepositoryMetrics:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _metrics(next(statuses), pending=5, processing=1)
+
+        service = FreshnessMetrics(max_concurrent=3)
+        with (
+            patch.object(
+                freshness_metrics, "get_session_context", _session_returning(ids_result)
+            ),
+            patch.object(service, "get_repository_metrics", get_repository_metrics),
+        ):
+            summary = await service.get_all_metrics_summary()
+
+        assert peak == 3
+        assert summary == {
+            "total_repositories": 6,
+            "repositories_fresh": 3,
+            "repositories_stale": 2,
+            "repositories_critical": 1,
+            "total_pending_notifications": 30,
+            "total_processing_notifications": 6,
+            "backlog_status": "healthy",
+        }
+
+    async def test_skips_repositories_deleted_meanwhile(self) -> None:
+        """Should leave out repositories that vanished after the ID query."""
+        ids_result = MagicMock()
+        ids_result.scalars.return_value.all.return_value = [uuid.uuid4(), uuid.uuid4()]
+        service = FreshnessMetrics(max_concurrent=2)
+
+        with (
+            patch.object(
+                freshness_metrics, "get_session_context", _session_returning(ids_result)
+            ),
+            patch.object(
+                service,
+                "get_repository_metrics",
+                AsyncMock(side_effect=[_metrics("fresh", pending=1), None]),
+            ),
+        ):
+            summary = await service.get_all_metrics_summary()
+
+        assert summary["total_repositories"] == 1
+        assert summary["total_pending_notifications"] == 1
@@ -0,0 +1,132 @@
+"""Unit tests for the Meilisearch client wrapper."""
+
+import gzip
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
+
+import orjson
+
+from backend.src.services.search import index_client
+from backend.src.services.search.index_client import MeilisearchClient
+
+
+class TestAddDocuments:
+    """Tests for sending documents to Meilisearch."""
+
+    def test_add_documents_sync_posts_orjson_bytes(self) -> None:
+        """Should hand the SDK pre-encoded JSON instead of Python dicts."""
+        sdk_client = MagicMock()
+        index = sdk_client.index.return_value
+        index.add_documents_json.return_value.task_uid = 7
+        documents = [
+            {"id": str(uuid.uuid4()), "path": "src/a.py", "size_bytes": 10},
+            {"id": str(uuid.uuid4()), "path": "src/b.py", "size_bytes": 20},
+        ]
+
+        with patch.object(index_client, "get_client", return_value=sdk_client):
+            task_uid = MeilisearchClient().add_documents_sync("artifacts", documents)
+
+        assert task_uid == "7"
+        index.add_documents.assert_not_called()
+        body = index.add_documents_json.call_args.args[0]
+        assert isinstance(body, bytes)
+        assert orjson.loads(body) == documents
+
+    async def test_add_documents_serializes_uuid_and_datetime(self) -> None:
+        """Should accept UUID and datetime values without pre-conversion."""
+        sdk_client = MagicMock()
+        index = sdk_client.index.return_value
+        index.add_documents_json.return_value.task_uid = 1
+        doc_id = uuid.uuid4()
+        indexed_at = datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)
+
+        with patch.object(index_client, "get_client", return_value=sdk_client):
+            await MeilisearchClient().add_documents(
+                "chunks", [{"id": doc_id, "created_at": indexed_at}]
+            )
+
+        body = orjson.loads(index.add_documents_json.call_args.args[0])
+        assert body == [{"id": str(doc_id), "created_at": "2024-01-02T03:04:05+00:00"}]
+
+    def test_add_documents_raw_sync_posts_body_unchanged(self) -> None:
+        """Should pass an already-encoded body straight to the SDK."""
+        sdk_client = MagicMock()
+        index = sdk_client.index.return_value
+        index.add_documents_json.return_value.task_uid = 3
+        body = b'[{"id":"a"}]'
+
+        with patch.object(index_client, "get_client", return_value=sdk_client):
+            task_uid = MeilisearchClient().add_documents_raw_sync("chunks", body)
+
+        assert task_uid == "3"
+        index.add_documents_json.assert_called_once_with(body)
+
+    def test_gzip_compression_sets_content_encoding(self) -> None:
+        """Should gzip the body and label it when compression is enabled."""
+        sdk_client = MagicMock()
+        index = sdk_client.index.return_value
+        index.http.headers = {}
+        index.add_documents_json.return_value.task_uid = 4
+        body = b'[{"id":"a","content":"' + b"x" * 1000 + b'"}]'
+
+        with patch.object(index_client, "get_client", return_value=sdk_client):
+            client = MeilisearchClient()
+            client._compress = True
+            client.add_documents_raw_sync("chunks", body)
+
+        sent = index.add_documents_json.call_args.args[0]
+        assert len(sent) < len(body)
+        assert gzip.decompress(sent) == body
+        assert index.http.headers["Content-Encoding"] == "gzip"
+
+
+class TestConnectionPooling:
+    """Tests for reusing HTTP connections across requests."""
+
+    def test_index_requests_share_client_session(self) -> None:
+        """Should send index requests through the client's session."""
+        client = index_client._PooledClient("http://meili:7700", None, pool_size=4)
+        response = MagicMock(status_code=202)
+        response.json.return_value = {
+            "taskUid": 5,
+            "indexUid": "grepzilla_chunks",
+            "status": "enqueued",
+            "type": "documentAdditionOrUpdate",
+            "enqueuedAt": "2024-01-02T03:04:05.000000Z",
+        }
+
+        with patch.object(client._session, "request", return_value=response) as request:
+            task_uid = index_client._send_documents_json(
+                client.index("grepzilla_chunks"), b"[]"
+            )
+
+        assert task_uid == "5"
+        method, url = request.call_args.args
+        assert method == "POST"
+        assert url == "http://meili:7700/indexes/grepzilla_chunks/documents"
+        assert request.call_args.kwargs["data"] == b"[]"
+
+    def test_pool_sized_for_write_concurrency(self) -> None:
+        """Should keep one connection per concurrent write alive."""
+        client = index_client._PooledClient("http://meili:7700", None, pool_size=4)
+
+        adapter = client._session.get_adapter("http://meili:7700")
+
+        assert adapter._pool_maxsize == 4
+
+
+class TestFilterQuoting:
+    """Tests for building Meilisearch filter expressions."""
+
+    def test_branch_filter(self) -> None:
+        """Should match both the repository and branch IDs."""
+        assert (
+            index_client.branch_filter("repo", "main")
+            == "repository_id = 'repo' AND branch_id = 'main'"
+        )
+
+    def test_quote_filter_value_escapes_quotes_and_backslashes(self) -> None:
+        """Should keep quotes and backslashes inside the quoted string."""
+        assert index_client.quote_filter_value("it's") == "'it\\'s'"
+        assert index_client.quote_filter_value("a\\") == "'a\\\\'"
@@ -0,0 +1,373 @@
+"""Unit tests for the Meilisearch index writer."""
+
+import asyncio
+import pickle
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
+import pytest
+
+from backend.src.services.ingestion import index_writer
+from backend.src.services.ingestion.embed import EmbeddedChunk, EmbeddingResult
+from backend.src.services.ingestion.index_writer import (
+    IndexWriter,
+    _categorize_extension,
+    _estimate_chunk_bytes,
+    _iter_size_limited_batches,
+    _prepare_encoded_batch,
+)
+
+REPO_ID = "repo-id"
+BRANCH_ID = "branch-id"
+
+
+def _chunk(index: int, embedding: array | None = None) -> EmbeddedChunk:
+    """Build a chunk of src/app.py."""
+    return EmbeddedChunk(
+        id=f"chunk-{index}",
+        content=f"line {index}",
+        embedding=embedding,
+        file_path="src/app.py",
+        line_start=index + 1,
+        line_end=index + 1,
+        token_count=2,
+        chunk_index=index,
+        content_hash=f"{index:016x}",
+        start_index=0 if embedding is not None else None,
+        end_index=6 if embedding is not None else None,
+        language="python" if embedding is not None else None,
+    )
+
+
+@pytest.fixture
+def client() -> MagicMock:
+    """Meilisearch client accepting raw JSON bodies."""
+    client = MagicMock()
+    client.add_documents_raw = AsyncMock(return_value="1")
+    client.add_documents_raw_sync = MagicMock(return_value="1")
+    return client
+
+
+class TestWriteBatch:
+    """Tests for serializing batches of documents."""
+
+    def test_sync_write_sends_encoded_documents(self, client: MagicMock) -> None:
+        """Should post one JSON body with optional fields only when set."""
+        writer = IndexWriter(client=client, index_name="chunks")
+        results = [
+            EmbeddingResult(
+                file_path="src/app.py",
+                chunks=[_chunk(0, array("f", [0.5, -0.25])), _chunk(1)],
+            )
+        ]
+
+        write_result = writer.write_embedding_results_sync(
+            results, REPO_ID, "repo", BRANCH_ID, "main"
+        )
+
+        assert write_result.documents_indexed == 2
+        index_name, body = client.add_documents_raw_sync.call_args.args
+        assert index_name == "chunks"
+        with_vector, without_vector = orjson.loads(body)
+        assert with_vector["path"] == "src/app.py"
+        assert with_vector["file_type"] == without_vector["file_type"] == "code"
+        assert with_vector["_vectors"] == {"default": [0.5, -0.25]}
+        assert with_vector["start_index"] == 0
+        assert with_vector["language"] == "python"
+        assert "_vectors" not in without_vector
+        assert "start_index" not in without_vector
+        assert "language" not in without_vector
+        assert "indexed_at" not in with_vector
+        assert "embedding_scale" not in with_vector
+
+    def test_int8_vectors_are_sent_unscaled(self, client: MagicMock) -> None:
+        """Should send int8 values as integers with the scale alongside."""
+        writer = IndexWriter(client=client, index_name="chunks")
+        chunk = _chunk(0, array("b", [64, -127]))
+        chunk.embedding_scale = 0.5 / 64
+        results = [EmbeddingResult(file_path="src/app.py", chunks=[chunk])]
+
+        writer.write_embedding_results_sync(results, REPO_ID, "repo", BRANCH_ID, "main")
+
+        body = client.add_documents_raw_sync.call_args.args[1]
+        assert b'"default":[64,-127]' in body
+        (document,) = orjson.loads(body)
+        assert document["embedding_scale"] == 0.5 / 64
+
+    async def test_async_write_sends_encoded_documents(self, client: MagicMock) -> None:
+        """Should post the same encoding from the async path."""
+        writer = IndexWriter(client=client, index_name="chunks")
+        results = [EmbeddingResult(file_path="src/app.py", chunks=[_chunk(0)])]
+
+        write_result = await writer.write_embedding_results(
+            results, REPO_ID, "repo", BRANCH_ID, "main"
+        )
+
+        assert write_result.documents_indexed == 1
+        body = client.add_documents_raw.await_args.args[1]
+        assert [doc["id"] for doc in orjson.loads(body)] == ["chunk-0"]
+
+    def test_failed_results_are_skipped(self, client: MagicMock) -> None:
+        """Should report files that failed embedding and index the rest."""
+        writer = IndexWriter(client=client, index_name="chunks")
+        results = [
+            EmbeddingResult(file_path="src/bad.py", error="Failed to read file"),
+            EmbeddingResult(file_path="src/app.py", chunks=[_chunk(0)]),
+        ]
+
+        write_result = writer.write_embedding_results_sync(
+            results, REPO_ID, "repo", BRANCH_ID, "main"
+        )
+
+        assert write_result.documents_indexed == 1
+        assert write_result.errors == ["Skipping src/bad.py: Failed to read file"]
+
+
+class TestStreamingWrites:
+    """Tests for building documents only as batches are sent."""
+
+    def test_sync_sends_batches_before_creating_all_documents(
+        self, client: MagicMock
+    ) -> None:
+        """Should send the first batch before later documents exist."""
+        writer = IndexWriter(client=client, index_name="chunks", max_batch_docs=2)
+        created = 0
+        chunk_document = index_writer._chunk_document
+
+        def counting_chunk_document(*args: Any) -> dict[str, Any]:
+            nonlocal created
+            created += 1
+            return chunk_document(*args)
+
+        created_at_send: list[int] = []
+        client.add_documents_raw_sync.side_effect = lambda *_: created_at_send.append(
+            created
+        )
+        chunks = [_chunk(i) for i in range(6)]
+
+        with patch.object(index_writer, "_chunk_document", counting_chunk_document):
+            write_result = writer.write_embedding_results_sync(
+                [EmbeddingResult(file_path="src/app.py", chunks=chunks)],
+                REPO_ID,
+                "repo",
+                BRANCH_ID,
+                "main",
+            )
+
+        assert write_result.documents_indexed == 6
+        assert created_at_send == [2, 4, 6]
+
+    async def test_async_reports_no_documents(self, client: MagicMock) -> None:
+        """Should send nothing when every result failed."""
+        writer = IndexWriter(client=client, index_name="chunks")
+
+        write_result = await writer.write_embedding_results(
+            [EmbeddingResult(file_path="src/bad.py", error="boom")],
+            REPO_ID,
+            "repo",
+            BRANCH_ID,
+            "main",
+        )
+
+        assert write_result.documents_indexed == 0
+        assert write_result.errors == ["Skipping src/bad.py: boom"]
+        client.add_documents_raw.assert_not_awaited()
+
+
+class TestConcurrentWrites:
+    """Tests for overlapping async batch uploads."""
+
+    async def test_batches_overlap_up_to_concurrency(self, client: MagicMock) -> None:
+        """Should keep several batches in flight without exceeding the limit."""
+        in_flight = 0
+        peak = 0
+
+        async def add_documents_raw(index_name: str, body: bytes) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "1"
+
+        client.add_documents_raw = AsyncMock(side_effect=add_documents_raw)
+        writer = IndexWriter(client=client, index_name="chunks", max_batch_docs=100)
+        writer.concurrency = 3
+        chunks = [_chunk(i) for i in range(1000)]
+
+        write_result = await writer.write_embedding_results(
+            [EmbeddingResult(file_path="src/app.py", chunks=chunks)],
+            REPO_ID,
+            "repo",
+            BRANCH_ID,
+            "main",
+        )
+
+        assert write_result.documents_indexed == 1000
+        assert client.add_documents_raw.await_count == 10
+        assert peak == 3
+
+    async def test_failed_batch_is_isolated(self, client: MagicMock) -> None:
+        """Should count a failed batch without stopping the others."""
+        calls = 0
+
+        async def add_documents_raw(index_name: str, body: bytes) -> str:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("meilisearch down")
+            return "1"
+
+        client.add_documents_raw = AsyncMock(side_effect=add_documents_raw)
+        writer = IndexWriter(client=client, index_name="chunks", max_batch_docs=100)
+        chunks = [_chunk(i) for i in range(250)]
+
+        write_result = await writer.write_embedding_results(
+            [EmbeddingResult(file_path="src/app.py", chunks=chunks)],
+            REPO_ID,
+            "repo",
+            BRANCH_ID,
+            "main",
+        )
+
+        assert write_result.documents_failed == 100
+        assert write_result.documents_indexed == 150
+        assert write_result.errors == ["Batch write failed: meilisearch down"]
+
+
+class TestSizeLimitedBatches:
+    """Tests for splitting chunks by count and document size."""
+
+    @pytest.fixture
+    def chunks(self) -> list[tuple[EmbeddedChunk, str]]:
+        """Chunks with and without embeddings."""
+        return [
+            (_chunk(i, array("f", [0.0] * 1536) if i % 2 else None), "code")
+            for i in range(6)
+        ]
+
+    def test_caps_document_count(self, chunks: list[tuple[EmbeddedChunk, str]]) -> None:
+        """Should start a new batch once max_docs is reached."""
+        batches = list(_iter_size_limited_batches(chunks, 10**9, 4))
+
+        assert [(start, len(batch)) for start, batch in batches] == [(0, 4), (4, 2)]
+
+    def test_caps_estimated_bytes(
+        self, chunks: list[tuple[EmbeddedChunk, str]]
+    ) -> None:
+        """Should flush before a chunk would push a batch over max_bytes."""
+        embedded = _estimate_chunk_bytes(chunks[1][0])
+        plain = _estimate_chunk_bytes(chunks[0][0])
+
+        batches = list(_iter_size_limited_batches(chunks, embedded + plain, 1000))
+
+        assert [(start, len(batch)) for start, batch in batches] == [
+            (0, 2),
+            (2, 2),
+            (4, 2),
+        ]
+        assert [item for _, batch in batches for item in batch] == chunks
+
+    def test_oversized_chunk_gets_own_batch(
+        self, chunks: list[tuple[EmbeddedChunk, str]]
+    ) -> None:
+        """Should still send a chunk larger than max_bytes."""
+        batches = list(_iter_size_limited_batches(chunks[1:2], 1, 1000))
+
+        assert batches == [(0, chunks[1:2])]
+
+    def test_estimate_tracks_encoded_size(self) -> None:
+        """Should estimate within a factor of two of the encoded document."""
+        for chunk in (_chunk(0), _chunk(1, array("f", [0.123456] * 1536))):
+            encoded = len(
+                _prepare_encoded_batch(
+                    [(chunk, "code")], REPO_ID, "repo", BRANCH_ID, "main"
+                )
+            )
+            assert encoded / 2 < _estimate_chunk_bytes(chunk) < encoded * 2
+
+
+class TestEncodePool:
+    """Tests for encoding batches in worker processes."""
+
+    async def test_large_batches_encode_in_pool(self, client: MagicMock) -> None:
+        """Should hand large batches to the pool and encode small ones inline."""
+        writer = IndexWriter(client=client, index_name="chunks", max_batch_docs=40)
+        writer.encode_processes = 2
+        chunks = [_chunk(i) for i in range(50)]
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            with (
+                patch.object(index_writer, "_get_encode_pool", return_value=pool),
+                patch.object(pool, "submit", wraps=pool.submit) as submit,
+            ):
+                write_result = await writer.write_embedding_results(
+                    [EmbeddingResult(file_path="src/app.py", chunks=chunks)],
+                    REPO_ID,
+                    "repo",
+                    BRANCH_ID,
+                    "main",
+                )
+
+        assert write_result.documents_indexed == 50
+        (call,) = submit.call_args_list
+        assert call.args[0] is _prepare_encoded_batch
+        assert len(call.args[1]) == 40
+        bodies = [c.args[1] for c in client.add_documents_raw.await_args_list]
+        assert sorted(len(orjson.loads(body)) for body in bodies) == [10, 40]
+
+    def test_encoded_batch_round_trips_through_pickle(self) -> None:
+        """Should accept batches that survived pickling to a worker."""
+        batch = [(_chunk(0, array("b", [1, -2])), "code")]
+        batch[0][0].embedding_scale = 0.25
+
+        body = _prepare_encoded_batch(
+            pickle.loads(pickle.dumps(batch)), REPO_ID, "repo", BRANCH_ID, "main"
+        )
+
+        (document,) = orjson.loads(body)
+        assert document["_vectors"] == {"default": [1, -2]}
+        assert document["embedding_scale"] == 0.25
+
+
+class TestGetIndexWriter:
+    """Tests for the per-index writer accessor."""
+
+    def test_one_writer_per_index(self, client: MagicMock) -> None:
+        """Should reuse a writer per index name and keep indexes apart."""
+        index_writer.get_index_writer.cache_clear()
+        try:
+            with patch.object(
+                index_writer, "get_meilisearch_client", return_value=client
+            ):
+                chunks = index_writer.get_index_writer()
+                artifacts = index_writer.get_index_writer("artifacts")
+
+                assert index_writer.get_index_writer() is chunks
+                assert chunks.index_name == "chunks"
+                assert artifacts.index_name == "artifacts"
+                assert artifacts.client is chunks.client
+        finally:
+            index_writer.get_index_writer.cache_clear()
+
+
+class TestCategorizeExtension:
+    """Tests for mapping extensions to document file types."""
+
+    @pytest.mark.parametrize(
+        ("extension", "expected"),
+        [
+            ("py", "code"),
+            ("TSX", "code"),
+            ("md", "documentation"),
+            ("yml", "configuration"),
+            ("png", "other"),
+            ("", "other"),
+        ],
+    )
+    def test_categorize_extension(self, extension: str, expected: str) -> None:
+        """Should match extensions case-insensitively and default to other."""
+        assert _categorize_extension(extension) == expected
@@ -0,0 +1,58 @@
+"""Unit tests for repository listing serializers."""
+
+from datetime import UTC, datetime
+
+from backend.src.api.schemas.repository import RepositoryListItem
+from backend.src.services.listing.serializers import serialize_repositories
+from backend.src.services.listing_service import (
+    BranchInfo,
+    FreshnessStatus,
+    RepositoryInfo,
+)
+
+
+def test_serialize_repositories_matches_validated_models() -> None:
+    """Should produce the same response as validating the fields."""
+    indexed_at = datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)
+    repo = RepositoryInfo(
+        id="repo-id",
+        name="repo",
+        default_branch="main",
+        freshness_status=FreshnessStatus.FRESH,
+        last_indexed_at=indexed_at,
+        backlog_size=2,
+        branches=[
+            BranchInfo("main", True, FreshnessStatus.FRESH, indexed_at, 0),
+            BranchInfo("dev", False, FreshnessStatus.STALE, None, 2),
+        ],
+    )
+
+    (item,) = serialize_repositories([repo])
+
+    expected = RepositoryListItem.model_validate(
+        {
+            "id": "repo-id",
+            "name": "repo",
+            "default_branch": "main",
+            "freshness_status": "fresh",
+            "last_indexed_at": "2024-01-02T03:04:05+00:00",
+            "backlog_size": 2,
+            "branches": [
+                {
+                    "name": "main",
+                    "is_default": True,
+                    "freshness_status": "fresh",
+                    "last_indexed_at": "2024-01-02T03:04:05+00:00",
+                    "backlog_size": 0,
+                },
+                {
+                    "name": "dev",
+                    "is_default": False,
+                    "freshness_status": "stale",
+                    "last_indexed_at": None,
+                    "backlog_size": 2,
+                },
+            ],
+        }
+    )
+    assert item.model_dump() == expected.model_dump()
@@ -0,0 +1,190 @@
+"""Unit tests for the repository listing service."""
+
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.src.models.repository import AccessState
+from backend.src.services import listing_service
+from backend.src.services.listing_service import FreshnessStatus, ListingService
+
+REPO_A = uuid.uuid4()
+REPO_B = uuid.uuid4()
+
+
+def _row(repo_id: uuid.UUID, name: str, **fields: Any) -> SimpleNamespace:
+    """Build a listing query row, without a branch unless one is given."""
+    row = {
+        "id": repo_id,
+        "name": name,
+        "default_branch": "main",
+        "access_state": AccessState.ACTIVE,
+        "repository_backlog": 0,
+        "repository_last_indexed_at": None,
+        "branch_name": None,
+        "is_default": None,
+        "branch_last_indexed_at": None,
+        "branch_backlog": 0,
+    }
+    row.update(fields)
+    return SimpleNamespace(**row)
+
+
+class TestListRepositories:
+    """Tests for loading repositories with branch status."""
+
+    def test_rows_grouped_into_repositories(self) -> None:
+        """Should stitch per-branch rows into one entry per repository."""
+        now = datetime.now(UTC)
+        rows = [
+            _row(
+                REPO_A,
+                "alpha",
+                repository_backlog=3,
+                repository_last_indexed_at=now,
+                branch_name="dev",
+                is_default=False,
+                branch_last_indexed_at=now - timedelta(hours=1),
+                branch_backlog=2,
+            ),
+            _row(
+                REPO_A,
+                "alpha",
+                repository_backlog=3,
+                repository_last_indexed_at=now,
+                branch_name="main",
+                is_default=True,
+                branch_last_indexed_at=now,
+            ),
+            _row(REPO_B, "beta"),
+        ]
+
+        alpha, beta = ListingService()._build_repositories(rows)
+
+        assert alpha.id == str(REPO_A)
+        assert alpha.backlog_size == 3
+        assert alpha.last_indexed_at == now
+        assert [b.name for b in alpha.branches] == ["dev", "main"]
+        assert [b.freshness_status for b in alpha.branches] == [
+            FreshnessStatus.INDEXING,
+            FreshnessStatus.FRESH,
+        ]
+        assert alpha.freshness_status == FreshnessStatus.INDEXING
+        assert beta.branches == []
+        assert beta.freshness_status == FreshnessStatus.UNKNOWN
+
+    async def test_single_query_round_trip(self) -> None:
+        """Should load every repository with one statement."""
+        result = MagicMock()
+        result.all.return_value = [_row(REPO_A, "alpha")]
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result)
+
+        @asynccontextmanager
+        async def session_context() -> Any:
+            yield session
+
+        with patch.object(listing_service, "get_session_context", session_context):
+            repositories = await ListingService().list_repositories([str(REPO_A)])
+
+        assert [r.name for r in repositories] == ["alpha"]
+        session.execute.assert_awaited_once()
+        (query,) = session.execute.await_args.args
+        assert "GROUP BY notifications.branch_id" in str(query)
+        assert "GROUP BY notifications.repository_id" in str(query)
+
+    async def test_missing_repository_returns_none(self) -> None:
+        """Should return None when the repository has no row."""
+        with patch.object(
+            ListingService, "_query_repositories", AsyncMock(return_value=[])
+        ) as query:
+            result = await ListingService().get_repository_with_branches(REPO_A)
+
+        assert result is None
+        query.assert_awaited_once_with([REPO_A])
+
+
+class TestListingCache:
+    """Tests for serving repeated listings from the in-process cache."""
+
+    async def test_repeat_listing_served_from_cache(self) -> None:
+        """Should query once per key until the entry expires."""
+        service = ListingService()
+        query = AsyncMock(return_value=[])
+
+        with (
+            patch.object(service, "_query_repositories", query),
+            patch.object(listing_service.time, "monotonic", return_value=100.0),
+        ):
+            await service.list_repositories([str(REPO_B), str(REPO_A)])
+            await service.list_repositories([str(REPO_A), str(REPO_B)])
+            await service.list_repositories()
+
+        assert query.await_count == 2
+
+    async def test_expired_entry_requeried(self) -> None:
+        """Should query again once the TTL has passed."""
+        service = ListingService()
+        service.cache_ttl = 5.0
+        query = AsyncMock(return_value=[])
+
+        with patch.object(service, "_query_repositories", query):
+            with patch.object(listing_service.time, "monotonic", return_value=100.0):
+                await service.list_repositories()
+            with patch.object(listing_service.time, "monotonic", return_value=105.0):
+                await service.list_repositories()
+
+        assert query.await_count == 2
+
+    async def test_concurrent_misses_share_one_query(self) -> None:
+        """Should let one caller refresh a key while the others wait."""
+        service = ListingService()
+        release = asyncio.Event()
+
+        async def slow_query(ids: Any) -> list[Any]:
+            await release.wait()
+            return []
+
+        query = AsyncMock(side_effect=slow_query)
+        with patch.object(service, "_query_repositories", query):
+            callers = [
+                asyncio.create_task(service.list_repositories()) for _ in range(5)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*callers)
+
+        assert query.await_count == 1
+        assert all(result is results[0] for result in results)
+
+    async def test_invalidate_drops_listings_with_repository(self) -> None:
+        """Should drop entries naming the repository and the all-repos entry."""
+        service = ListingService()
+        query = AsyncMock(return_value=[])
+
+        with patch.object(service, "_query_repositories", query):
+            await service.list_repositories()
+            await service.list_repositories([str(REPO_A)])
+            await service.list_repositories([str(REPO_B)])
+            service.invalidate(REPO_A)
+            await service.list_repositories()
+            await service.list_repositories([str(REPO_A)])
+            await service.list_repositories([str(REPO_B)])
+
+        assert query.await_count == 5
+
+    async def test_zero_ttl_disables_cache(self) -> None:
+        """Should query every time when the TTL is zero."""
+        service = ListingService()
+        service.cache_ttl = 0
+        query = AsyncMock(return_value=[])
+
+        with patch.object(service, "_query_repositories", query):
+            await service.list_repositories()
+            await service.list_repositories()
+
+        assert query.await_count == 2